@@ -1,83 +1,116 @@
 import logging
 from importlib import import_module
 
-from .github import get_tools as get_github, AlitaGitHubToolkit
-from .openapi import get_tools as get_openapi
-from .jira import get_tools as get_jira, JiraToolkit
-from .confluence import get_tools as get_confluence, ConfluenceToolkit
-from .gitlab import get_tools as get_gitlab, AlitaGitlabToolkit
-from .gitlab_org import get_tools as get_gitlab_org, AlitaGitlabSpaceToolkit
-from .zephyr import get_tools as get_zephyr, ZephyrToolkit
-from .browser import get_tools as get_browser, BrowserToolkit
-from .report_portal import get_tools as get_report_portal, ReportPortalToolkit
-from .bitbucket import get_tools as get_bitbucket, AlitaBitbucketToolkit
-from .testrail import get_tools as get_testrail, TestrailToolkit
-from .testio import get_tools as get_testio, TestIOToolkit
-from .xray import get_tools as get_xray_cloud, XrayToolkit
-from .sharepoint import get_tools as get_sharepoint, SharepointToolkit
-from .qtest import get_tools as get_qtest, QtestToolkit
-from .zephyr_scale import get_tools as get_zephyr_scale, ZephyrScaleToolkit
-from .ado import get_tools as get_ado
-from .ado.test_plan import AzureDevOpsPlansToolkit
-from .ado.work_item import AzureDevOpsWorkItemsToolkit
-from .ado.wiki import AzureDevOpsWikiToolkit
-from .rally import get_tools as get_rally, RallyToolkit
-from .sql import get_tools as get_sql, SQLToolkit
-from .code.sonar import get_tools as get_sonar, SonarToolkit
-from .google_places import get_tools as get_google_places, GooglePlacesToolkit
+logger = logging.getLogger(__name__)
 
+# Toolkit packages are imported lazily: a toolkit module is only loaded the
+# first time a tool of its type is requested, so `import alita_tools` stays cheap.
+# tool['type'] -> (module, get_tools function, pass tool type as first argument)
+_TOOLS_REGISTRY = {
+    'openapi': ('.openapi', 'get_tools', False),
+    'github': ('.github', 'get_tools', False),
+    'jira': ('.jira', 'get_tools', False),
+    'confluence': ('.confluence', 'get_tools', False),
+    'gitlab': ('.gitlab', 'get_tools', False),
+    'gitlab_org': ('.gitlab_org', 'get_tools', False),
+    'zephyr': ('.zephyr', 'get_tools', False),
+    'browser': ('.browser', 'get_tools', False),
+    'yagmail': ('.yagmail', 'get_tools', False),
+    'report_portal': ('.report_portal', 'get_tools', False),
+    'bitbucket': ('.bitbucket', 'get_tools', False),
+    'testrail': ('.testrail', 'get_tools', False),
+    'ado_boards': ('.ado', 'get_tools', True),
+    'ado_wiki': ('.ado', 'get_tools', True),
+    'ado_plans': ('.ado', 'get_tools', True),
+    'ado_repos': ('.ado', 'get_tools', True),
+    'testio': ('.testio', 'get_tools', False),
+    'xray_cloud': ('.xray', 'get_tools', False),
+    'sharepoint': ('.sharepoint', 'get_tools', False),
+    'qtest': ('.qtest', 'get_tools', False),
+    'zephyr_scale': ('.zephyr_scale', 'get_tools', False),
+    'rally': ('.rally', 'get_tools', False),
+    'sql': ('.sql', 'get_tools', False),
+    'sonar': ('.code.sonar', 'get_tools', False),
+    'google_places': ('.google_places', 'get_tools', False),
+}
 
-from .yagmail import get_tools as get_yagmail, AlitaYagmailToolkit
+# Toolkit class name -> module; order defines the order of get_toolkits()
+_TOOLKITS_REGISTRY = {
+    'AlitaGitHubToolkit': '.github',
+    'TestrailToolkit': '.testrail',
+    'JiraToolkit': '.jira',
+    'AzureDevOpsPlansToolkit': '.ado.test_plan',
+    'AzureDevOpsWikiToolkit': '.ado.wiki',
+    'AzureDevOpsWorkItemsToolkit': '.ado.work_item',
+    'RallyToolkit': '.rally',
+    'QtestToolkit': '.qtest',
+    'ReportPortalToolkit': '.report_portal',
+    'TestIOToolkit': '.testio',
+    'SQLToolkit': '.sql',
+    'SonarToolkit': '.code.sonar',
+    'GooglePlacesToolkit': '.google_places',
+    'BrowserToolkit': '.browser',
+    'XrayToolkit': '.xray',
+    'AlitaGitlabToolkit': '.gitlab',
+    'ConfluenceToolkit': '.confluence',
+    'AlitaBitbucketToolkit': '.bitbucket',
+    'AlitaGitlabSpaceToolkit': '.gitlab_org',
+    'ZephyrScaleToolkit': '.zephyr_scale',
+    'ZephyrToolkit': '.zephyr',
+    'AlitaYagmailToolkit': '.yagmail',
+    'SharepointToolkit': '.sharepoint',
+}
+
+# Public get_<toolkit> functions re-exported from the toolkit packages -> module
+_GET_TOOLS_REGISTRY = {
+    'get_github': '.github',
+    'get_openapi': '.openapi',
+    'get_jira': '.jira',
+    'get_confluence': '.confluence',
+    'get_gitlab': '.gitlab',
+    'get_gitlab_org': '.gitlab_org',
+    'get_zephyr': '.zephyr',
+    'get_browser': '.browser',
+    'get_report_portal': '.report_portal',
+    'get_bitbucket': '.bitbucket',
+    'get_testrail': '.testrail',
+    'get_testio': '.testio',
+    'get_xray_cloud': '.xray',
+    'get_sharepoint': '.sharepoint',
+    'get_qtest': '.qtest',
+    'get_zephyr_scale': '.zephyr_scale',
+    'get_ado': '.ado',
+    'get_rally': '.rally',
+    'get_sql': '.sql',
+    'get_sonar': '.code.sonar',
+    'get_google_places': '.google_places',
+    'get_yagmail': '.yagmail',
+}
+
+
+def _load(module_name: str, attr: str):
+    return getattr(import_module(module_name, __name__), attr)
+
+
+def __getattr__(name: str):
+    # keeps `from alita_tools import JiraToolkit, get_jira` working without eager imports
+    if name in _TOOLKITS_REGISTRY:
+        return _load(_TOOLKITS_REGISTRY[name], name)
+    if name in _GET_TOOLS_REGISTRY:
+        return _load(_GET_TOOLS_REGISTRY[name], 'get_tools')
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-logger = logging.getLogger(__name__)
 
 def get_tools(tools_list, *args, **kwargs):
     tools = []
     for tool in tools_list:
-        if tool['type'] == 'openapi':
-            tools.extend(get_openapi(tool))
-        elif tool['type'] == 'github':
-            tools.extend(get_github(tool))
-        elif tool['type'] == 'jira':
-            tools.extend(get_jira(tool))
-        elif tool['type'] == 'confluence':
-            tools.extend(get_confluence(tool))
-        elif tool['type'] == 'gitlab':
-            tools.extend(get_gitlab(tool))
-        elif tool['type'] == 'gitlab_org':
-            tools.extend(get_gitlab_org(tool))
-        elif tool['type'] == 'zephyr':
-            tools.extend(get_zephyr(tool))
-        elif tool['type'] == 'browser':
-            tools.extend(get_browser(tool))
-        elif tool['type'] == 'yagmail':
-            tools.extend(get_yagmail(tool))
-        elif tool['type'] == 'report_portal':
-            tools.extend(get_report_portal(tool))
-        elif tool['type'] == 'bitbucket':
-            tools.extend(get_bitbucket(tool))
-        elif tool['type'] == 'testrail':
-            tools.extend(get_testrail(tool))
-        elif tool['type'] in ['ado_boards', 'ado_wiki', 'ado_plans', 'ado_repos']:
-            tools.extend(get_ado(tool['type'], tool))
-        elif tool['type'] == 'testio':
-            tools.extend(get_testio(tool))
-        elif tool['type'] == 'xray_cloud':
-            tools.extend(get_xray_cloud(tool))
-        elif tool['type'] == 'sharepoint':
-            tools.extend(get_sharepoint(tool))
-        elif tool['type'] == 'qtest':
-            tools.extend(get_qtest(tool))
-        elif tool['type'] == 'zephyr_scale':
-            tools.extend(get_zephyr_scale(tool))
-        elif tool['type'] == 'rally':
-            tools.extend(get_rally(tool))
-        elif tool['type'] == 'sql':
-            tools.extend(get_sql(tool))
-        elif tool['type'] == 'sonar':
-            tools.extend(get_sonar(tool))
-        elif tool['type'] == 'google_places':
-            tools.extend(get_google_places(tool))
+        if tool['type'] in _TOOLS_REGISTRY:
+            module_name, attr, pass_type = _TOOLS_REGISTRY[tool['type']]
+            get_toolkit_tools = _load(module_name, attr)
+            if pass_type:
+                tools.extend(get_toolkit_tools(tool['type'], tool))
+            else:
+                tools.extend(get_toolkit_tools(tool))
         else:
             if tool.get("settings", {}).get("module"):
                 try:
@@ -90,30 +123,9 @@ def get_tools(tools_list, *args, **kwargs):
                     logger.error(f"Error in getting toolkit: {e}")
     return tools
 
+
 def get_toolkits():
     return [
-        AlitaGitHubToolkit.toolkit_config_schema(),
-        TestrailToolkit.toolkit_config_schema(),
-        JiraToolkit.toolkit_config_schema(),
-        AzureDevOpsPlansToolkit.toolkit_config_schema(),
-        AzureDevOpsWikiToolkit.toolkit_config_schema(),
-        AzureDevOpsWorkItemsToolkit.toolkit_config_schema(),
-        RallyToolkit.toolkit_config_schema(),
-        QtestToolkit.toolkit_config_schema(),
-        ReportPortalToolkit.toolkit_config_schema(),
-        TestIOToolkit.toolkit_config_schema(),
-        SQLToolkit.toolkit_config_schema(),
-        SonarToolkit.toolkit_config_schema(),
-        GooglePlacesToolkit.toolkit_config_schema(),
-        BrowserToolkit.toolkit_config_schema(),
-        XrayToolkit.toolkit_config_schema(),
-        AlitaGitlabToolkit.toolkit_config_schema(),
-        ConfluenceToolkit.toolkit_config_schema(),
-        AlitaBitbucketToolkit.toolkit_config_schema(),
-        AlitaGitlabSpaceToolkit.toolkit_config_schema(),
-        ZephyrScaleToolkit.toolkit_config_schema(),
-        ZephyrToolkit.toolkit_config_schema(),
-        AlitaYagmailToolkit.toolkit_config_schema(),
-        SharepointToolkit.toolkit_config_schema()
+        _load(module_name, class_name).toolkit_config_schema()
+        for class_name, module_name in _TOOLKITS_REGISTRY.items()
     ]
-
@@ -3,7 +3,7 @@ import logging
 import re
 from enum import Enum
 from json import dumps
-from typing import Any, List, Union, Optional
+from typing import List, Union, Optional
 
 from azure.devops.v7_0.git.git_client import GitClient
 from azure.devops.v7_0.git.models import (
@@ -19,8 +19,11 @@ from azure.devops.v7_0.git.models import (
 )
 from langchain_core.tools import ToolException
 from msrest.authentication import BasicAuthentication
-from pydantic import BaseModel, create_model, PrivateAttr, model_validator
+from pydantic import create_model, PrivateAttr, model_validator
 from pydantic.fields import FieldInfo
+from ...base.api_wrapper import BaseToolApiWrapper
+from ...base.blob_cache import blob_cache, blob_scope
+from ...base.client_cache import get_cached_client
 
 logger = logging.getLogger(__name__)
 
@@ -157,10 +160,11 @@ class ArgsSchema(Enum):
     )
 
 
-class ReposApiWrapper(BaseModel):
+class ReposApiWrapper(BaseToolApiWrapper):
     organization_url: Optional[str]
     project: Optional[str]
     repository_id: Optional[str]
+    token: Optional[str]
     base_branch: Optional[str]
     active_branch: Optional[str]
     _client: Optional[GitClient] = PrivateAttr()
@@ -168,15 +172,13 @@ class ReposApiWrapper(BaseModel):
     class Config:
         arbitrary_types_allowed = True
 
-    @model_validator(mode="before")
-    @classmethod
-    def validate_toolkit(cls, values):
-        project = values["project"]
-        organization_url = values["organization_url"]
-        repository_id = values["repository_id"]
-        base_branch = values["base_branch"]
-        active_branch = values["active_branch"]
-        credentials = BasicAuthentication("", values["token"])
+    @model_validator(mode="after")
+    def validate_toolkit(self):
+        project = self.project
+        organization_url = self.organization_url
+        repository_id = self.repository_id
+        base_branch = self.base_branch
+        active_branch = self.active_branch
 
         if not organization_url or not project or not repository_id:
             raise ToolException(
@@ -184,13 +186,16 @@ class ReposApiWrapper(BaseModel):
             )
 
         try:
-            cls._client = GitClient(base_url=organization_url, creds=credentials)
+            self._client = get_cached_client(
+                "ado_repos", organization_url, (self.token,),
+                lambda: GitClient(base_url=organization_url, creds=BasicAuthentication("", self.token))
+            )
         except Exception as e:
             raise ToolException(f"Failed to connect to Azure DevOps: {e}")
 
         def branch_exists(branch_name):
             try:
-                branch = cls._client.get_branch(
+                branch = self._client.get_branch(
                     repository_id=repository_id, name=branch_name, project=project
                 )
                 return branch is not None
@@ -202,7 +207,7 @@ class ReposApiWrapper(BaseModel):
         if active_branch and not branch_exists(active_branch):
             raise ToolException(f"The active branch '{active_branch}' does not exist.")
 
-        return values
+        return self
 
     def _get_files(
         self,
@@ -523,6 +528,9 @@ class ReposApiWrapper(BaseModel):
 
         return dumps(data)
 
+    def _blob_scope(self) -> str:
+        return blob_scope("ado", self.organization_url, f"{self.project}/{self.repository_id}", (self.token,))
+
     def get_file_content(self, commit_id, path):
         version_descriptor = GitVersionDescriptor(
             version=commit_id, version_type="commit"
@@ -670,6 +678,7 @@ class ReposApiWrapper(BaseModel):
             self._client.create_push(
                 push=push, repository_id=self.repository_id, project=self.project
             )
+            blob_cache.put(self._blob_scope(), self.active_branch, file_path, file_contents)
             return f"Created file {file_path}"
         except Exception as e:
             msg = f"Unable to create file due to error:\n{str(e)}"
@@ -688,7 +697,12 @@ class ReposApiWrapper(BaseModel):
         self.active_branch = (
             self.active_branch if self.active_branch else self.base_branch
         )
+        return self._read_file(file_path)
 
+    def _read_file(self, file_path: str, use_cache: bool = True) -> str:
+        cached = blob_cache.get(self._blob_scope(), self.active_branch, file_path) if use_cache else None
+        if cached is not None:
+            return cached[0]
         try:
             version_descriptor = GitVersionDescriptor(
                 version=self.active_branch, version_type="branch"
@@ -701,6 +715,7 @@ class ReposApiWrapper(BaseModel):
             )
             # Azure DevOps API returns a generator of bytes, it should be decoded
             decoded_content = "".join([chunk.decode("utf-8") for chunk in file_content])
+            blob_cache.put(self._blob_scope(), self.active_branch, file_path, decoded_content)
             return decoded_content
         except Exception as e:
             msg = (
@@ -738,7 +753,8 @@ class ReposApiWrapper(BaseModel):
                 "Please create a new branch and try again."
             )
         try:
-            file_content = self.read_file(file_path)
+            # a cached read may be outdated, the update is applied to the current content of the branch
+            file_content = self._read_file(file_path, use_cache=False)
 
             updated_file_content = file_content
             for old, new in self.extract_old_new_pairs(update_query):
@@ -771,6 +787,7 @@ class ReposApiWrapper(BaseModel):
             self._client.create_push(
                 push=push, repository_id=self.repository_id, project=self.project
             )
+            blob_cache.put(self._blob_scope(), self.active_branch, file_path, updated_file_content)
             return "Updated file " + file_path
         except Exception as e:
             msg = f"Unable to update file due to error:\n{str(e)}"
@@ -809,6 +826,7 @@ class ReposApiWrapper(BaseModel):
             self._client.create_push(
                 push=push, repository_id=self.repository_id, project=self.project
             )
+            blob_cache.invalidate(self._blob_scope(), branch_name, file_path)
             return "Deleted file " + file_path
         except Exception as e:
             msg = f"Unable to delete file due to error:\n{str(e)}"
@@ -995,10 +1013,3 @@ class ReposApiWrapper(BaseModel):
                 "args_schema": ArgsSchema.CreatePullRequest.value,
             },
         ]
-
-    def run(self, mode: str, *args: Any, **kwargs: Any):
-        """Run the tool based on the selected mode."""
-        for tool in self.get_available_tools():
-            if tool["name"] == mode:
-                return tool["ref"](*args, **kwargs)
-        raise ValueError(f"Unknown mode: {mode}")
@@ -1,6 +1,6 @@
 import json
 import logging
-from typing import Optional, Any
+from typing import Optional
 
 from azure.devops.connection import Connection
 from azure.devops.v7_0.test_plan.models import TestPlanCreateParams, TestSuiteCreateParams, \
@@ -8,8 +8,10 @@ from azure.devops.v7_0.test_plan.models import TestPlanCreateParams, TestSuiteCr
 from azure.devops.v7_0.test_plan.test_plan_client import TestPlanClient
 from langchain_core.tools import ToolException
 from msrest.authentication import BasicAuthentication
-from pydantic import create_model, PrivateAttr, BaseModel, model_validator
+from pydantic import create_model, PrivateAttr, model_validator
 from pydantic.fields import FieldInfo as Field
+from ...base.api_wrapper import BaseToolApiWrapper
+from ...base.client_cache import get_cached_client
 
 logger = logging.getLogger(__name__)
 
@@ -76,7 +78,7 @@ TestCasesGetModel = create_model(
     suite_id=(int, Field(description="ID of the test suite for which test cases are requested"))
 )
 
-class TestPlanApiWrapper(BaseModel):
+class TestPlanApiWrapper(BaseToolApiWrapper):
     organization_url: str
     token: str
     limit: Optional[int] = 5
@@ -85,15 +87,19 @@ class TestPlanApiWrapper(BaseModel):
     class Config:
         arbitrary_types_allowed = True
 
-    @model_validator(mode='before')
-    def validate_toolkit(cls, values):
+    @model_validator(mode='after')
+    def validate_toolkit(self):
         try:
-            credentials = BasicAuthentication('', values['token'])
-            connection = Connection(base_url=values['organization_url'], creds=credentials)
-            cls._client = connection.clients.get_test_plan_client()
+            # Clients are shared between wrappers with the same organization and Personal Access Token (PAT)
+            self._client = get_cached_client(
+                'ado_plans', self.organization_url, (self.token,),
+                lambda: Connection(
+                    base_url=self.organization_url, creds=BasicAuthentication('', self.token)
+                ).clients.get_test_plan_client()
+            )
         except Exception as e:
             raise ImportError(f"Failed to connect to Azure DevOps: {e}")
-        return values
+        return self
 
     def create_test_plan(self, test_plan_create_params: str, project: str):
         """Create a test plan in Azure DevOps."""
@@ -252,10 +258,3 @@ class TestPlanApiWrapper(BaseModel):
                 "ref": self.get_test_cases,
             }
         ]
-
-    def run(self, mode: str, *args: Any, **kwargs: Any):
-        """Run the tool based on the selected mode."""
-        for tool in self.get_available_tools():
-            if tool["name"] == mode:
-                return tool["ref"](*args, **kwargs)
-        raise ValueError(f"Unknown mode: {mode}")
\ No newline at end of file
@@ -1,13 +1,15 @@
 import logging
-from typing import Optional, Any
+from typing import Optional
 
 from azure.devops.connection import Connection
 from azure.devops.v7_0.wiki import WikiClient, WikiPageCreateOrUpdateParameters, WikiCreateParametersV2
-from pydantic import model_validator, BaseModel
+from pydantic import model_validator
 from langchain_core.tools import ToolException
 from msrest.authentication import BasicAuthentication
 from pydantic import create_model, PrivateAttr
 from pydantic.fields import FieldInfo as Field
+from ...base.api_wrapper import BaseToolApiWrapper
+from ...base.client_cache import get_cached_client
 
 logger = logging.getLogger(__name__)
 
@@ -36,7 +38,7 @@ ModifyPageInput = create_model(
 )
 
 
-class AzureDevOpsApiWrapper(BaseModel):
+class AzureDevOpsApiWrapper(BaseToolApiWrapper):
     organization_url: str
     project: str
     token: str
@@ -45,22 +47,21 @@ class AzureDevOpsApiWrapper(BaseModel):
     class Config:
         arbitrary_types_allowed = True  # Allow arbitrary types (e.g., WorkItemTrackingClient)
 
-    @model_validator(mode='before')
-    @classmethod
-    def validate_toolkit(cls, values):
+    @model_validator(mode='after')
+    def validate_toolkit(self):
         """Validate and set up the Azure DevOps client."""
         try:
-            # Set up connection to Azure DevOps using Personal Access Token (PAT)
-            credentials = BasicAuthentication('', values['token'])
-            connection = Connection(base_url=values['organization_url'], creds=credentials)
-
-            # Retrieve the work item tracking client and assign it to the private _client attribute
-            cls._client = connection.clients.get_wiki_client()
-
+            # Clients are shared between wrappers with the same organization and Personal Access Token (PAT)
+            self._client = get_cached_client(
+                'ado_wiki', self.organization_url, (self.token,),
+                lambda: Connection(
+                    base_url=self.organization_url, creds=BasicAuthentication('', self.token)
+                ).clients.get_wiki_client()
+            )
         except Exception as e:
-            return ImportError(f"Failed to connect to Azure DevOps: {e}")
+            raise ImportError(f"Failed to connect to Azure DevOps: {e}")
 
-        return values
+        return self
 
     def get_wiki(self, wiki_identified: str):
         """Extract ADO wiki information."""
@@ -174,10 +175,3 @@ class AzureDevOpsApiWrapper(BaseModel):
                 "ref": self.modify_wiki_page,
             }
         ]
-
-    def run(self, mode: str, *args: Any, **kwargs: Any):
-        """Run the tool based on the selected mode."""
-        for tool in self.get_available_tools():
-            if tool["name"] == mode:
-                return tool["ref"](*args, **kwargs)
-        raise ValueError(f"Unknown mode: {mode}")
@@ -1,18 +1,25 @@
 import json
 import logging
-from typing import Optional, Any, Dict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Dict
 
 from azure.devops.connection import Connection
-from azure.devops.released.work_item_tracking import Wiql
+from azure.devops.released.work_item_tracking import Wiql, WorkItemBatchGetRequest
 from azure.devops.released.work_item_tracking import WorkItemTrackingClient
-from pydantic import model_validator, BaseModel
+from pydantic import model_validator
 from langchain_core.tools import ToolException
 from msrest.authentication import BasicAuthentication
 from pydantic import create_model, PrivateAttr
 from pydantic.fields import FieldInfo as Field
+from ...base.api_wrapper import BaseToolApiWrapper
+from ...base.client_cache import get_cached_client
 
 logger = logging.getLogger(__name__)
 
+# max number of ids accepted by the work items batch API
+WORK_ITEMS_BATCH_SIZE = 200
+WORK_ITEMS_BATCH_WORKERS = 4
+
 create_wi_field = """JSON of the work item fields to create in Azure DevOps, i.e.
                     {
                        "fields":{
@@ -62,7 +69,7 @@ ADOGetLinkType = create_model(
 )
 
 
-class AzureDevOpsApiWrapper(BaseModel):
+class AzureDevOpsApiWrapper(BaseToolApiWrapper):
     organization_url: str
     project: str
     token: str
@@ -73,22 +80,21 @@ class AzureDevOpsApiWrapper(BaseModel):
     class Config:
         arbitrary_types_allowed = True  # Allow arbitrary types (e.g., WorkItemTrackingClient)
 
-    @model_validator(mode='before')
-    @classmethod
-    def validate_toolkit(cls, values):
+    @model_validator(mode='after')
+    def validate_toolkit(self):
         """Validate and set up the Azure DevOps client."""
         try:
-            # Set up connection to Azure DevOps using Personal Access Token (PAT)
-            credentials = BasicAuthentication('', values['token'])
-            connection = Connection(base_url=values['organization_url'], creds=credentials)
-
-            # Retrieve the work item tracking client and assign it to the private _client attribute
-            cls._client = connection.clients.get_work_item_tracking_client()
-
+            # Clients are shared between wrappers with the same organization and Personal Access Token (PAT)
+            self._client = get_cached_client(
+                'ado_boards', self.organization_url, (self.token,),
+                lambda: Connection(
+                    base_url=self.organization_url, creds=BasicAuthentication('', self.token)
+                ).clients.get_work_item_tracking_client()
+            )
         except Exception as e:
-            return ImportError(f"Failed to connect to Azure DevOps: {e}")
+            raise ImportError(f"Failed to connect to Azure DevOps: {e}")
 
-        return values
+        return self
 
     def _parse_work_items(self, work_items, fields=None):
         """Parse work items dynamically based on the fields requested."""
@@ -102,22 +108,35 @@ class AzureDevOpsApiWrapper(BaseModel):
         # Remove 'System.Id' from the fields list, as it's not a field you request, it's metadata
         fields = [field for field in fields if "System.Id" not in field]
         fields = [field for field in fields if "System.WorkItemType" not in field]
-        for item in work_items:
-            # Fetch full details of the work item, including the requested fields
-            full_item = self._client.get_work_item(id=item.id, project=self.project, fields=fields)
-            fields_data = full_item.fields
 
-            # Parse the fields dynamically
-            parsed_item = {"id": full_item.id, "url": f"{self.organization_url}/_workitems/edit/{full_item.id}"}
+        ids = [item.id for item in work_items]
+        chunks = [ids[i:i + WORK_ITEMS_BATCH_SIZE] for i in range(0, len(ids), WORK_ITEMS_BATCH_SIZE)]
+        # chunks are independent, fetch them concurrently and keep the WIQL order of the results
+        with ThreadPoolExecutor(max_workers=min(WORK_ITEMS_BATCH_WORKERS, len(chunks)) or 1) as executor:
+            batches = executor.map(lambda chunk: self._get_work_items_batch(chunk, fields), chunks)
+            for batch in batches:
+                for full_item in batch:
+                    if full_item is None:
+                        # items deleted or not accessible since the query ran
+                        continue
+                    fields_data = full_item.fields
 
-            # Iterate through the requested fields and add them to the parsed result
-            for field in fields:
-                parsed_item[field] = fields_data.get(field, "N/A")
+                    # Parse the fields dynamically
+                    parsed_item = {"id": full_item.id, "url": f"{self.organization_url}/_workitems/edit/{full_item.id}"}
+
+                    # Iterate through the requested fields and add them to the parsed result
+                    for field in fields:
+                        parsed_item[field] = fields_data.get(field, "N/A")
 
-            parsed_items.append(parsed_item)
+                    parsed_items.append(parsed_item)
 
         return parsed_items
 
+    def _get_work_items_batch(self, ids: list[int], fields: list[str]):
+        """Fetch up to WORK_ITEMS_BATCH_SIZE work items with the requested fields in one request."""
+        request = WorkItemBatchGetRequest(ids=ids, fields=fields or None, error_policy="omit")
+        return self._client.get_work_items_batch(work_item_get_request=request, project=self.project)
+
     def _transform_work_item(self, work_item_json: str):
         try:
             # Convert the input JSON to a Python dictionary
@@ -314,10 +333,3 @@ class AzureDevOpsApiWrapper(BaseModel):
                 "ref": self.get_relation_types,
             }
         ]
-
-    def run(self, mode: str, *args: Any, **kwargs: Any):
-        """Run the tool based on the selected mode."""
-        for tool in self.get_available_tools():
-            if tool["name"] == mode:
-                return tool["ref"](*args, **kwargs)
-        raise ValueError(f"Unknown mode: {mode}")
@@ -0,0 +1,147 @@
+import hashlib
+import io
+import json
+import os
+import queue
+import shutil
+import tarfile
+import threading
+import uuid
+from typing import BinaryIO, Iterator
+
+# name of the archive member holding sha256 checksums of all other members, written last
+CHECKSUMS_MEMBER = 'SHA256SUMS.json'
+CHUNK_SIZE = 1024 * 1024
+# max number of compressed chunks buffered between the archive writer thread and the consumer
+MAX_BUFFERED_CHUNKS = 8
+
+
+class ArchiveIntegrityError(Exception):
+    pass
+
+
+def _put(chunks: queue.Queue, item, cancelled: threading.Event):
+    """Put an item in the bounded queue, giving up once the consumer is gone."""
+    while not cancelled.is_set():
+        try:
+            chunks.put(item, timeout=1)
+            return
+        except queue.Full:
+            continue
+    # the consumer stopped reading, e.g. the upload failed
+    raise IOError("Archive stream consumer is gone")
+
+
+class _QueueWriter(io.RawIOBase):
+    """Non-seekable file object handing every written block over to a bounded queue."""
+
+    def __init__(self, chunks: queue.Queue, cancelled: threading.Event):
+        self._chunks = chunks
+        self._cancelled = cancelled
+
+    def writable(self):
+        return True
+
+    def write(self, b):
+        chunk = bytes(b)
+        _put(self._chunks, chunk, self._cancelled)
+        return len(chunk)
+
+
+class _HashingReader:
+    def __init__(self, fileobj: BinaryIO):
+        self._fileobj = fileobj
+        self.digest = hashlib.sha256()
+
+    def read(self, size=-1):
+        data = self._fileobj.read(size)
+        self.digest.update(data)
+        return data
+
+
+def stream_archive(folder_path: str) -> Iterator[bytes]:
+    """Yield a gzipped tar archive of the folder chunk by chunk, without writing the archive to disk.
+
+    The archive is produced by a background thread and buffered up to MAX_BUFFERED_CHUNKS chunks,
+    the last member holds sha256 checksums of all files, verified by `extract_archive_stream`.
+    """
+    chunks = queue.Queue(maxsize=MAX_BUFFERED_CHUNKS)
+    cancelled = threading.Event()
+    done = object()
+    errors = []
+
+    def write_archive():
+        try:
+            writer = io.BufferedWriter(_QueueWriter(chunks, cancelled), buffer_size=CHUNK_SIZE)
+            with tarfile.open(fileobj=writer, mode='w|gz') as tar:
+                checksums = {}
+                for root, _, files in os.walk(folder_path):
+                    for file in sorted(files):
+                        path = os.path.join(root, file)
+                        arcname = os.path.relpath(path, folder_path).replace(os.sep, '/')
+                        tarinfo = tar.gettarinfo(path, arcname=arcname)
+                        with open(path, 'rb') as f:
+                            reader = _HashingReader(f)
+                            tar.addfile(tarinfo, reader)
+                        checksums[arcname] = reader.digest.hexdigest()
+                content = json.dumps(checksums).encode('utf-8')
+                tarinfo = tarfile.TarInfo(CHECKSUMS_MEMBER)
+                tarinfo.size = len(content)
+                tar.addfile(tarinfo, io.BytesIO(content))
+            writer.flush()
+        except Exception as e:
+            errors.append(e)
+        finally:
+            try:
+                _put(chunks, done, cancelled)
+            except IOError:
+                pass
+
+    writer_thread = threading.Thread(target=write_archive, daemon=True)
+    writer_thread.start()
+    try:
+        while (chunk := chunks.get()) is not done:
+            yield chunk
+    finally:
+        # a writer blocked on the full queue sees the cancellation within a second
+        cancelled.set()
+        writer_thread.join()
+    if errors:
+        raise errors[0]
+
+
+def extract_archive_stream(fileobj: BinaryIO, target_path: str):
+    """Extract an archive made by `stream_archive` from a (non-seekable) stream into the target folder.
+
+    Members are decompressed straight from the stream into a temporary sibling folder, which replaces
+    the target folder only if all checksums match.
+    """
+    tmp_path = f"{target_path.rstrip(os.sep)}.{uuid.uuid4().hex}.tmp"
+    os.makedirs(tmp_path)
+    try:
+        checksums = {}
+        expected_checksums = None
+        with tarfile.open(fileobj=fileobj, mode='r|gz') as tar:
+            for member in tar:
+                if member.name == CHECKSUMS_MEMBER:
+                    expected_checksums = json.load(tar.extractfile(member))
+                    continue
+                path = os.path.normpath(os.path.join(tmp_path, member.name))
+                if not member.isfile() or os.path.commonpath([tmp_path, path]) != os.path.normpath(tmp_path):
+                    raise ArchiveIntegrityError(f"Unexpected archive member: {member.name}")
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                digest = hashlib.sha256()
+                source = tar.extractfile(member)
+                with open(path, 'wb') as f:
+                    while chunk := source.read(CHUNK_SIZE):
+                        digest.update(chunk)
+                        f.write(chunk)
+                checksums[member.name] = digest.hexdigest()
+        if expected_checksums != checksums:
+            raise ArchiveIntegrityError("Checksums of the extracted files do not match the archive checksums")
+        if os.path.exists(target_path):
+            shutil.rmtree(target_path)
+        os.replace(tmp_path, target_path)
+    finally:
+        if os.path.exists(tmp_path):
+            shutil.rmtree(tmp_path)
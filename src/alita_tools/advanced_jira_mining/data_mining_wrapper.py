@@ -1,26 +1,48 @@
+import hashlib
 import itertools
+import json
+import logging
 import os
 import re
-import zipfile
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from typing import Optional, Tuple, Any, List, Set
+import tempfile
+from contextlib import closing
+from typing import Any, Optional, Tuple, List, Dict
 
 from langchain_community.document_loaders import ConfluenceLoader
 from langchain_community.document_loaders.confluence import ContentFormat
-from langchain_community.embeddings import HuggingFaceEmbeddings
 from langchain_community.vectorstores import Chroma
 from langchain_core.documents import Document
 from langchain_core.messages import BaseMessage
 from langchain_core.output_parsers import StrOutputParser
 from langchain_core.prompts import ChatPromptTemplate
-from pydantic import model_validator, BaseModel
+from pydantic import model_validator
 from langchain_core.runnables import RunnableLambda, RunnableParallel, RunnablePassthrough
 from langchain_text_splitters import MarkdownHeaderTextSplitter
 from pydantic import create_model
 from pydantic.fields import FieldInfo, PrivateAttr
 from atlassian import Jira
 
-from ..llm.llm_utils import get_model, summarize
+from .archive import extract_archive_stream, stream_archive
+from ..llm.embeddings import get_embeddings
+from ..llm.llm_utils import get_model, summarize_batch
+from ..base.api_wrapper import BaseToolApiWrapper
+from ..base.client_cache import get_cached_client, pooled_session
+
+logger = logging.getLogger(__name__)
+
+# NOTE: The AC field is a custom field, and it can be different for different Jira instances.
+ACCEPTANCE_CRITERIA_FIELD = 'customfield_10300'
+# fields of an issue needed to collect related issues and build documents, fetched in a single request
+ISSUE_GRAPH_FIELDS = ['description', 'issuelinks', ACCEPTANCE_CRITERIA_FIELD]
+# default page size of JQL search, bulk_issue does not paginate
+ISSUE_BATCH_SIZE = 50
+# fingerprints and chunk ids of the documents indexed in a jira ticket vectorstore
+MANIFEST_FILE_NAME = 'manifest.json'
+JIRA_MINING_STORAGE_ROOT = os.getenv(
+    'ALITA_JIRA_MINING_STORAGE_ROOT', os.path.join(os.path.expanduser('~'), '.cache', 'alita_tools', 'jira_mining')
+)
+# vector store archives bigger than this are spooled to a temporary file before they are attached
+ARCHIVE_SPOOL_MAX_MEMORY = 16 * 1024 * 1024
 
 PrepareDataSchema = create_model(
     "PrepareDataSchema",
@@ -38,7 +60,7 @@ SearchDataSchema = create_model(
 )
 
 
-class AdvancedJiraMiningWrapper(BaseModel):
+class AdvancedJiraMiningWrapper(BaseToolApiWrapper):
     """
     AdvancedJiraMiningWrapper is a class designed to interface with Jira and Confluence APIs,
     providing advanced mining capabilities for extracting and summarizing data.
@@ -55,6 +77,9 @@ class AdvancedJiraMiningWrapper(BaseModel):
         jira_token (Optional[str]): The token for accessing Jira. Default is None.
         is_jira_cloud (Optional[bool]): Indicates if the Jira instance is a cloud instance. Default is True.
         verify_ssl (Optional[bool]): Indicates if SSL verification should be performed. Default is True.
+        link_depth (Optional[int]): How many levels of linked and mentioned issues are collected. Default is 1.
+        summarization_max_concurrency (Optional[int]): Max number of parallel summarization calls. Default is 10.
+        storage_root (Optional[str]): The directory where vector stores of Jira tickets are kept.
 
     Example:
         .. code-block:: python
@@ -109,7 +134,20 @@ class AdvancedJiraMiningWrapper(BaseModel):
     verify_ssl: Optional[bool] = True
     """Indicates if SSL verification should be performed. Default is True."""
 
+    link_depth: Optional[int] = 1
+    """How many levels of linked and mentioned issues are collected around the issue. Default is 1."""
+
+    summarization_max_concurrency: Optional[int] = 10
+    """Max number of parallel LLM calls when summarizing issue descriptions. Default is 10."""
+
+    storage_root: Optional[str] = JIRA_MINING_STORAGE_ROOT
+    """The directory where vector stores of Jira tickets are kept. Default is ALITA_JIRA_MINING_STORAGE_ROOT or ~/.cache/alita_tools/jira_mining."""
+
+    llm: Optional[Any] = None
+    """The language model created from `model_type` and `llm_settings`."""
+
     _client: Optional[Jira] = PrivateAttr()
+    _issue_cache: Dict[str, Optional[dict]] = PrivateAttr(default_factory=dict)
 
     @model_validator(mode='before')
     @classmethod
@@ -117,9 +155,8 @@ class AdvancedJiraMiningWrapper(BaseModel):
         """
         Validates and initializes the toolkit for interacting with Jira and the language model.
 
-        This function is a root validator for a Pydantic model. It ensures that the necessary
-        packages are installed, validates the provided configuration values, and initializes
-        the Jira client and language model.
+        This function is a root validator for a Pydantic model. It validates the provided configuration
+        values and initializes the language model, the Jira client is initialized by `init_client`.
 
         Parameters:
             cls (Type): The class being validated.
@@ -127,53 +164,31 @@ class AdvancedJiraMiningWrapper(BaseModel):
 
         Returns:
             Dict[str, Any]: The validated and initialized values.
-
-        Raises:
-            ImportError: If the `atlassian` package is not installed.
-        """
-        try:
-            from atlassian import Jira  # noqa: F401
-        except ImportError:
-            raise ImportError(
-                "`atlassian` package not found, please run "
-                "`pip install atlassian-python-api`"
-            )
-        url = values['jira_base_url']
+        """
         model_type = values['model_type']
         llm_settings = values['llm_settings']
-        api_key = values.get('jira_api_key')
-        username = values.get('jira_username')
-        token = values.get('jira_token')
-        is_cloud = values.get('is_jira_cloud')
-        if token:
-            cls._client = Jira(url=url, token=token, cloud=is_cloud, verify_ssl=values['verify_ssl'])
-        else:
-            cls._client = Jira(url=url, username=username, password=api_key, cloud=is_cloud,
-                                    verify_ssl=values['verify_ssl'])
         values['llm'] = get_model(model_type, llm_settings)
         return values
 
-    def __zip_directory(self, folder_path, output_path):
-        """
-        Compresses the contents of a directory into a ZIP file.
-
-        This function compresses the contents of the specified directory, including all
-        subdirectories and files, into a ZIP file. The directory structure is preserved
-        within the ZIP file.
-
-        Parameters:
-            folder_path (str): The path to the directory to be compressed.
-            output_path (str): The path where the output ZIP file will be saved.
-
-        Returns:
-            None
-        """
-        with zipfile.ZipFile(output_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
-            for root, dirs, files in os.walk(folder_path):
-                for file in files:
-                    # Create a relative path for files to keep the directory structure
-                    relative_path = os.path.relpath(os.path.join(root, file), os.path.join(folder_path, '..'))
-                    zipf.write(os.path.join(root, file), relative_path)
+    @model_validator(mode='after')
+    def init_client(self):
+        """Initializes the Jira client, shared between wrappers with the same Jira credentials."""
+        url = self.jira_base_url
+        is_cloud = self.is_jira_cloud
+        verify_ssl = self.verify_ssl
+        if self.jira_token:
+            self._client = get_cached_client(
+                'jira', url, (self.jira_token, is_cloud, verify_ssl, '2'),
+                lambda: Jira(url=url, token=self.jira_token, cloud=is_cloud, verify_ssl=verify_ssl,
+                             session=pooled_session())
+            )
+        else:
+            self._client = get_cached_client(
+                'jira', url, (self.jira_username, self.jira_api_key, is_cloud, verify_ssl, '2'),
+                lambda: Jira(url=url, username=self.jira_username, password=self.jira_api_key, cloud=is_cloud,
+                             verify_ssl=verify_ssl, session=pooled_session())
+            )
+        return self
 
     def __fetch_jira_confluence_page_ids(self, jira_issue_key: str) -> List[str]:
         """
@@ -196,146 +211,121 @@ class AdvancedJiraMiningWrapper(BaseModel):
 
         return re.findall(r'\d{4,12}', '\n'.join(confluence_remote_links), re.DOTALL)
 
-    def __fetch_all_linked_jira_issue_keys(self, jira_issue_key: str) -> Set[str]:
-        """
-        Fetches all linked Jira issue keys that are not of type Bug, Task, or Sub-task.
-
-        This function retrieves the issue links associated with a given Jira issue key,
-        filters the links to exclude issues of type Bug, Task, or Sub-task, and returns
-        a set of the remaining linked issue keys.
-
-        Parameters:
-            jira_issue_key (str): The key of the Jira issue for which to fetch linked issue keys.
-
-        Returns:
-            Set[str]: A set of linked Jira issue keys that are not of type Bug, Task, or Sub-task.
-        """
-        linked_issues_keys = set()
-        jira_issue = self._client.issue(jira_issue_key, fields='issuelinks')
-        linked_links = [link for link in jira_issue['fields']['issuelinks']]
-        for link in linked_links:
-            if link.get('outwardIssue') is not None:
-                # Include in result set ONLY those issues, which are not of type Bug, Task, or Sub-task
-                if not (link['outwardIssue']['fields']['issuetype']['name'] in ['Bug', 'Task', 'Sub-task']):
-                    linked_issues_keys.add(link['outwardIssue']['key'])
-            else:
-                # Include in result set ONLY those issues, which are not of type Bug, Task, or Sub-task
-                if not (link['inwardIssue']['fields']['issuetype']['name'] in ['Bug', 'Task', 'Sub-task']):
-                    linked_issues_keys.add(link['inwardIssue']['key'])
-        return linked_issues_keys
-
-    def __bulk_fetch_specific_fields_from_jira_issue_key(self, jira_issue_keys: List[str], fields="*all") -> List[str]:
+    def __get_issues(self, jira_issue_keys: List[str]) -> Dict[str, dict]:
         """
-        Fetches specific fields from multiple Jira issues in bulk.
+        Returns Jira issues with all the fields used for data mining, fetching only those missing in the issue cache.
 
-        This function retrieves specific fields from multiple Jira issues using their issue keys.
-        The fields to be retrieved can be specified, with the default being all fields.
+        Missing issues are requested with batched `key in (...)` JQL queries, so every issue is downloaded
+        once per refresh no matter how many steps need its description, links or acceptance criteria.
 
         Parameters:
-            jira_issue_keys (List[str]): A list of Jira issue keys for which to fetch specific fields.
-            fields (str): The fields to be retrieved from the Jira issues. Default is "*all".
+            jira_issue_keys (List[str]): The keys of the Jira issues to return.
 
         Returns:
-            List[str]: A list of Jira issues with the specified fields.
+            Dict[str, dict]: Jira issues by key; keys of issues which do not exist are omitted.
         """
-        issues = self._client.bulk_issue(jira_issue_keys, fields=fields)
-        return issues
+        missing_keys = [key for key in dict.fromkeys(jira_issue_keys) if key not in self._issue_cache]
+        for i in range(0, len(missing_keys), ISSUE_BATCH_SIZE):
+            chunk = missing_keys[i:i + ISSUE_BATCH_SIZE]
+            found_issues, not_found_keys = self._client.bulk_issue(chunk, fields=','.join(ISSUE_GRAPH_FIELDS))
+            for issue in found_issues.get('issues', []):
+                self._issue_cache[issue['key']] = issue
+            for key in not_found_keys or []:
+                self._issue_cache[key] = None
+        return {key: self._issue_cache[key] for key in jira_issue_keys if self._issue_cache.get(key) is not None}
 
-    def __get_all_jira_issue_keys_from_issue_description(self, jira_issue_key: str) -> List[str]:
+    @staticmethod
+    def __get_linked_jira_issue_keys(jira_issue: dict) -> List[str]:
         """
-        Extracts all Jira issue keys from the description of a given Jira issue.
-
-        This function retrieves the description of a specified Jira issue and extracts all
-        Jira issue keys mentioned in the description. The extracted issue keys are returned
-        as a list of unique values.
+        Returns keys of the issues linked to a Jira issue, skipping issues of type Bug, Task, or Sub-task.
 
         Parameters:
-            jira_issue_key (str): The key of the Jira issue from which to extract issue keys.
+            jira_issue (dict): The Jira issue with the `issuelinks` field.
 
         Returns:
-            List[str]: A list of unique Jira issue keys extracted from the issue description.
+            List[str]: Keys of the linked Jira issues that are not of type Bug, Task, or Sub-task.
         """
-        jira_issue = self._client.issue(jira_issue_key, 'description')
-        description = jira_issue['fields']['description']
-        return list(set(re.findall(r'[A-Z]{1,5}-\d{1,5}', description, re.DOTALL)))
+        linked_issues_keys = []
+        for link in jira_issue['fields'].get('issuelinks') or []:
+            linked_issue = link.get('outwardIssue') or link['inwardIssue']
+            if linked_issue['fields']['issuetype']['name'] not in ['Bug', 'Task', 'Sub-task']:
+                linked_issues_keys.append(linked_issue['key'])
+        return linked_issues_keys
 
-    def __get_all_jira_issue_keys_from_issue_ac(self, jira_issue_key: str) -> List[str]:
+    @staticmethod
+    def __get_in_text_jira_issue_keys(jira_issue: dict) -> List[str]:
         """
-        Extracts all Jira issue keys from the acceptance criteria (AC) field of a given Jira issue.
-
-        This function retrieves the acceptance criteria (AC) field of a specified Jira issue
-        and extracts all Jira issue keys mentioned in the AC. The extracted issue keys are
-        returned as a list of unique values.
+        Extracts all Jira issue keys mentioned in the description and acceptance criteria (AC) fields of a Jira issue.
         NOTE: The AC field is a custom field, and it can be different for different Jira instances.
 
         Parameters:
-            jira_issue_key (str): The key of the Jira issue from which to extract issue keys.
-
-        Returns:
-            List[str]: A list of unique Jira issue keys extracted from the AC field.
-        """
-        jira_issue = self._client.issue(jira_issue_key, 'customfield_10300')
-        ac = jira_issue['fields']['customfield_10300']
-        return list(set(re.findall(r'[A-Z]{1,5}-\d{1,5}', ac, re.DOTALL)))
-
-    def __get_all_jira_issue_keys_from_description_and_ac(self, jira_issue_key: str) -> List[str]:
-        """
-        Extracts all Jira issue keys from both the description and acceptance criteria (AC) fields of a given Jira issue.
-
-        This function retrieves the issue keys mentioned in both the description and acceptance criteria (AC) fields
-        of a specified Jira issue. The extracted issue keys are combined and returned as a list of unique values.
-
-        Parameters:
-            jira_issue_key (str): The key of the Jira issue from which to extract issue keys.
+            jira_issue (dict): The Jira issue with the `description` and AC fields.
 
         Returns:
-            List[str]: A list of unique Jira issue keys extracted from both the description and AC fields.
+            List[str]: Jira issue keys found in the description and AC fields.
         """
-        desc_keys = self.__get_all_jira_issue_keys_from_issue_description(jira_issue_key)
-        ac_keys = self.__get_all_jira_issue_keys_from_issue_ac(jira_issue_key)
-        return list(set(itertools.chain(desc_keys, ac_keys)))
+        fields = jira_issue['fields']
+        text = '\n'.join(fields.get(field) or '' for field in ('description', ACCEPTANCE_CRITERIA_FIELD))
+        return re.findall(r'[A-Z]{1,5}-\d{1,5}', text, re.DOTALL)
 
     def __get_all_linked_and_in_text_jira_keys(self, jira_issue_key: str) -> List[str]:
         """
-        Extracts all linked Jira issue keys and issue keys mentioned in the description and acceptance criteria (AC) fields of a given Jira issue.
+        Collects the graph of Jira issues related to a given Jira issue.
 
-        This function retrieves the issue keys that are linked to a specified Jira issue and the issue keys mentioned
-        in both the description and acceptance criteria (AC) fields. The extracted issue keys are combined and returned
-        as a list of unique values.
+        Starting from the given issue, the keys of linked issues and of issues mentioned in the description and
+        acceptance criteria (AC) fields are collected level by level up to `link_depth` levels. Every level is
+        fetched with batched requests through the issue cache.
 
         Parameters:
             jira_issue_key (str): The key of the Jira issue from which to extract linked and in-text issue keys.
 
         Returns:
-            List[str]: A list of unique Jira issue keys extracted from both the linked issues and the description and AC fields.
-        """
-        linked_issues = self.__fetch_all_linked_jira_issue_keys(jira_issue_key)
-        linked_issues.add(jira_issue_key)
-        in_text_issues = self.__get_all_jira_issue_keys_from_description_and_ac(jira_issue_key)
-        return list(set(itertools.chain(linked_issues, in_text_issues)))
-
-    def __attach_file_to_jira_issue(self, jira_issue_key: str, file_name: str):
-        """
-        Attach a file to a specified JIRA issue.
-
-        This private method uses the JIRA client to add an attachment to a JIRA issue identified by its key.
+            List[str]: Unique Jira issue keys of the issue itself and its related issues, in discovery order.
+        """
+        keys = [jira_issue_key]
+        frontier = [jira_issue_key]
+        for _ in range(max(self.link_depth or 1, 1)):
+            issues = self.__get_issues(frontier)
+            next_frontier = []
+            for key in frontier:
+                if key not in issues:
+                    continue
+                related_keys = itertools.chain(self.__get_linked_jira_issue_keys(issues[key]),
+                                               self.__get_in_text_jira_issue_keys(issues[key]))
+                for related_key in related_keys:
+                    if related_key not in keys:
+                        keys.append(related_key)
+                        next_frontier.append(related_key)
+            if not next_frontier:
+                break
+            frontier = next_frontier
+        return keys
+
+    def __attach_vectorstore_to_jira_issue(self, jira_issue_key: str, persistent_path: str, file_name: str):
+        """
+        Attach the vector store of a JIRA issue to the issue as an archive.
+
+        The directory is compressed on the fly into a spooled temporary file, kept in memory up to
+        ARCHIVE_SPOOL_MAX_MEMORY, which is attached through the public Jira client API.
 
         Args:
-            jira_issue_key (str): The unique identifier (key) of the JIRA issue to which the file will be attached.
-            file_name (str): The path to the file that will be attached to the JIRA issue.
+            jira_issue_key (str): The unique identifier (key) of the JIRA issue to which the archive will be attached.
+            persistent_path (str): The directory of the vector store.
+            file_name (str): The name of the attachment.
 
         Raises:
-            JIRAError: If there is an error while attaching the file to the JIRA issue.
-
-        Examples:
-            .. code-block:: python
-
-                self.__attach_file_to_jira_issue('PROJ-123', '/path/to/file.txt')
+            HTTPError: If there is an error while attaching the archive to the JIRA issue.
 
         Note:
             This method is intended for internal use within the class and should not be called directly from outside the class.
         """
-        self._client.add_attachment(jira_issue_key, filename=file_name)
+        with tempfile.SpooledTemporaryFile(max_size=ARCHIVE_SPOOL_MAX_MEMORY) as archive:
+            # closing stops the archive writer thread if spooling fails
+            with closing(stream_archive(persistent_path)) as chunks:
+                for chunk in chunks:
+                    archive.write(chunk)
+            archive.seek(0)
+            self._client.add_attachment_object(jira_issue_key, (file_name, archive, 'application/gzip'))
 
     def __get_confluence_documents_by_jira_ticket(self, jira_issue_id: str) -> List[Document]:
         """
@@ -481,17 +471,17 @@ class AdvancedJiraMiningWrapper(BaseModel):
 
     def __process_issue_from_bulk_response(self, issue_from_bulk_response: dict) -> str:
         """
-        Process a JIRA issue from a bulk response and optionally summarize its description.
+        Process the description of a JIRA issue from a bulk response.
 
         This private method processes the description of a JIRA issue obtained from a bulk response.
         It cleans the description by removing color identifiers and stripping whitespace from each line.
-        If a summarization prompt is provided, it summarizes the cleaned description using a language model.
+        Summarization is done for all issues at once in `__process_issues`.
 
         Args:
             issue_from_bulk_response (dict): A dictionary representing a JIRA issue from a bulk response. The dictionary is expected to contain a 'fields' key with a 'description' field.
 
         Returns:
-            str: The cleaned and optionally summarized description of the JIRA issue.
+            str: The cleaned description of the JIRA issue.
 
         Example:
             .. code-block:: python
@@ -510,97 +500,48 @@ class AdvancedJiraMiningWrapper(BaseModel):
         Note:
             This method is intended for internal use within the class and should not be called directly from outside the class.
         """
-        description = self.__clean_text_from_color_identifiers(
+        return self.__clean_text_from_color_identifiers(
             '\n'.join(self.__clean_text_lines(issue_from_bulk_response['fields']['description'])))
-        if self.summarization_prompt:
-            return summarize(llm=self.llm, data_to_summarize=description, summarization_key='description',
-                             summarization_prompt=self.summarization_prompt)
-        else:
-            return description
 
-    def __get_jira_descriptions_to_dict(self, jira_issue_key: str) -> Tuple[dict, list[str]]:
+    def __process_issues(self, jira_issues: List[dict]) -> dict:
         """
-        Retrieve and process descriptions of JIRA issues related to a given JIRA issue key.
+        Clean and optionally summarize descriptions of JIRA issues.
 
-        This private method fetches descriptions for a specified JIRA issue and all related issues.
-        It processes each description to clean and optionally summarize it, and stores the results in a dictionary.
-        The method uses a thread pool to parallelize the processing of multiple issues.
+        Cleaned descriptions are summarized as one batch with up to `summarization_max_concurrency` parallel LLM calls.
+        If the summary cache is enabled (ALITA_SUMMARY_CACHE), summaries are cached persistently by (prompt, model,
+        description), so descriptions already summarized before cost no LLM call.
 
         Args:
-            jira_issue_key (str): The unique identifier (key) of the JIRA issue for which related issue descriptions are to be fetched and processed.
+            jira_issues (List[dict]): JIRA issues with the 'description' field.
 
         Returns:
-            Tuple[dict, list[str]]: A tuple containing:
-                - A dictionary where keys are JIRA issue keys and values are the processed descriptions.
-                - A list of all JIRA issue keys related to the specified JIRA issue.
-
-        Example:
-            .. code-block:: python
-
-                jira_issue_key = 'PROJ-123'
-                descriptions_dict, related_keys = self.__get_jira_descriptions_to_dict(jira_issue_key)
-                print(descriptions_dict)
-                print(related_keys)
-
-        Note:
-            This method is intended for internal use within the class and should not be called directly from outside the class.
+            dict: Processed descriptions by JIRA issue key; issues which failed to process are omitted.
         """
         # Cache to store fetched Jira data
         jira_data_cache = {}
-        # Get all the jJira issue keys related to jira issue passed in method argument
-        jira_keys = self.__get_all_linked_and_in_text_jira_keys(jira_issue_key)
-        # Find all the descriptions for all the related jira issues + issue passed in argument itself
-        found_issues, _ = self.__bulk_fetch_specific_fields_from_jira_issue_key(jira_keys, fields='description')
-
-        with ThreadPoolExecutor(max_workers=10) as executor:
-            future_to_issue = {
-                executor.submit(self.__process_issue_from_bulk_response, issue): issue for issue in
-                found_issues['issues']}
-            for future in as_completed(future_to_issue):
-                jira_issue = future_to_issue[future]
-                try:
-                    jira_data_cache[jira_issue['key']] = future.result()
-                except Exception as e:
-                    print(f"Error fetching data for Jira issue {jira_issue}: {e}")
-        return jira_data_cache, jira_keys
-
-    def __create_ac_documents_content(self, jira_issue_key: str) -> List[Document]:
-        """
-        Create a list of Document objects containing the descriptions of related JIRA issues.
-
-        This private method retrieves descriptions for a specified JIRA issue and all related issues, processes the descriptions, and creates Document objects for each description.
-        Each Document object includes the JIRA issue key and the processed description.
-
-        Args:
-            jira_issue_key (str): The unique identifier (key) of the JIRA issue for which related issue descriptions are to be fetched and processed.
-
-        Returns:
-            List[Document]: A list of Document objects, each containing the processed description of a related JIRA issue.
-
-        Example:
-            .. code-block:: python
-
-                jira_issue_key = 'PROJ-123'
-                documents = self.__create_ac_documents_content(jira_issue_key)
-                for doc in documents:
-                    print(doc.page_content)
-
-        Note:
-            This method is intended for internal use within the class and should not be called directly from outside the class.
-        """
-        related_description_content = []  # List of related descriptions
-
-        # Cache to store fetched JIRA descriptions
-        jira_data_cache, keys = self.__get_jira_descriptions_to_dict(jira_issue_key)
-
-        # Process scenarios and ACs
-        for key in keys:
-            if key in jira_data_cache:
-                res_desc = jira_data_cache[key]
-                related_description_content.append(Document(
-                    page_content=f"Related links content for jira key - {key}:Ticket Description:\n{res_desc}",
-                    metadata={'source': key}))
-        return related_description_content
+        for jira_issue in jira_issues:
+            try:
+                jira_data_cache[jira_issue['key']] = self.__process_issue_from_bulk_response(jira_issue)
+            except Exception as e:
+                logger.error(f"Error fetching data for Jira issue {jira_issue.get('key')}: {e}")
+        if self.summarization_prompt and jira_data_cache:
+            summaries = summarize_batch(llm=self.llm, summarization_prompt=self.summarization_prompt,
+                                        data_to_summarize=list(jira_data_cache.values()),
+                                        summarization_key='description',
+                                        max_concurrency=self.summarization_max_concurrency, return_exceptions=True)
+            for key, summary in zip(list(jira_data_cache), summaries):
+                if isinstance(summary, Exception):
+                    logger.error(f"Error summarizing data for Jira issue {key}: {summary}")
+                    del jira_data_cache[key]
+                else:
+                    jira_data_cache[key] = summary
+        return jira_data_cache
+
+    @staticmethod
+    def __create_issue_document(jira_issue_key: str, description: str) -> Document:
+        return Document(
+            page_content=f"Related links content for jira key - {jira_issue_key}:Ticket Description:\n{description}",
+            metadata={'source': jira_issue_key})
 
     def __get_attachment_id(self, jira_issue_key: str, file_name: str) -> str | None:
         """
@@ -634,27 +575,23 @@ class AdvancedJiraMiningWrapper(BaseModel):
         else:
             return None
 
-    def __download_attachment_by_id(self, jira_issue_key: str, file_name: str, persistent_path: str = '.'):
+    def __download_attachment_by_id(self, jira_issue_key: str, file_name: str, persistent_path: str):
         """
-        Download and extract a file attachment from a JIRA issue by its ID.
+        Download the vector store archive attached to a JIRA issue and extract it.
 
-        This private method retrieves the attachment ID for a specified file from a JIRA issue, downloads the attachment, and extracts its contents if it is a ZIP file.
-        The extracted contents are saved to a specified directory.
+        The archive is decompressed straight from the download stream into the vector store directory,
+        which is replaced only when the checksums of all extracted files match.
 
         Args:
             jira_issue_key (str): The unique identifier (key) of the JIRA issue from which to download the attachment.
-            file_name (str): The name of the file to be downloaded and extracted.
-            persistent_path (str, optional): The directory where the extracted contents will be saved. Defaults to the current directory ('.').
+            file_name (str): The name of the attachment to be downloaded and extracted.
+            persistent_path (str): The directory of the vector store the archive is extracted into.
 
         Returns:
             None
 
-        Example:
-            .. code-block:: python
-
-                jira_issue_key = 'PROJ-123'
-                file_name = 'example.zip'
-                self.__download_attachment_by_id(jira_issue_key, file_name, persistent_path='/path/to/save')
+        Raises:
+            ArchiveIntegrityError: If the downloaded archive is corrupted.
 
         Note:
             This method is intended for internal use within the class and should not be called directly from outside the class.
@@ -662,19 +599,10 @@ class AdvancedJiraMiningWrapper(BaseModel):
         attachment_json = self._client.get_attachment(self.__get_attachment_id(jira_issue_key, file_name))
         url_to_download = attachment_json['content']
 
-        # Download the content
-        content_to_download = self._client._session.get(url_to_download).content
-
-        # Save the downloaded content to a file
-        with open(os.path.join('.', file_name), 'wb') as f:
-            f.write(content_to_download)
-
-        # Open the ZIP file and extract its contents
-        with zipfile.ZipFile(file_name, 'r') as zip_ref:
-            zip_ref.extractall(persistent_path)
-
-        # Remove the downloaded ZIP file
-        os.remove(file_name)
+        with self._client._session.get(url_to_download, stream=True, verify=self.verify_ssl) as response:
+            response.raise_for_status()
+            response.raw.decode_content = True
+            extract_archive_stream(response.raw, persistent_path)
 
     def __prepare_vectorstore(self, jira_issue_key: str, obtain_vectorstore: bool = False) -> Tuple[str, Chroma | None]:
         """
@@ -703,9 +631,9 @@ class AdvancedJiraMiningWrapper(BaseModel):
         Note:
             This method is intended for internal use within the class and should not be called directly from outside the class.
         """
-        persistent_path = os.path.abspath(os.path.join('.', f'jira_ticket_embeddings_{jira_issue_key}'))
+        persistent_path = os.path.abspath(os.path.join(self.storage_root, f'jira_ticket_embeddings_{jira_issue_key}'))
         if obtain_vectorstore:
-            embedding_function = HuggingFaceEmbeddings(encode_kwargs={'normalize_embeddings': True})
+            embedding_function = get_embeddings(normalize_embeddings=True)
             vectorstore = Chroma(
                 collection_name="jira_ticket_data",
                 embedding_function=embedding_function,
@@ -749,27 +677,114 @@ class AdvancedJiraMiningWrapper(BaseModel):
         return output
 
 
+    @staticmethod
+    def __load_manifest(persistent_path: str) -> dict | None:
+        """
+        Load the manifest of documents indexed in the vector store of a JIRA issue.
+
+        The manifest maps every source document ('confluence:<page id>' or 'jira:<issue key>') to the fingerprint of
+        its content at indexing time and to the ids of its chunks in the vector store.
+
+        Args:
+            persistent_path (str): The directory of the vector store.
+
+        Returns:
+            dict | None: The manifest, or None if the vector store has no manifest.
+        """
+        manifest_path = os.path.join(persistent_path, MANIFEST_FILE_NAME)
+        if not os.path.exists(manifest_path):
+            return None
+        with open(manifest_path, 'r') as f:
+            return json.load(f)
+
+    @staticmethod
+    def __save_manifest(persistent_path: str, manifest: dict):
+        with open(os.path.join(persistent_path, MANIFEST_FILE_NAME), 'w') as f:
+            json.dump(manifest, f)
+
+    @staticmethod
+    def __content_hash(content: str) -> str:
+        return hashlib.sha256(content.encode('utf-8')).hexdigest()
+
+    def __refresh_vectorstore(self, jira_issue_key: str) -> Tuple[int, int]:
+        """
+        Bring the vector store of a JIRA issue in line with the current Confluence pages and JIRA descriptions.
+
+        Every source document is fingerprinted (Confluence 'version.when', hash of the raw JIRA description) and compared
+        with the manifest of the vector store: only new or changed documents are split, summarized and embedded,
+        chunks of changed and no longer related documents are deleted.
+
+        Args:
+            jira_issue_key (str): The unique identifier (key) of the JIRA issue whose vector store is refreshed.
+
+        Returns:
+            Tuple[int, int]: The number of added and deleted chunks.
+        """
+        persistent_path, vectorstore = self.__prepare_vectorstore(jira_issue_key, obtain_vectorstore=True)
+        # issues are fetched again on every refresh, otherwise edited descriptions and links would never be seen
+        self._issue_cache.clear()
+        manifest = self.__load_manifest(persistent_path)
+        if manifest is None:
+            # vector store built before the manifest was introduced, it is indexed from scratch
+            manifest = {}
+            existing_ids = vectorstore.get()['ids']
+            if existing_ids:
+                vectorstore.delete(ids=existing_ids)
+
+        confluence_docs = {f"confluence:{doc.metadata['id']}": doc
+                           for doc in self.__get_confluence_documents_by_jira_ticket(jira_issue_key)}
+        jira_keys = self.__get_all_linked_and_in_text_jira_keys(jira_issue_key)
+        jira_issues = {f"jira:{key}": issue for key, issue in self.__get_issues(jira_keys).items()}
+        fingerprints = {source: doc.metadata.get('when') or self.__content_hash(doc.page_content)
+                        for source, doc in confluence_docs.items()}
+        fingerprints |= {source: self.__content_hash(issue['fields'].get('description') or '')
+                         for source, issue in jira_issues.items()}
+
+        stale_sources = [source for source, entry in manifest.items() if fingerprints.get(source) != entry['fingerprint']]
+        stale_ids = [chunk_id for source in stale_sources for chunk_id in manifest.pop(source)['ids']]
+        if stale_ids:
+            vectorstore.delete(ids=stale_ids)
+
+        changed_sources = [source for source in fingerprints if source not in manifest]
+        documents_by_source = {
+            source: self.__split_the_confluence_documents([confluence_docs[source]])
+            for source in changed_sources if source in confluence_docs
+        }
+        descriptions = self.__process_issues([jira_issues[source] for source in changed_sources if source in jira_issues])
+        for key, description in descriptions.items():
+            documents_by_source[f"jira:{key}"] = [self.__create_issue_document(key, description)]
+
+        added = 0
+        for source, documents in documents_by_source.items():
+            ids = [f"{source}:{i}" for i in range(len(documents))]
+            if documents:
+                vectorstore.add_documents(documents, ids=ids)
+            manifest[source] = {'fingerprint': fingerprints[source], 'ids': ids}
+            added += len(ids)
+        vectorstore.persist()
+        self.__save_manifest(persistent_path, manifest)
+        return added, len(stale_ids)
+
     def prepare_data(self, jira_issue_key: str) -> str:
         """ Prepare the embeddings for the specific jira issue key. They will include both Jira and Confluence info. """
         path, _ = self.__prepare_vectorstore(jira_issue_key)
-        zip_file_name = f'jira_ticket_embeddings_{jira_issue_key}.zip'
-        if self.__get_attachment_id(jira_issue_key, zip_file_name) is not None:
-            self.__download_attachment_by_id(jira_issue_key, zip_file_name)
-            return f"The vectorstore content have been obtained from Jira ticket - {jira_issue_key}. You can use it from the path - {path}"
-        elif not os.path.exists(path):
-            initial_confluence_docs = self.__get_confluence_documents_by_jira_ticket(jira_issue_key)
-            result_confluence_docs = self.__split_the_confluence_documents(initial_confluence_docs)
-            related_description_list = self.__create_ac_documents_content(jira_issue_key)
-            _, vectorstore = self.__prepare_vectorstore(jira_issue_key, obtain_vectorstore=True)
-            vectorstore.add_documents(result_confluence_docs)
-            vectorstore.add_documents(related_description_list)
-            vectorstore.persist()
-            self.__zip_directory(path, zip_file_name)
-            self.__attach_file_to_jira_issue(jira_issue_key, zip_file_name)
-            os.remove(zip_file_name)
+        archive_file_name = f'jira_ticket_embeddings_{jira_issue_key}.tar.gz'
+        attachment_id = self.__get_attachment_id(jira_issue_key, archive_file_name)
+        if attachment_id is not None and not os.path.exists(path):
+            self.__download_attachment_by_id(jira_issue_key, archive_file_name, path)
+        existed = os.path.exists(path)
+        added, deleted = self.__refresh_vectorstore(jira_issue_key)
+        if added or deleted:
+            self.__attach_vectorstore_to_jira_issue(jira_issue_key, path, archive_file_name)
+            if attachment_id is not None:
+                # the refreshed vectorstore is uploaded, the outdated one is removed from the ticket
+                self._client.delete(f"rest/api/2/attachment/{attachment_id}")
+        if not existed:
             return f'Successfully created embeddings for the jira ticket with following id - {jira_issue_key}'
-        else:
-            pass
+        if not (added or deleted):
+            return f"The vectorstore content for Jira ticket - {jira_issue_key} is up to date. You can use it from the path - {path}"
+        return (f"The vectorstore content for Jira ticket - {jira_issue_key} has been refreshed: {added} chunks embedded, "
+                f"{deleted} stale chunks removed. You can use it from the path - {path}")
 
     def search_data(self, jira_issue_key: str, query: str) -> str:
         """
@@ -885,10 +900,3 @@ class AdvancedJiraMiningWrapper(BaseModel):
             }
 
         ]
-
-    def run(self, mode: str, *args: Any, **kwargs: Any):
-        for tool in self.get_available_tools():
-            if tool["name"] == mode:
-                return tool["ref"](*args, **kwargs)
-        else:
-            raise ValueError(f"Unknown mode: {mode}")
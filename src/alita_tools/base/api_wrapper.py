@@ -0,0 +1,72 @@
+import asyncio
+import contextvars
+import functools
+import inspect
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable
+
+from pydantic import BaseModel
+
+TOOLS_EXECUTOR_MAX_WORKERS = int(os.getenv("ALITA_TOOLS_MAX_WORKERS", "32"))
+
+# wrapper class -> {tool name: tool description with "ref" holding the method name}
+_tools_tables: dict[type, dict[str, dict]] = {}
+_tools_tables_lock = threading.Lock()
+
+# bounded pool for wrappers built on blocking SDKs, calls beyond the limit wait in the queue
+_tools_executor = ThreadPoolExecutor(max_workers=TOOLS_EXECUTOR_MAX_WORKERS, thread_name_prefix="alita-tools")
+
+
+async def run_in_tools_executor(func: Callable, *args: Any, **kwargs: Any) -> Any:
+    """Run a blocking callable in the shared, size-bounded tools thread pool."""
+    loop = asyncio.get_running_loop()
+    ctx = contextvars.copy_context()
+    return await loop.run_in_executor(_tools_executor, functools.partial(ctx.run, func, *args, **kwargs))
+
+
+class BaseToolApiWrapper(BaseModel):
+    """Base class for toolkit API wrappers.
+
+    The list returned by `get_available_tools` is the same for every instance of a wrapper class,
+    so it is built once per class (together with its args schemas) and `run` dispatches by name
+    through a dict instead of rebuilding and scanning the list on each call.
+
+    `arun` awaits the native coroutine `a<method>` when the wrapper defines one, otherwise the
+    blocking method is executed in the shared tools thread pool.
+    """
+
+    def get_available_tools(self):
+        raise NotImplementedError("Subclasses should implement this method")
+
+    def get_tools_table(self) -> dict[str, dict]:
+        """Return the cached tools table of the wrapper class keyed by tool name."""
+        cls = type(self)
+        table = _tools_tables.get(cls)
+        if table is None:
+            with _tools_tables_lock:
+                table = _tools_tables.get(cls)
+                if table is None:
+                    table = {}
+                    for tool in self.get_available_tools():
+                        # keep the method name only, bound methods belong to this instance
+                        table[tool["name"]] = {**tool, "ref": tool["ref"].__name__}
+                    _tools_tables[cls] = table
+        return table
+
+    def _get_tool_ref(self, mode: str) -> str:
+        tool = self.get_tools_table().get(mode)
+        if tool is None:
+            raise ValueError(f"Unknown mode: {mode}")
+        return tool["ref"]
+
+    def run(self, mode: str, *args: Any, **kwargs: Any):
+        return getattr(self, self._get_tool_ref(mode))(*args, **kwargs)
+
+    async def arun(self, mode: str, *args: Any, **kwargs: Any):
+        ref = self._get_tool_ref(mode)
+        async_ref = getattr(self, f"a{ref}", None)
+        if async_ref is not None and inspect.iscoroutinefunction(async_ref):
+            return await async_ref(*args, **kwargs)
+        return await run_in_tools_executor(getattr(self, ref), *args, **kwargs)
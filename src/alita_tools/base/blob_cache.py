@@ -0,0 +1,204 @@
+import hashlib
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Iterable, Optional, Tuple
+
+from .client_cache import credential_fingerprint
+
+logger = logging.getLogger(__name__)
+
+BLOB_CACHE_MAX_BYTES = int(os.getenv("ALITA_BLOB_CACHE_MAX_BYTES", str(64 * 1024 * 1024)))
+# a (ref, path) -> blob mapping older than this is resolved against the forge again, blobs themselves never go stale
+BLOB_CACHE_REF_TTL = float(os.getenv("ALITA_BLOB_CACHE_REF_TTL", "120"))
+BLOB_CACHE_MAX_REFS = int(os.getenv("ALITA_BLOB_CACHE_MAX_REFS", "10000"))
+# blobs are kept in memory only unless a path of the SQLite database is set
+BLOB_CACHE_PATH = os.getenv("ALITA_BLOB_CACHE_PATH", "")
+BLOB_CACHE_DISK_MAX_BYTES = int(os.getenv("ALITA_BLOB_CACHE_DISK_MAX_BYTES", str(512 * 1024 * 1024)))
+BLOB_CACHE_ENABLED = os.getenv("ALITA_BLOB_CACHE", "true").lower() == "true"
+# LRU order on disk only needs to be approximate, accessed_at is rewritten at most once per interval per blob
+BLOB_CACHE_TOUCH_INTERVAL = 60.0
+
+
+def blob_scope(forge: str, url: str, repository: Any, credentials: Iterable[Any]) -> str:
+    """Scope of the cached blobs of one repository, wrappers with other credentials do not share entries."""
+    return f"{forge}:{url}:{repository}:{credential_fingerprint(credentials)}"
+
+
+def git_blob_sha(content: str) -> str:
+    """Sha of the git blob object holding the content, as assigned by the forge on commit."""
+    data = content.encode("utf-8")
+    return hashlib.sha1(b"blob %d\0" % len(data) + data).hexdigest()
+
+
+def content_id(content: str) -> str:
+    """Content address of a file whose blob sha is not returned by the forge."""
+    return "sha256:" + hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+class BlobCache:
+    """Cache of repository file contents shared by the git forge wrappers.
+
+    Contents are stored once per (scope, blob id), a blob id being the git blob sha or the content hash,
+    so they never go stale. Reads by (scope, ref, path) go through a mapping to the blob id, which expires
+    after BLOB_CACHE_REF_TTL and is replaced by the wrappers on their own writes; at most BLOB_CACHE_MAX_REFS
+    mappings are kept. Blobs are kept in a memory LRU bounded by BLOB_CACHE_MAX_BYTES and, if BLOB_CACHE_PATH
+    is set, in a SQLite database as well.
+    """
+
+    def __init__(self, max_bytes: int = BLOB_CACHE_MAX_BYTES, ref_ttl: float = BLOB_CACHE_REF_TTL,
+                 path: str = BLOB_CACHE_PATH, disk_max_bytes: int = BLOB_CACHE_DISK_MAX_BYTES,
+                 max_refs: int = BLOB_CACHE_MAX_REFS):
+        self.max_bytes = max_bytes
+        self.ref_ttl = ref_ttl
+        self.path = path
+        self.disk_max_bytes = disk_max_bytes
+        self.max_refs = max_refs
+        self._blobs: OrderedDict[Tuple[str, str], str] = OrderedDict()
+        self._size = 0
+        # ordered by the time the mapping was cached, so expired mappings are always at the front
+        self._refs: OrderedDict[Tuple[str, str, str], Tuple[str, float]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._connection: Optional[sqlite3.Connection] = None
+        self._disk_lock = threading.Lock()
+        # running size of the database, loaded on the first write and recounted after every eviction
+        self._disk_size: Optional[int] = None
+
+    def get(self, scope: str, ref: str, path: str) -> Optional[Tuple[str, str]]:
+        """Return (content, blob id) of the file at the ref, if it was read or written recently."""
+        if not BLOB_CACHE_ENABLED:
+            return None
+        key = (scope, ref, path)
+        with self._lock:
+            entry = self._refs.get(key)
+            if entry is None:
+                return None
+            blob_id, cached_at = entry
+            if time.time() - cached_at >= self.ref_ttl:
+                del self._refs[key]
+                return None
+        content = self.get_blob(scope, blob_id)
+        return None if content is None else (content, blob_id)
+
+    def get_blob(self, scope: str, blob_id: str) -> Optional[str]:
+        key = (scope, blob_id)
+        with self._lock:
+            if key in self._blobs:
+                self._blobs.move_to_end(key)
+                return self._blobs[key]
+        rows = self._execute(
+            "SELECT content, accessed_at FROM blobs WHERE scope = ? AND blob_id = ?", (scope, blob_id)
+        )
+        if not rows:
+            return None
+        content, accessed_at = rows[0]
+        now = time.time()
+        if now - (accessed_at or 0) > BLOB_CACHE_TOUCH_INTERVAL:
+            self._execute("UPDATE blobs SET accessed_at = ? WHERE scope = ? AND blob_id = ?", (now, scope, blob_id))
+        self._remember(key, content)
+        return content
+
+    def put(self, scope: str, ref: str, path: str, content: str, blob_id: Optional[str] = None) -> str:
+        """Cache the content of the file at the ref, returns its blob id."""
+        blob_id = blob_id or content_id(content)
+        if not BLOB_CACHE_ENABLED:
+            return blob_id
+        now = time.time()
+        with self._lock:
+            self._refs.pop((scope, ref, path), None)
+            self._refs[(scope, ref, path)] = (blob_id, now)
+            self._prune_refs(now)
+            known = (scope, blob_id) in self._blobs
+        if not known:
+            self._remember((scope, blob_id), content)
+            self._store(scope, blob_id, content)
+        return blob_id
+
+    def _prune_refs(self, now: float):
+        # called with the lock held, drops expired mappings and then the oldest ones over max_refs
+        while self._refs:
+            _, cached_at = next(iter(self._refs.values()))
+            if now - cached_at < self.ref_ttl and len(self._refs) <= self.max_refs:
+                break
+            self._refs.popitem(last=False)
+
+    def invalidate(self, scope: str, ref: str, path: Optional[str] = None):
+        """Forget which blob the path (all paths if None) of the ref points to."""
+        with self._lock:
+            for key in [key for key in self._refs if key[:2] == (scope, ref) and path in (None, key[2])]:
+                del self._refs[key]
+
+    def _remember(self, key: Tuple[str, str], content: str):
+        if len(content) > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._blobs:
+                return
+            self._blobs[key] = content
+            self._size += len(content)
+            while self._size > self.max_bytes:
+                _, evicted = self._blobs.popitem(last=False)
+                self._size -= len(evicted)
+
+    def _execute(self, query: str, params: tuple = ()) -> list:
+        if not self.path:
+            return []
+        with self._disk_lock:
+            try:
+                if self._connection is None:
+                    if os.path.dirname(self.path):
+                        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+                    self._connection = sqlite3.connect(self.path, check_same_thread=False)
+                    self._connection.execute(
+                        "CREATE TABLE IF NOT EXISTS blobs (scope TEXT, blob_id TEXT, content TEXT, "
+                        "accessed_at REAL, size INTEGER, PRIMARY KEY (scope, blob_id))"
+                    )
+                    self._connection.execute("CREATE INDEX IF NOT EXISTS blobs_accessed_at ON blobs (accessed_at)")
+                rows = self._connection.execute(query, params).fetchall()
+                self._connection.commit()
+                return rows
+            except sqlite3.Error as e:
+                logger.warning(f"Blob cache database is not available: {e}")
+                return []
+
+    def _store(self, scope: str, blob_id: str, content: str):
+        if not self.path:
+            return
+        self._execute(
+            "INSERT OR REPLACE INTO blobs VALUES (?, ?, ?, ?, ?)", (scope, blob_id, content, time.time(), len(content))
+        )
+        if self._disk_size is None:
+            self._disk_size = self._disk_total()
+        else:
+            # a replaced blob is counted twice, the next eviction recounts the real size
+            self._disk_size += len(content)
+        if self._disk_size > self.disk_max_bytes:
+            self._evict_disk()
+
+    def _disk_total(self) -> int:
+        rows = self._execute("SELECT COALESCE(SUM(size), 0) FROM blobs")
+        return rows[0][0] if rows else 0
+
+    def _evict_disk(self):
+        # keeps the most recently used blobs that fit into disk_max_bytes and drops the rest in one statement
+        self._execute(
+            "DELETE FROM blobs WHERE (scope, blob_id) IN ("
+            "SELECT scope, blob_id FROM (SELECT scope, blob_id, "
+            "SUM(size) OVER (ORDER BY accessed_at DESC, scope, blob_id) AS kept FROM blobs) WHERE kept > ?)",
+            (self.disk_max_bytes,)
+        )
+        self._disk_size = self._disk_total()
+
+    def clear(self):
+        with self._lock:
+            self._blobs.clear()
+            self._refs.clear()
+            self._size = 0
+        self._execute("DELETE FROM blobs")
+        self._disk_size = 0
+
+
+blob_cache = BlobCache()
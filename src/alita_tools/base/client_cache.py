@@ -0,0 +1,141 @@
+import asyncio
+import hashlib
+import logging
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, AsyncIterator, Callable, Dict, Iterable, Optional, Tuple
+
+import httpx
+import requests
+from requests.adapters import HTTPAdapter
+
+logger = logging.getLogger(__name__)
+
+CLIENT_CACHE_SIZE = int(os.getenv("ALITA_CLIENT_CACHE_SIZE", "64"))
+HTTP_POOL_CONNECTIONS = int(os.getenv("ALITA_HTTP_POOL_CONNECTIONS", "10"))
+HTTP_POOL_MAXSIZE = int(os.getenv("ALITA_HTTP_POOL_MAXSIZE", "20"))
+# timeout of async requests in seconds, by default none like the requests sessions of the sync paths
+HTTP_TIMEOUT = float(os.getenv("ALITA_HTTP_TIMEOUT", "0")) or None
+
+
+def credential_fingerprint(credentials: Iterable[Any]) -> str:
+    """Hash credentials so that cache keys never hold secrets in clear text."""
+    digest = hashlib.sha256()
+    for credential in credentials:
+        digest.update(repr(credential).encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def pooled_session(pool_connections: Optional[int] = None, pool_maxsize: Optional[int] = None) -> requests.Session:
+    """Create a requests session with keep-alive HTTP adapters of the configured pool size."""
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=pool_connections or HTTP_POOL_CONNECTIONS,
+        pool_maxsize=pool_maxsize or HTTP_POOL_MAXSIZE,
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def async_http_client(**kwargs) -> httpx.AsyncClient:
+    """Create an async HTTP client behaving like the sync sessions: same keep-alive connection limits,
+    no timeout unless ALITA_HTTP_TIMEOUT is set and redirects followed."""
+    kwargs.setdefault("limits", httpx.Limits(
+        max_connections=HTTP_POOL_MAXSIZE,
+        max_keepalive_connections=HTTP_POOL_CONNECTIONS,
+    ))
+    kwargs.setdefault("timeout", HTTP_TIMEOUT)
+    kwargs.setdefault("follow_redirects", True)
+    return httpx.AsyncClient(**kwargs)
+
+
+class LoopBoundAsyncClient:
+    """Async HTTP clients of one configuration, one per running event loop.
+
+    An httpx.AsyncClient keeps its connections on the loop it was first used on, so a client shared by
+    cached wrappers must not be reused from another loop. Clients are created lazily and closed when their
+    loop shuts down its async generators, as `asyncio.run` does; clients of loops closed otherwise are
+    dropped on the next `get`.
+    """
+
+    def __init__(self, **kwargs):
+        self._kwargs = kwargs
+        # loop -> (client, async generator closing the client on loop shutdown)
+        self._clients: Dict[asyncio.AbstractEventLoop, Tuple[httpx.AsyncClient, AsyncIterator]] = {}
+        self._lock = threading.Lock()
+
+    def get(self) -> httpx.AsyncClient:
+        """Return the client of the running event loop, must be called from a coroutine."""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            for closed_loop in [other for other in self._clients if other.is_closed()]:
+                del self._clients[closed_loop]
+            entry = self._clients.get(loop)
+            if entry is None:
+                client = async_http_client(**self._kwargs)
+                closer = self._close_on_shutdown(loop, client)
+                entry = self._clients[loop] = (client, closer)
+                # the first iteration registers the generator with the loop, so loop.shutdown_asyncgens closes it
+                loop.create_task(closer.__anext__())
+        return entry[0]
+
+    async def _close_on_shutdown(self, loop: asyncio.AbstractEventLoop,
+                                 client: httpx.AsyncClient) -> AsyncIterator[None]:
+        try:
+            yield
+        finally:
+            with self._lock:
+                if loop in self._clients and self._clients[loop][0] is client:
+                    del self._clients[loop]
+            await client.aclose()
+
+
+class ClientCache:
+    """Thread-safe LRU cache of API clients keyed by (toolkit type, url, credential fingerprint).
+
+    Wrapper instances configured with the same credentials share one client and its warm
+    connection pool. Evicted clients are only dropped from the cache, wrappers still holding
+    them keep working until they are garbage collected.
+    """
+
+    def __init__(self, maxsize: int = CLIENT_CACHE_SIZE):
+        self.maxsize = maxsize
+        self._clients: OrderedDict[tuple, Any] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, toolkit_type: str, url: str, credentials: Iterable[Any], factory: Callable[[], Any]) -> Any:
+        key = (toolkit_type, url, credential_fingerprint(credentials))
+        with self._lock:
+            if key in self._clients:
+                self._clients.move_to_end(key)
+                return self._clients[key]
+        # the factory may do network calls, so it is not run under the lock
+        client = factory()
+        with self._lock:
+            if key in self._clients:
+                # another thread created the same client meanwhile
+                self._clients.move_to_end(key)
+                return self._clients[key]
+            self._clients[key] = client
+            while len(self._clients) > self.maxsize:
+                evicted_key, _ = self._clients.popitem(last=False)
+                logger.debug(f"Evicted {evicted_key[0]} client for {evicted_key[1]} from the client cache")
+        return client
+
+    def clear(self):
+        with self._lock:
+            self._clients.clear()
+
+    def __len__(self):
+        return len(self._clients)
+
+
+client_cache = ClientCache()
+
+
+def get_cached_client(toolkit_type: str, url: str, credentials: Iterable[Any], factory: Callable[[], Any]) -> Any:
+    """Return the shared client for the given toolkit type, url and credentials, creating it on a miss."""
+    return client_cache.get(toolkit_type, url, credentials, factory)
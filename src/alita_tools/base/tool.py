@@ -1,11 +1,12 @@
-
 from typing import Optional, Type, Any
 
-from langchain_core.callbacks import CallbackManagerForToolRun
+from langchain_core.callbacks import AsyncCallbackManagerForToolRun, CallbackManagerForToolRun
 from pydantic import BaseModel
 from pydantic import Field
 from langchain_core.tools import BaseTool
 
+from .api_wrapper import BaseToolApiWrapper, run_in_tools_executor
+
 
 class BaseAction(BaseTool):
     """Tool for interacting with the Confluence API."""
@@ -23,3 +24,14 @@ class BaseAction(BaseTool):
     ) -> str:
         """Use the Confluence API to run an operation."""
         return self.api_wrapper.run(self.name, *args, **kwargs)
+
+    async def _arun(
+        self,
+        *args: Any,
+        run_manager: Optional[AsyncCallbackManagerForToolRun] = None,
+        **kwargs: Any,
+    ) -> str:
+        """Use the API wrapper to run an operation without blocking the event loop."""
+        if isinstance(self.api_wrapper, BaseToolApiWrapper):
+            return await self.api_wrapper.arun(self.name, *args, **kwargs)
+        return await run_in_tools_executor(self.api_wrapper.run, self.name, *args, **kwargs)
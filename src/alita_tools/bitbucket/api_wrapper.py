@@ -6,6 +6,7 @@ from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
 from langchain_core.tools import ToolException
 from pydantic import BaseModel, model_validator
+from ..base.blob_cache import blob_cache, blob_scope
 from .bitbucket_constants import create_pr_data
 from .cloud_api_wrapper import BitbucketCloudApi, BitbucketServerApi
 
@@ -67,6 +68,9 @@ class BitbucketAPIWrapper(BaseModel):
         values['active_branch'] = values.get('branch')
         return values
 
+    def _blob_scope(self) -> str:
+        return blob_scope("bitbucket", self.url, f"{self.project}/{self.repository}", (self.username, self.password))
+
     def set_active_branch(self, branch: str) -> None:
         """Set the active branch for the bot."""
         self.active_branch = branch
@@ -119,6 +123,7 @@ class BitbucketAPIWrapper(BaseModel):
         """
         try:
             self.bitbucket.create_file(file_path=file_path, file_contents=file_contents, branch=branch)
+            blob_cache.put(self._blob_scope(), branch, file_path, file_contents)
             return f"File has been created: {file_path}."
         except Exception as e:
             return ToolException(f"File was not created due to error: {str(e)}")
@@ -135,6 +140,7 @@ class BitbucketAPIWrapper(BaseModel):
         """
         try:
             self.bitbucket.update_file(file_path=file_path, file_contents=file_contents, branch=branch)
+            blob_cache.put(self._blob_scope(), branch, file_path, file_contents)
             return f"File has been updated: {file_path}."
         except Exception as e:
             return ToolException(f"File was not updated due to error: {str(e)}")
@@ -148,7 +154,13 @@ class BitbucketAPIWrapper(BaseModel):
         Returns:
             str: The file decoded as a string
         """
+        cached = blob_cache.get(self._blob_scope(), branch, file_path)
+        if cached is not None:
+            return cached[0]
         try:
-            return self.bitbucket.get_file(file_path=file_path, branch=branch)
+            content = self.bitbucket.get_file(file_path=file_path, branch=branch)
         except Exception as e:
             raise ToolException(f"Can't extract file content (`{file_path}`) due to error:\n{str(e)}")
+        if isinstance(content, str):
+            blob_cache.put(self._blob_scope(), branch, file_path, content)
+        return content
@@ -0,0 +1,202 @@
+import asyncio
+import atexit
+import functools
+import logging
+import os
+import re
+import threading
+from concurrent.futures import Future, as_completed
+from typing import Iterator, List, Optional
+
+import httpx
+from langchain_core.documents import Document
+
+from ..base.client_cache import async_http_client
+from .page_cache import PAGE_CACHE_ENABLED, page_cache
+
+logger = logging.getLogger(__name__)
+
+BROWSER_POOL_SIZE = int(os.getenv("ALITA_BROWSER_POOL_SIZE", "4"))
+BROWSER_PAGE_TIMEOUT = float(os.getenv("ALITA_BROWSER_PAGE_TIMEOUT", "30"))
+# static pages are served by a plain HTTP fetch, the browser only renders pages which need javascript
+BROWSER_STATIC_FETCH = os.getenv("ALITA_BROWSER_STATIC_FETCH", "true").lower() == "true"
+# pages with less visible text than this are considered rendered by javascript
+STATIC_PAGE_MIN_TEXT = 500
+
+_NOT_VISIBLE_PATTERN = re.compile(r'<(script|style|noscript|template)\b.*?</\1\s*>|<[^>]+>', re.DOTALL | re.IGNORECASE)
+_NEEDS_JS_PATTERN = re.compile(r'enable javascript|requires javascript|javascript is (disabled|required)', re.IGNORECASE)
+
+
+def _is_static_page(response: httpx.Response) -> bool:
+    if response.status_code != 200 or "text/html" not in response.headers.get("content-type", ""):
+        return False
+    html = response.text
+    if _NEEDS_JS_PATTERN.search(html):
+        return False
+    return len(" ".join(_NOT_VISIBLE_PATTERN.sub(" ", html).split())) >= STATIC_PAGE_MIN_TEXT
+
+
+class BrowserPool:
+    """Long-lived headless Chromium shared by the browser tools.
+
+    The browser runs on a dedicated event loop thread and is launched on first use, so no Chromium process is
+    launched per tool call. Every render gets a fresh browser context, closed right after, so cookies, storage and
+    logged-in sessions never leak between fetches of different tools or credentials; at most `size` pages are
+    rendered at the same time.
+    """
+
+    def __init__(self, size: int = BROWSER_POOL_SIZE, timeout: float = BROWSER_PAGE_TIMEOUT,
+                 static_fetch: bool = BROWSER_STATIC_FETCH):
+        self.size = size
+        self.timeout = timeout
+        self.static_fetch = static_fetch
+        self._lock = threading.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._playwright = None
+        self._browser = None
+        self._render_slots: Optional[asyncio.Semaphore] = None
+        self._http_client: Optional[httpx.AsyncClient] = None
+        self._start_lock: Optional[asyncio.Lock] = None
+
+    def _get_loop(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                threading.Thread(target=loop.run_forever, name="alita-browser-pool", daemon=True).start()
+                self._loop = loop
+                atexit.register(self.close)
+            return self._loop
+
+    async def _start(self):
+        # runs on the pool loop only, so the lock can be created without synchronization
+        if self._start_lock is None:
+            self._start_lock = asyncio.Lock()
+        async with self._start_lock:
+            if self._browser is not None:
+                return
+            from playwright.async_api import async_playwright
+
+            self._playwright = await async_playwright().start()
+            self._browser = await self._playwright.chromium.launch(headless=True)
+            self._http_client = async_http_client(follow_redirects=True)
+            self._render_slots = asyncio.Semaphore(self.size)
+
+    async def _render(self, url: str, timeout: float) -> str:
+        async with self._render_slots:
+            context = await self._browser.new_context()
+            try:
+                page = await context.new_page()
+                await page.goto(url, timeout=timeout * 1000)
+                return await page.content()
+            finally:
+                await context.close()
+
+    @staticmethod
+    async def _in_executor(func, *args):
+        # page cache calls do SQLite I/O, they must not block the pool loop
+        return await asyncio.get_running_loop().run_in_executor(None, func, *args)
+
+    async def _fetch(self, url: str, timeout: float) -> Document:
+        # the plain fetch and the render share one deadline, a url never takes longer than the timeout
+        deadline = asyncio.get_running_loop().time() + timeout
+
+        def remaining() -> float:
+            left = deadline - asyncio.get_running_loop().time()
+            if left <= 0:
+                raise TimeoutError(f"Fetching {url} timed out after {timeout} seconds")
+            return left
+
+        try:
+            cached = await self._in_executor(page_cache.get, url) if PAGE_CACHE_ENABLED else None
+            if cached is not None and cached.is_fresh:
+                return Document(page_content=cached.content.decode("utf-8", errors="replace"),
+                                metadata={"source": url})
+            response = None
+            if self.static_fetch or (cached is not None and cached.revalidation_headers()):
+                try:
+                    headers = cached.revalidation_headers() if cached is not None else {}
+                    response = await self._http_client.get(url, timeout=remaining(), headers=headers)
+                    if cached is not None and response.status_code == 304:
+                        await self._in_executor(page_cache.revalidated, url)
+                        return Document(page_content=cached.content.decode("utf-8", errors="replace"),
+                                        metadata={"source": url})
+                    if self.static_fetch and _is_static_page(response):
+                        await self._cache_page(url, response.text, response)
+                        return Document(page_content=response.text, metadata={"source": url})
+                except httpx.HTTPError as e:
+                    logger.debug(f"Plain fetch of {url} failed, rendering it in the browser: {e}")
+            html = await self._render(url, remaining())
+            await self._cache_page(url, html, response)
+            return Document(page_content=html, metadata={"source": url})
+        except Exception as e:
+            # same as AsyncChromiumLoader, a failed page does not fail the whole batch
+            return Document(page_content=f"Error: {e}", metadata={"source": url})
+
+    async def _cache_page(self, url: str, html: str, response: Optional[httpx.Response]):
+        if not PAGE_CACHE_ENABLED:
+            return
+        # validators of the plain response revalidate the rendered page as well
+        headers = response.headers if response is not None and response.status_code == 200 else {}
+        await self._in_executor(functools.partial(
+            page_cache.put, url, html.encode("utf-8"), "text/html", etag=headers.get("etag"),
+            last_modified=headers.get("last-modified")
+        ))
+
+    async def afetch(self, urls: List[str], timeout: Optional[float] = None) -> List[Document]:
+        await self._start()
+        return list(await asyncio.gather(*(self._fetch(url, timeout or self.timeout) for url in urls)))
+
+    def fetch(self, urls: List[str], timeout: Optional[float] = None) -> List[Document]:
+        """Fetch the HTML of the urls concurrently, documents are returned in the order of urls."""
+        return asyncio.run_coroutine_threadsafe(self.afetch(urls, timeout), self._get_loop()).result()
+
+    def submit(self, urls: List[str], timeout: Optional[float] = None) -> List[Future]:
+        """Start fetching the HTML of the urls concurrently, returns a future of the document of every url."""
+        loop = self._get_loop()
+        asyncio.run_coroutine_threadsafe(self._start(), loop).result()
+        return [asyncio.run_coroutine_threadsafe(self._fetch(url, timeout or self.timeout), loop) for url in urls]
+
+    def fetch_as_completed(self, urls: List[str], timeout: Optional[float] = None) -> Iterator[Document]:
+        """Fetch the HTML of the urls concurrently, yielding every document as soon as it is fetched.
+
+        Fetches still running when the consumer stops iterating are cancelled.
+        """
+        futures = self.submit(urls, timeout)
+        try:
+            for future in as_completed(futures):
+                yield future.result()
+        finally:
+            for future in futures:
+                future.cancel()
+
+    async def _aclose(self):
+        if self._browser is not None:
+            await self._browser.close()
+            await self._playwright.stop()
+            await self._http_client.aclose()
+            self._browser = None
+
+    def close(self):
+        if self._loop is not None and self._loop.is_running():
+            try:
+                asyncio.run_coroutine_threadsafe(self._aclose(), self._loop).result(timeout=10)
+            except Exception as e:
+                logger.debug(f"Failed to close the browser pool: {e}")
+
+
+browser_pool = BrowserPool()
+
+
+def fetch_pages(urls: List[str], timeout: Optional[float] = None) -> List[Document]:
+    """Fetch pages through the shared browser pool."""
+    return browser_pool.fetch(urls, timeout)
+
+
+def submit_page_fetches(urls: List[str], timeout: Optional[float] = None) -> List[Future]:
+    """Start fetching pages through the shared browser pool, returns a future of every page."""
+    return browser_pool.submit(urls, timeout)
+
+
+def fetch_pages_as_completed(urls: List[str], timeout: Optional[float] = None) -> Iterator[Document]:
+    """Fetch pages through the shared browser pool in the order they complete."""
+    return browser_pool.fetch_as_completed(urls, timeout)
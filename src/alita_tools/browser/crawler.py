@@ -2,9 +2,10 @@ from json import loads
 from typing import Type
 
 from langchain_core.tools import BaseTool
-from pydantic import create_model, BaseModel
+from pydantic import create_model, BaseModel, PrivateAttr
 from pydantic.fields import FieldInfo
 from .utils import get_page, webRag, getPDFContent
+from .vector_index import SessionVectorIndex
 
 CrawlerModel = create_model(
     "SingleURLCrawlerModel",
@@ -31,10 +32,11 @@ class MultiURLCrawler(BaseTool):
     args_schema: Type[BaseModel] = create_model("MultiURLCrawlerModel",
                                                 query=(str, FieldInfo(description="Query text to search pages")),
                                                 urls=(list[str], FieldInfo(description="list of URLs to search like ['url1', 'url2']")))
+    _index: SessionVectorIndex = PrivateAttr(default_factory=SessionVectorIndex)
 
     def _run(self, query: str, urls: list[str], run_manager=None):
         urls = [url.strip() for url in urls]
-        return webRag(urls, self.max_response_size, query)
+        return webRag(urls, self.max_response_size, query, self._index, early_stop=True)
 
 
 class GetHTMLContent(BaseTool):
@@ -1,15 +1,12 @@
-from langchain_community.document_loaders import AsyncChromiumLoader
 from langchain_community.document_transformers import BeautifulSoupTransformer
 from langchain.text_splitter import CharacterTextSplitter
 from duckduckgo_search import DDGS
 from langchain_core.tools import BaseTool
 
-from langchain_chroma import Chroma
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 
-from langchain_community.embeddings.sentence_transformer import (
-    SentenceTransformerEmbeddings,
-)
+from .browser_pool import fetch_pages
+from .vector_index import SessionVectorIndex
 
 class searchPages(BaseModel):
     query: str = Field(..., title="Query text to search pages")
@@ -19,6 +16,7 @@ class DuckDuckGoSearch(BaseTool):
     max_response_size: int = 3000
     description: str = "Searches DuckDuckGo for the query and returns the top 5 results, and them provide summary documents"
     args_schema = searchPages
+    _index: SessionVectorIndex = PrivateAttr(default_factory=SessionVectorIndex)
 
     def _run(self, query: str, run_manager=None):
         default_k = 5
@@ -30,9 +28,8 @@ class DuckDuckGoSearch(BaseTool):
 
         text_splitter = CharacterTextSplitter(chunk_size=1000, chunk_overlap=0)
         docs = text_splitter.split_documents(self.get_page(urls))
-        embedding_function = SentenceTransformerEmbeddings(model_name="all-MiniLM-L6-v2")
-        db = Chroma.from_documents(docs, embedding_function)
-        docs = db.search(query, "mmr", k=10)
+        self._index.add_documents(docs)
+        docs = self._index.search(query, urls, k=10)
         text = ""
         for doc in docs:
             text += f"\n\n{doc.page_content}"
@@ -42,8 +39,7 @@ class DuckDuckGoSearch(BaseTool):
 
     # retrieves pages and extracts text by tag
     def get_page(self, urls):
-        loader = AsyncChromiumLoader(urls)
-        html = loader.load()
+        html = fetch_pages(urls)
         bs_transformer = BeautifulSoupTransformer()
         docs_transformed = bs_transformer.transform_documents(html, tags_to_extract=["p"], remove_unwanted_tags=["a"])
 
@@ -2,10 +2,11 @@
 
 from langchain_core.tools import BaseTool
 from typing import Type
-from pydantic import create_model, BaseModel
+from pydantic import create_model, BaseModel, PrivateAttr
 from pydantic.fields import FieldInfo
 from langchain_community.utilities.google_search import GoogleSearchAPIWrapper
 from .utils import webRag
+from .vector_index import SessionVectorIndex
 
 
 class GoogleSearchResults(BaseTool):
@@ -36,6 +37,7 @@ class GoogleSearchRag(BaseTool):
     args_schema: Type[BaseModel] = create_model(
         "GoogleSearchRagModel",
         query=(str, FieldInfo(description="Query text to search pages")))
+    _index: SessionVectorIndex = PrivateAttr(default_factory=SessionVectorIndex)
 
     def _run(self, query: str, run_manager=None) -> str:
         results = self.googleApiWrapper.results(query, self.num_results)
@@ -44,6 +46,6 @@ class GoogleSearchRag(BaseTool):
         for result in results:
             urls.append(result['link'])
             snippets += f"\n\n{result['title']}\n{result['snippet']}"
-        return snippets + webRag(urls, self.max_response_size, query)
+        return snippets + webRag(urls, self.max_response_size, query, self._index)
         
 
@@ -0,0 +1,186 @@
+import logging
+import os
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from typing import Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+logger = logging.getLogger(__name__)
+
+PAGE_CACHE_PATH = os.getenv(
+    "ALITA_BROWSER_CACHE_PATH", os.path.join(os.path.expanduser("~"), ".cache", "alita_tools", "browser_pages.sqlite3")
+)
+# cached pages younger than the TTL are served without any request, older ones are revalidated
+PAGE_CACHE_TTL = float(os.getenv("ALITA_BROWSER_CACHE_TTL", "3600"))
+PAGE_CACHE_MAX_BYTES = int(os.getenv("ALITA_BROWSER_CACHE_MAX_BYTES", str(256 * 1024 * 1024)))
+PAGE_CACHE_ENABLED = os.getenv("ALITA_BROWSER_CACHE", "true").lower() == "true"
+# LRU order only needs to be approximate, accessed_at is rewritten at most once per interval per entry
+PAGE_CACHE_TOUCH_INTERVAL = 60.0
+
+_DEFAULT_PORTS = {"http": 80, "https": 443}
+
+
+def normalize_url(url: str) -> str:
+    """Normalize the url so that equivalent urls share one cache entry, credentials in the url are dropped."""
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower()
+    netloc = (parts.hostname or "").lower()
+    if parts.port and parts.port != _DEFAULT_PORTS.get(scheme):
+        netloc = f"{netloc}:{parts.port}"
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    return urlunsplit((scheme, netloc, parts.path or "/", query, ""))
+
+
+def cache_key(url: str, kind: str) -> str:
+    """Key of the cached entry, the rendered HTML and the PDF text of one url are kept apart."""
+    return f"{kind}:{normalize_url(url)}"
+
+
+@dataclass
+class CachedPage:
+    url: str
+    content: bytes
+    content_type: Optional[str]
+    text: Optional[str]
+    etag: Optional[str]
+    last_modified: Optional[str]
+    fetched_at: float
+
+    @property
+    def is_fresh(self) -> bool:
+        return time.time() - self.fetched_at < PAGE_CACHE_TTL
+
+    def revalidation_headers(self) -> dict:
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class PageCache:
+    """Persistent cache of fetched pages and PDFs keyed by content kind ("html" or "pdf") and normalized url.
+
+    Entries hold the raw bytes, the extracted text and the ETag/Last-Modified validators of the response.
+    Entries older than PAGE_CACHE_TTL are revalidated with a conditional request, the least recently used
+    entries are evicted once the cache grows over PAGE_CACHE_MAX_BYTES. If the database can not be opened,
+    e.g. the cache directory is not writable, the cache is disabled and every page is fetched.
+    """
+
+    def __init__(self, path: str = PAGE_CACHE_PATH, max_bytes: int = PAGE_CACHE_MAX_BYTES):
+        self.path = path
+        self.max_bytes = max_bytes
+        self._connection: Optional[sqlite3.Connection] = None
+        self._disabled = False
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "stale": 0, "misses": 0, "revalidated": 0, "evictions": 0}
+        self._stats_lock = threading.Lock()
+        # running size of the cache, loaded on the first put and recounted after every eviction
+        self._total_bytes: Optional[int] = None
+
+    def _count(self, name: str, value: int = 1):
+        with self._stats_lock:
+            self._stats[name] += value
+
+    def _connect(self) -> Optional[sqlite3.Connection]:
+        if self._connection is None and not self._disabled:
+            try:
+                if os.path.dirname(self.path):
+                    os.makedirs(os.path.dirname(self.path), exist_ok=True)
+                connection = sqlite3.connect(self.path, check_same_thread=False)
+                connection.execute(
+                    "CREATE TABLE IF NOT EXISTS pages ("
+                    "url TEXT PRIMARY KEY, content BLOB, content_type TEXT, text TEXT, etag TEXT, "
+                    "last_modified TEXT, fetched_at REAL, accessed_at REAL, size INTEGER)"
+                )
+                connection.execute("CREATE INDEX IF NOT EXISTS pages_accessed_at ON pages (accessed_at)")
+                connection.commit()
+                self._connection = connection
+            except (sqlite3.Error, OSError) as e:
+                logger.warning(f"Browser page cache is disabled, {self.path} can not be opened: {e}")
+                self._disabled = True
+        return self._connection
+
+    def _execute(self, query: str, params: tuple = (), rowcount: bool = False):
+        """Run the query, returning the fetched rows or, with `rowcount`, the number of changed rows."""
+        with self._lock:
+            try:
+                connection = self._connect()
+                if connection is None:
+                    return 0 if rowcount else []
+                cursor = connection.execute(query, params)
+                rows = cursor.fetchall()
+                connection.commit()
+                return cursor.rowcount if rowcount else rows
+            except sqlite3.Error as e:
+                logger.warning(f"Browser page cache is not available: {e}")
+                return 0 if rowcount else []
+
+    def get(self, url: str, kind: str = "html") -> Optional[CachedPage]:
+        """Return the cached page, fresh or not, counting a hit for fresh pages and a stale read otherwise."""
+        key = cache_key(url, kind)
+        rows = self._execute(
+            "SELECT content, content_type, text, etag, last_modified, fetched_at, accessed_at FROM pages "
+            "WHERE url = ?", (key,)
+        )
+        if not rows:
+            self._count("misses")
+            return None
+        *columns, accessed_at = rows[0]
+        now = time.time()
+        if now - (accessed_at or 0) > PAGE_CACHE_TOUCH_INTERVAL:
+            self._execute("UPDATE pages SET accessed_at = ? WHERE url = ?", (now, key))
+        page = CachedPage(normalize_url(url), *columns)
+        self._count("hits" if page.is_fresh else "stale")
+        return page
+
+    def put(self, url: str, content: bytes, content_type: Optional[str] = None, text: Optional[str] = None,
+            etag: Optional[str] = None, last_modified: Optional[str] = None, kind: str = "html"):
+        now = time.time()
+        size = len(content) + len(text or "")
+        self._execute(
+            "INSERT OR REPLACE INTO pages VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (cache_key(url, kind), content, content_type, text, etag, last_modified, now, now, size)
+        )
+        if self._total_bytes is None:
+            self._total_bytes = self._size()
+        else:
+            # a replaced entry is counted twice, the next eviction recounts the real size
+            self._total_bytes += size
+        if self._total_bytes > self.max_bytes:
+            self._evict()
+
+    def revalidated(self, url: str, kind: str = "html"):
+        """Mark the cached page as fresh again after a 304 Not Modified response."""
+        self._count("revalidated")
+        self._execute("UPDATE pages SET fetched_at = ? WHERE url = ?", (time.time(), cache_key(url, kind)))
+
+    def _size(self) -> int:
+        rows = self._execute("SELECT COALESCE(SUM(size), 0) FROM pages")
+        return rows[0][0] if rows else 0
+
+    def _evict(self):
+        # keeps the most recently used entries that fit into max_bytes and drops the rest in one statement
+        evicted = self._execute(
+            "DELETE FROM pages WHERE url IN ("
+            "SELECT url FROM (SELECT url, SUM(size) OVER (ORDER BY accessed_at DESC, url) AS kept FROM pages) "
+            "WHERE kept > ?)",
+            (self.max_bytes,), rowcount=True
+        )
+        self._count("evictions", evicted)
+        self._total_bytes = self._size()
+
+    def stats(self) -> dict:
+        """Counters of this process; a stale entry revalidated with 304 counts as stale and as a revalidation."""
+        with self._stats_lock:
+            return dict(self._stats)
+
+    def clear(self):
+        self._execute("DELETE FROM pages")
+        self._total_bytes = 0
+
+
+page_cache = PageCache()
@@ -1,20 +1,64 @@
+import logging
+import multiprocessing
+import os
 import re
+import tempfile
+import threading
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from typing import Iterator, Optional, Tuple
+
 import requests
-from langchain_community.document_loaders import AsyncChromiumLoader
+from langchain_core.documents import Document
 from langchain_community.document_transformers import BeautifulSoupTransformer
 from langchain.text_splitter import CharacterTextSplitter
 import fitz
 
-from langchain_chroma import Chroma
+from .browser_pool import fetch_pages, submit_page_fetches
+from .page_cache import PAGE_CACHE_ENABLED, page_cache
+from .vector_index import SessionVectorIndex
+
+logger = logging.getLogger(__name__)
+
+PDF_MAX_BYTES = int(os.getenv("ALITA_PDF_MAX_BYTES", str(50 * 1024 * 1024)))
+PDF_DOWNLOAD_TIMEOUT = float(os.getenv("ALITA_PDF_DOWNLOAD_TIMEOUT", "60"))
+# 0 means the whole document text is returned
+PDF_MAX_CHARS = int(os.getenv("ALITA_PDF_MAX_CHARS", "0"))
+PDF_CHUNK_SIZE = 1024 * 1024
+# documents with at least this many pages are extracted by a pool of processes
+PDF_PARALLEL_MIN_PAGES = 64
+PDF_PAGES_PER_TASK = 16
+PDF_EXTRACT_WORKERS = min(os.cpu_count() or 1, 4)
+HTML_EXTRACT_WORKERS = int(os.getenv("ALITA_HTML_EXTRACT_WORKERS", str(min(os.cpu_count() or 1, 4))))
+# min relevance score of a chunk to count towards max_response_size when webRag stops early
+WEB_RAG_MIN_RELEVANCE = float(os.getenv("ALITA_WEB_RAG_MIN_RELEVANCE", "0.5"))
+
+# worker processes are spawned, forking a process running the browser pool and HTTP client threads is unsafe.
+# A spawned worker re-imports the __main__ module of the parent, so scripts calling these tools must keep their
+# entry point under an `if __name__ == "__main__":` guard, otherwise every worker runs the script again.
+_POOL_CONTEXT = multiprocessing.get_context("spawn")
+_extraction_pool: Optional[ProcessPoolExecutor] = None
+_extraction_pool_lock = threading.Lock()
+_pdf_pool: Optional[ProcessPoolExecutor] = None
+_pdf_pool_lock = threading.Lock()
+
+
+def _extract_paragraphs(html: Document) -> Document:
+    # module level function, so that it can run in the extraction process pool
+    bs_transformer = BeautifulSoupTransformer()
+    return bs_transformer.transform_documents([html], tags_to_extract=["p"], remove_unwanted_tags=["a"])[0]
+
+
+def _get_extraction_pool() -> ProcessPoolExecutor:
+    global _extraction_pool
+    with _extraction_pool_lock:
+        if _extraction_pool is None:
+            _extraction_pool = ProcessPoolExecutor(max_workers=HTML_EXTRACT_WORKERS, mp_context=_POOL_CONTEXT)
+        return _extraction_pool
 
-from langchain_community.embeddings.sentence_transformer import (
-    SentenceTransformerEmbeddings,
-)
 
 # retrieves pages and extracts text by tag
 def get_page(urls, html_only=False):
-    loader = AsyncChromiumLoader(urls)
-    html = loader.load()
+    html = fetch_pages(urls)
     if html_only:
         body = []
         # Regular expression to match <style></style> and <script></script> tags and their content
@@ -29,12 +73,46 @@ def get_page(urls, html_only=False):
     return docs_transformed
 
 
-def webRag(urls, max_response_size, query):
+def iter_pages(urls) -> Iterator[Document]:
+    """Yield paragraphs text of the pages as soon as every page is fetched and parsed.
+
+    Pages are fetched concurrently, HTML parsing runs in a process pool while other pages are still downloading.
+    """
+    pool = _get_extraction_pool()
+    fetches = set(submit_page_fetches(urls))
+    parses = set()
+    try:
+        # wakes up on whichever finishes first, a fetched page is parsed and a parsed page is yielded right away
+        while fetches or parses:
+            done, _ = wait(fetches | parses, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future in fetches:
+                    fetches.remove(future)
+                    parses.add(pool.submit(_extract_paragraphs, future.result()))
+                else:
+                    parses.remove(future)
+                    yield future.result()
+    finally:
+        for future in fetches | parses:
+            future.cancel()
+
+
+def webRag(urls, max_response_size, query, index: Optional[SessionVectorIndex] = None, early_stop: bool = False):
     text_splitter = CharacterTextSplitter(chunk_size=1000, chunk_overlap=0)
-    docs = text_splitter.split_documents(get_page(urls))
-    embedding_function = SentenceTransformerEmbeddings(model_name="all-MiniLM-L6-v2")
-    db = Chroma.from_documents(docs, embedding_function)
-    docs = db.search(query, "mmr", k=10)
+    # a tool passes its own index, so chunks embedded in previous calls are reused
+    index = index or SessionVectorIndex()
+    indexed_urls = []
+    # the query is embedded once for the early stop checks and the final search
+    query_embedding = index.embed_query(query)
+    # chunks of a page are embedded while the following pages are still being fetched and parsed
+    for page in iter_pages(urls):
+        index.add_documents(text_splitter.split_documents([page]))
+        indexed_urls.append(page.metadata["source"])
+        if early_stop and index.relevant_size(query, indexed_urls, WEB_RAG_MIN_RELEVANCE,
+                                              embedding=query_embedding) > max_response_size:
+            # enough relevant content is found, the rest of the pages are not waited for
+            break
+    docs = index.search(query, indexed_urls, k=10, embedding=query_embedding)
     text = ""
     for doc in docs:
         text += f"\n\n{doc.page_content}"
@@ -43,22 +121,87 @@ def webRag(urls, max_response_size, query):
     return text
 
 
-def getPDFContent(url):
-    response = requests.get(url)
-    # Check if the request was successful
-    if response.status_code == 200:
-        # Open the PDF from the bytes in memory
-        pdf = fitz.open(stream=response.content, filetype="pdf")
-        text_content = ''
-        # Extract text from each page
-        for page_num in range(len(pdf)):
-            page = pdf[page_num]
-            text_content += page.get_text()
-        
-        # Close the PDF after extracting text
-        pdf.close()
-        
+def _extract_pdf_pages(path: str, start: int, stop: int) -> str:
+    # runs in a worker process, PyMuPDF documents can not be shared between threads
+    with fitz.open(path) as pdf:
+        return "".join(pdf[page_num].get_text() for page_num in range(start, stop))
+
+
+def _get_pdf_pool() -> ProcessPoolExecutor:
+    global _pdf_pool
+    with _pdf_pool_lock:
+        if _pdf_pool is None:
+            _pdf_pool = ProcessPoolExecutor(max_workers=PDF_EXTRACT_WORKERS, mp_context=_POOL_CONTEXT)
+        return _pdf_pool
+
+
+def _extract_pdf_text(path: str, pages: Optional[range], max_chars: Optional[int]) -> Tuple[str, bool]:
+    """Extract text of the pages, stopping once max_chars are collected; returns the text and whether it is complete."""
+    with fitz.open(path) as pdf:
+        page_count = len(pdf)
+        pages = range(page_count) if pages is None else range(pages.start, min(pages.stop, page_count))
+        if len(pages) < PDF_PARALLEL_MIN_PAGES:
+            texts = []
+            size = 0
+            for page_num in pages:
+                texts.append(pdf[page_num].get_text())
+                size += len(texts[-1])
+                if max_chars and size >= max_chars:
+                    return "".join(texts)[:max_chars], False
+            return "".join(texts), len(pages) == page_count
+    # big documents: page ranges are extracted in parallel processes, results are consumed in page order
+    ranges = [(start, min(start + PDF_PAGES_PER_TASK, pages.stop)) for start in range(pages.start, pages.stop, PDF_PAGES_PER_TASK)]
+    texts = []
+    size = 0
+    futures = [_get_pdf_pool().submit(_extract_pdf_pages, path, start, stop) for start, stop in ranges]
+    try:
+        for future in futures:
+            texts.append(future.result())
+            size += len(texts[-1])
+            if max_chars and size >= max_chars:
+                return "".join(texts)[:max_chars], False
+    finally:
+        # the pool is shared, page ranges not needed anymore are not left queued in it
+        for pending in futures:
+            pending.cancel()
+    return "".join(texts), len(pages) == page_count
+
+
+def getPDFContent(url, pages: Optional[range] = None, max_chars: Optional[int] = PDF_MAX_CHARS or None):
+    use_cache = PAGE_CACHE_ENABLED and pages is None
+    cached = page_cache.get(url, kind="pdf") if use_cache else None
+    if cached is not None and cached.text is not None and cached.is_fresh:
+        return cached.text[:max_chars] if max_chars else cached.text
+    headers = cached.revalidation_headers() if cached is not None else {}
+    with requests.get(url, headers=headers, stream=True, timeout=PDF_DOWNLOAD_TIMEOUT) as response:
+        if cached is not None and cached.text is not None and response.status_code == 304:
+            page_cache.revalidated(url, kind="pdf")
+            return cached.text[:max_chars] if max_chars else cached.text
+        # Check if the request was successful
+        if response.status_code != 200:
+            logger.error(f"Failed to download PDF {url}. Status code: {response.status_code}")
+            return None
+        if int(response.headers.get('content-length') or 0) > PDF_MAX_BYTES:
+            logger.error(f"PDF {url} is larger than {PDF_MAX_BYTES} bytes, it is not downloaded")
+            return None
+        # the PDF is streamed into a temporary file, PyMuPDF reads the pages it needs from disk. The file is
+        # closed before it is read, Windows does not let workers reopen a file that is still open for writing
+        pdf_file = tempfile.NamedTemporaryFile(suffix='.pdf', delete=False)
+        try:
+            with pdf_file:
+                downloaded = 0
+                for chunk in response.iter_content(chunk_size=PDF_CHUNK_SIZE):
+                    downloaded += len(chunk)
+                    if downloaded > PDF_MAX_BYTES:
+                        logger.error(f"PDF {url} is larger than {PDF_MAX_BYTES} bytes, download is stopped")
+                        return None
+                    pdf_file.write(chunk)
+            text_content, complete = _extract_pdf_text(pdf_file.name, pages, max_chars)
+        finally:
+            os.remove(pdf_file.name)
+
+        if use_cache and complete:
+            # the text is what is reused, raw bytes of big PDFs are not kept in the cache
+            page_cache.put(url, b'', response.headers.get('content-type'), text=text_content,
+                           etag=response.headers.get('etag'), last_modified=response.headers.get('last-modified'), kind="pdf")
         return text_content
-    else:
-        print(f"Failed to download PDF. Status code: {response.status_code}")
-        return None
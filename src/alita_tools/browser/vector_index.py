@@ -0,0 +1,88 @@
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from typing import List, Optional
+
+from langchain_core.documents import Document
+from langchain_core.embeddings import Embeddings
+from langchain_core.vectorstores import InMemoryVectorStore
+
+from ..llm.embeddings import get_embeddings
+
+BROWSER_EMBEDDINGS_MODEL = "all-MiniLM-L6-v2"
+# oldest chunks are dropped once the index holds more chunks than this
+VECTOR_INDEX_MAX_CHUNKS = int(os.getenv("ALITA_VECTOR_INDEX_MAX_CHUNKS", "20000"))
+
+
+def chunk_id(document: Document) -> str:
+    """Identify a chunk by its url and content, an updated page gets new chunk ids."""
+    digest = hashlib.sha256(document.metadata.get("source", "").encode("utf-8"))
+    digest.update(b"\0")
+    digest.update(document.page_content.encode("utf-8"))
+    return digest.hexdigest()
+
+
+class SessionVectorIndex:
+    """In-memory vector index of page chunks reused across the calls of a tool.
+
+    Chunks are keyed by (url, content hash), so only chunks not seen before are embedded, and searches are
+    restricted to the chunks of the requested urls. Follow-up questions over the same pages cost one query embedding.
+    """
+
+    def __init__(self, embeddings: Optional[Embeddings] = None, max_chunks: int = VECTOR_INDEX_MAX_CHUNKS):
+        self.max_chunks = max_chunks
+        self._embeddings = embeddings
+        self._store: Optional[InMemoryVectorStore] = None
+        self._ids: OrderedDict[str, None] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _get_store(self) -> InMemoryVectorStore:
+        if self._store is None:
+            # the embeddings model is loaded on first use only
+            self._store = InMemoryVectorStore(self._embeddings or get_embeddings(BROWSER_EMBEDDINGS_MODEL))
+        return self._store
+
+    def add_documents(self, documents: List[Document]):
+        """Embed and add the chunks which are not in the index yet."""
+        with self._lock:
+            store = self._get_store()
+            new_documents = {}
+            for document in documents:
+                document_id = chunk_id(document)
+                if document_id in self._ids:
+                    self._ids.move_to_end(document_id)
+                elif document_id not in new_documents:
+                    new_documents[document_id] = document
+            if new_documents:
+                store.add_documents(list(new_documents.values()), ids=list(new_documents))
+                self._ids.update(dict.fromkeys(new_documents))
+            if len(self._ids) > self.max_chunks:
+                evicted = [self._ids.popitem(last=False)[0] for _ in range(len(self._ids) - self.max_chunks)]
+                store.delete(evicted)
+
+    def embed_query(self, query: str) -> List[float]:
+        """Embed the query once for several searches over the index."""
+        return self._get_store().embedding.embed_query(query)
+
+    def relevant_size(self, query: str, urls: List[str], min_score: float, k: int = 10,
+                      embedding: Optional[List[float]] = None) -> int:
+        """Total length of the top k chunks of the given urls with relevance score of at least min_score.
+
+        The query is embedded unless its embedding is given.
+        """
+        sources = set(urls)
+        results = self._get_store().similarity_search_with_score_by_vector(
+            embedding or self.embed_query(query), k=k,
+            filter=lambda document: document.metadata.get("source") in sources
+        )
+        return sum(len(document.page_content) for document, score in results if score >= min_score)
+
+    def search(self, query: str, urls: List[str], k: int = 10, fetch_k: int = 20,
+               embedding: Optional[List[float]] = None) -> List[Document]:
+        """MMR search over the chunks of the given urls, the query is embedded unless its embedding is given."""
+        sources = set(urls)
+        return self._get_store().max_marginal_relevance_search_by_vector(
+            embedding or self.embed_query(query), k=k, fetch_k=fetch_k,
+            filter=lambda document: document.metadata.get("source") in sources
+        )
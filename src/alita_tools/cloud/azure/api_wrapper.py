@@ -1,14 +1,15 @@
 from typing import Any, Optional, List, Dict, Union
 
-from pydantic import BaseModel, model_validator, create_model
+from pydantic import model_validator, create_model
 from pydantic.fields import FieldInfo, PrivateAttr
 from azure.identity import ClientSecretCredential
 from azure.mgmt.resource import ResourceManagementClient
 import requests
+from ...base.api_wrapper import BaseToolApiWrapper
 
 ERROR_PREFIX = 'Error:'
 
-class AzureApiWrapper(BaseModel):
+class AzureApiWrapper(BaseToolApiWrapper):
     subscription_id: str
     tenant_id: str
     client_id: str
@@ -87,10 +88,3 @@ class AzureApiWrapper(BaseModel):
                 "ref": self.azure_integration_healthcheck,
             }
         ]
-
-    def run(self, mode: str, *args: Any, **kwargs: Any):
-        for tool in self.get_available_tools():
-            if tool["name"] == mode:
-                return tool["ref"](*args, **kwargs)
-        else:
-            raise ValueError(f"Unknown mode: {mode}")
\ No newline at end of file
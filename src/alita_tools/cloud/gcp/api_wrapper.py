@@ -3,12 +3,13 @@ from typing import Any, Optional, List, Dict
 
 from google.auth.transport.requests import Request
 from google.oauth2.service_account import Credentials
-from pydantic import BaseModel, model_validator, create_model
+from pydantic import model_validator, create_model
 from pydantic.fields import FieldInfo, PrivateAttr
 from requests import Session
+from ...base.api_wrapper import BaseToolApiWrapper
 
 
-class GCPApiWrapper(BaseModel):
+class GCPApiWrapper(BaseToolApiWrapper):
     api_key: str
     _credentials: Optional[Credentials] = PrivateAttr()
     _session: Optional[Session] = PrivateAttr()
@@ -71,10 +72,3 @@ class GCPApiWrapper(BaseModel):
                 ),
             }
         ]
-
-    def run(self, mode: str, *args: Any, **kwargs: Any):
-        for tool in self.get_available_tools():
-            if tool["name"] == mode:
-                return tool["ref"](*args, **kwargs)
-        else:
-            raise ValueError(f"Unknown mode: {mode}")
\ No newline at end of file
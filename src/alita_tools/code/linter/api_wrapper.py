@@ -1,13 +1,14 @@
 import logging
 import subprocess
-from typing import Tuple, Dict, List, Optional, Any
+from typing import Tuple, Dict, List, Optional
 
-from pydantic import BaseModel, model_validator, create_model
+from pydantic import model_validator, create_model
 from pydantic.fields import FieldInfo, PrivateAttr
+from ...base.api_wrapper import BaseToolApiWrapper
 
 logger = logging.getLogger(__name__)
 
-class PythonLinter(BaseModel):
+class PythonLinter(BaseToolApiWrapper):
     error_codes: str
     _client: Optional['PythonLinter'] = PrivateAttr()
 
@@ -110,10 +111,3 @@ class PythonLinter(BaseModel):
                 ),
             }
         ]
-
-    def run(self, mode: str, *args: Any, **kwargs: Any):
-        for tool in self.get_available_tools():
-            if tool["name"] == mode:
-                return tool["ref"](*args, **kwargs)
-        else:
-            raise ValueError(f"Unknown mode: {mode}")
\ No newline at end of file
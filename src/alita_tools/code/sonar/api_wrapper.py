@@ -1,20 +1,23 @@
 import json
 from typing import Any, Optional, Dict
 
-from pydantic import BaseModel, model_validator, create_model
+from pydantic import model_validator, create_model
 from pydantic.fields import FieldInfo, PrivateAttr
 import requests
 from json import JSONDecodeError
 import traceback
 
 from langchain_core.tools import ToolException
+from ...base.api_wrapper import BaseToolApiWrapper
+from ...base.client_cache import LoopBoundAsyncClient, get_cached_client, pooled_session
 
 
-class SonarApiWrapper(BaseModel):
+class SonarApiWrapper(BaseToolApiWrapper):
     url: str
     sonar_token: str
     sonar_project_name: str
     _client: Optional[requests.Session] = PrivateAttr()
+    _async_client: Optional[LoopBoundAsyncClient] = PrivateAttr(default=None)
 
     @model_validator(mode='before')
     @classmethod
@@ -24,10 +27,18 @@ class SonarApiWrapper(BaseModel):
         sonar_project_name = values.get('sonar_project_name')
         if not url or not sonar_token or not sonar_project_name:
             raise ValueError("SonarQube credentials are not provided properly.")
-        cls._client = requests.Session()
-        cls._client.auth = (sonar_token, '')
         return values
 
+    @model_validator(mode='after')
+    def init_client(self):
+        def create_session():
+            session = pooled_session()
+            session.auth = (self.sonar_token, '')
+            return session
+
+        self._client = get_cached_client('sonar', self.url, (self.sonar_token,), create_session)
+        return self
+
     def get_sonar_data(self, relative_url: str, params: str) -> str:
         """
         SonarQube Tool for interacting with the SonarQube REST API.
@@ -44,6 +55,18 @@ class SonarApiWrapper(BaseModel):
         response.raise_for_status()
         return response.json()
 
+    async def aget_sonar_data(self, relative_url: str, params: str) -> str:
+        if self._async_client is None:
+            self._async_client = LoopBoundAsyncClient(auth=(self.sonar_token, ''))
+        payload_params = self.parse_payload_params(params)
+        payload_params['componentKeys'] = self.sonar_project_name
+        response = await self._async_client.get().get(
+            url=f"{self.url}/{relative_url}",
+            params=payload_params
+        )
+        response.raise_for_status()
+        return response.json()
+
     @staticmethod
     def parse_payload_params(params: Optional[str]) -> Dict[str, Any]:
         if params:
@@ -67,10 +90,3 @@ class SonarApiWrapper(BaseModel):
                 "ref": self.get_sonar_data,
             }
         ]
-
-    def run(self, mode: str, *args: Any, **kwargs: Any):
-        for tool in self.get_available_tools():
-            if tool["name"] == mode:
-                return tool["ref"](*args, **kwargs)
-        else:
-            raise ValueError(f"Unknown mode: {mode}")
\ No newline at end of file
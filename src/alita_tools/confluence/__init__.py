@@ -41,8 +41,10 @@ class ConfluenceToolkit(BaseToolkit):
             limit=(int, FieldInfo(description="Pages limit per request", default=5)),
             max_pages=(int, FieldInfo(description="Max total pages", default=10)),
             number_of_retries=(int, FieldInfo(description="Number of retries", default=2)),
+            max_concurrency=(int, FieldInfo(description="Max pages fetched in parallel", default=5)),
             min_retry_seconds=(int, FieldInfo(description="Min retry, sec", default=10)),
             max_retry_seconds=(int, FieldInfo(description="Max retry, sec", default=60)),
+            use_cql_for_page_tree=(bool, FieldInfo(description="Use CQL ancestor search to build page tree", default=False)),
             selected_tools=(List[Literal[tuple(selected_tools)]], []),
             __config__=ConfigDict(json_schema_extra={'metadata': {"label": "Confluence", "icon_url": None}})
         )
@@ -3,15 +3,18 @@ import logging
 import re
 
 import requests
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Optional, Any
 from pydantic import create_model
 from pydantic.fields import FieldInfo
 from langchain_core.documents import Document
-from pydantic import model_validator, BaseModel
+from pydantic import model_validator
 from langchain_community.document_loaders.confluence import ContentFormat
+from ..base.api_wrapper import BaseToolApiWrapper
+from ..base.client_cache import pooled_session, HTTP_POOL_MAXSIZE
 from tenacity import (
     before_sleep_log,
-    retry,
+    Retrying,
     stop_after_attempt,
     wait_exponential,
 )
@@ -78,6 +81,8 @@ updateLabels = create_model(
 getPageTree = create_model(
     "getPageTree",
     page_id=(str, FieldInfo(description="Page id")),
+    max_depth=(Optional[int], FieldInfo(description="Max depth of descendants relative to the page, no limit if not set", default=None)),
+    max_nodes=(Optional[int], FieldInfo(description="Max number of descendant pages to return, no limit if not set", default=None)),
 )
 
 pageExists = create_model(
@@ -107,7 +112,7 @@ pageId = create_model(
     skip_images=(bool, FieldInfo(description="Whether we need to skip existing images or not")),
 )
 
-class ConfluenceAPIWrapper(BaseModel):
+class ConfluenceAPIWrapper(BaseToolApiWrapper):
     client: Any #: :meta private:
     base_url: str
     api_key: Optional[str] = None,
@@ -124,6 +129,8 @@ class ConfluenceAPIWrapper(BaseModel):
     number_of_retries: Optional[int] = 3
     min_retry_seconds: Optional[int] = 2
     max_retry_seconds: Optional[int] = 10
+    max_concurrency: Optional[int] = 5
+    use_cql_for_page_tree: Optional[bool] = False
     keep_markdown_format: Optional[bool] = True
     ocr_languages: Optional[str] = None
     keep_newlines: Optional[bool] = True
@@ -144,10 +151,12 @@ class ConfluenceAPIWrapper(BaseModel):
         username = values.get('username')
         token = values.get('token')
         cloud = values.get('cloud')
+        # pages are fetched concurrently, keep enough warm connections for every worker
+        session = pooled_session(pool_maxsize=max(values.get('max_concurrency') or 5, HTTP_POOL_MAXSIZE))
         if token:
-            values['client'] = Confluence(url=url, token=token, cloud=cloud)
+            values['client'] = Confluence(url=url, token=token, cloud=cloud, session=session)
         else:
-            values['client'] = Confluence(url=url,username=username, password=api_key, cloud=cloud)
+            values['client'] = Confluence(url=url,username=username, password=api_key, cloud=cloud, session=session)
         return values
 
     def __unquote_confluence_space(self) -> str | None:
@@ -326,31 +335,80 @@ class ConfluenceAPIWrapper(BaseModel):
         else:
             return "Either list of page_ids should be provided."
 
-    def get_page_tree(self, page_id: str):
+    def get_page_tree(self, page_id: str, max_depth: Optional[int] = None, max_nodes: Optional[int] = None):
         """ Gets page tree for the Confluence space """
-        descendant_pages = self.get_all_descendants(page_id)  # Pass None as the parent for the root
-        for page in descendant_pages:
+        descendants = {}
+        for page in self.iter_descendants(page_id, max_depth=max_depth, max_nodes=max_nodes):
             logger.info(f"Page ID: {page['id']}, Title: {page['title']}, Parent ID: {page['parent_id']}")
-        descendants = {page['id']: (page['title'], page['parent_id']) for page in descendant_pages}
+            descendants[page['id']] = (page['title'], page['parent_id'])
         return f"The list of pages under the '{page_id}' was extracted: {descendants}"
 
-    def get_all_descendants(self, page_id: str):
-        """ Recursively gets all descendant pages of a given page. """
-        descendants = []
+    def get_all_descendants(self, page_id: str, max_depth: Optional[int] = None, max_nodes: Optional[int] = None):
+        """ Gets all descendant pages of a given page. """
+        return list(self.iter_descendants(page_id, max_depth=max_depth, max_nodes=max_nodes))
+
+    def iter_descendants(self, page_id: str, max_depth: Optional[int] = None, max_nodes: Optional[int] = None,
+                         use_cql: Optional[bool] = None):
+        """ Yields {id, title, parent_id} of descendant pages of a given page, breadth-first unless the whole subtree
+        is listed with CQL. """
+        use_cql = self.use_cql_for_page_tree if use_cql is None else use_cql
+        if use_cql and max_depth is None:
+            pages = self._iter_descendants_cql(page_id)
+        else:
+            # CQL can not limit the depth, a depth-limited tree is walked level by level down to max_depth only
+            pages = self._iter_descendants_bfs(page_id, max_depth)
+        for count, page in enumerate(pages, start=1):
+            yield page
+            if max_nodes is not None and count >= max_nodes:
+                break
+
+    def _get_child_pages(self, page_id: str) -> list:
+        children = []
         limit = 100
         start = 0
-
         while True:
-            children = self.client.get_page_child_by_type(page_id, type='page', start=start, limit=limit)
-            if not children:
+            batch = self._with_retry(self.client.get_page_child_by_type, page_id, type='page', start=start, limit=limit)
+            if not batch:
                 break
-            for child in children:
-                child_info = {'id': child['id'], 'title': child['title'], 'parent_id': page_id}
-                descendants.append(child_info)
-                descendants.extend(self.get_all_descendants(child['id']))
+            children.extend(batch)
             start += limit
+        return children
 
-        return descendants
+    def _iter_descendants_bfs(self, page_id: str, max_depth: Optional[int] = None):
+        # children of a whole level are requested concurrently, up to max_concurrency calls in flight
+        executor = ThreadPoolExecutor(max_workers=max(self.max_concurrency or 1, 1))
+        try:
+            frontier = [page_id]
+            depth = 0
+            while frontier and (max_depth is None or depth < max_depth):
+                depth += 1
+                next_frontier = []
+                futures = [(parent_id, executor.submit(self._get_child_pages, parent_id)) for parent_id in frontier]
+                for parent_id, future in futures:
+                    for child in future.result():
+                        next_frontier.append(child['id'])
+                        yield {'id': child['id'], 'title': child['title'], 'parent_id': parent_id}
+                frontier = next_frontier
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _iter_descendants_cql(self, page_id: str):
+        # a single paginated `ancestor=` query returns the whole subtree, parents come from the expanded ancestors
+        cql = f'type=page and ancestor={page_id}'
+        limit = 100
+        start = 0
+        while True:
+            results = self._with_retry(
+                self.client.cql, cql, start=start, limit=limit, expand="content.ancestors"
+            ).get("results", [])
+            if not results:
+                break
+            for result in results:
+                page = result['content']
+                ancestor_ids = [str(ancestor['id']) for ancestor in page.get('ancestors', [])]
+                yield {'id': page['id'], 'title': page['title'], 'parent_id': ancestor_ids[-1] if ancestor_ids else page_id}
+            # the server may return fewer results than the limit per page
+            start += len(results)
 
     def page_exists(self, title: str):
         """ Checks if a page exists in the Confluence space."""
@@ -387,34 +445,50 @@ class ConfluenceAPIWrapper(BaseModel):
     def is_public_page(self, page: dict) -> bool:
         """Check if a page is publicly accessible."""
         restrictions = self.client.get_all_restrictions_for_content(page["id"])
+        return self._is_public(page, restrictions)
 
+    @staticmethod
+    def _is_public(page: dict, restrictions: dict) -> bool:
         return (
                 page["status"] == "current"
                 and not restrictions["read"]["restrictions"]["user"]["results"]
                 and not restrictions["read"]["restrictions"]["group"]["results"]
         )
 
+    def _with_retry(self, func, *args, **kwargs):
+        """Call a Confluence API method with the configured retry/backoff policy."""
+        return Retrying(
+            reraise=True,
+            stop=stop_after_attempt(
+                self.number_of_retries  # type: ignore[arg-type]
+            ),
+            wait=wait_exponential(
+                multiplier=1,  # type: ignore[arg-type]
+                min=self.min_retry_seconds,  # type: ignore[arg-type]
+                max=self.max_retry_seconds,  # type: ignore[arg-type]
+            ),
+            before_sleep=before_sleep_log(logger, logging.WARNING),
+        )(func, *args, **kwargs)
+
     def get_pages_by_id(self, page_ids: List[str], skip_images: bool = False):
         """ Gets pages by id in the Confluence space."""
-        for page_id in page_ids:
-            get_page = retry(
-                reraise=True,
-                stop=stop_after_attempt(
-                    self.number_of_retries  # type: ignore[arg-type]
-                ),
-                wait=wait_exponential(
-                    multiplier=1,  # type: ignore[arg-type]
-                    min=self.min_retry_seconds,  # type: ignore[arg-type]
-                    max=self.max_retry_seconds,  # type: ignore[arg-type]
-                ),
-                before_sleep=before_sleep_log(logger, logging.WARNING),
-            )(self.client.get_page_by_id)
-            page = get_page(
-                page_id=page_id, expand=f"{self.content_format.value},version"
-            )
-            if not self.include_restricted_content and not self.is_public_page(page):
-                continue
-            yield self.process_page(page, skip_images)
+        executor = ThreadPoolExecutor(max_workers=max(self.max_concurrency or 1, 1))
+        try:
+            # pages and their restrictions are requested up front, up to max_concurrency calls are in flight
+            requests_futures = [(
+                executor.submit(self._with_retry, self.client.get_page_by_id,
+                                page_id=page_id, expand=f"{self.content_format.value},version"),
+                None if self.include_restricted_content else
+                executor.submit(self._with_retry, self.client.get_all_restrictions_for_content, page_id)
+            ) for page_id in page_ids]
+            # results are consumed in the order of page_ids
+            for page_future, restrictions_future in requests_futures:
+                page = page_future.result()
+                if restrictions_future is not None and not self._is_public(page, restrictions_future.result()):
+                    continue
+                yield self.process_page(page, skip_images)
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
 
     def read_page_by_id(self, page_id: str, skip_images: bool = False):
         """Reads a page by its id in the Confluence space."""
@@ -429,23 +503,38 @@ class ConfluenceAPIWrapper(BaseModel):
         base64_md_pattern = r'data:image/(png|jpeg|gif);base64,[a-zA-Z0-9+/=]+'
         return re.sub(base64_md_pattern, "[Image Removed]", content)
 
-    def _process_search(self, cql, skip_images:bool = False):
+    def _search_expanded_pages(self, cql, skip_images: bool = False):
+        """Run paginated CQL search with page bodies, version and restrictions expanded in the same request."""
+        expand = [f"content.{self.content_format.value}", "content.version"]
+        if not self.include_restricted_content:
+            expand += ["content.restrictions.read.restrictions.user", "content.restrictions.read.restrictions.group"]
         start = 0
-        pages_info = []
         for _ in range((self.max_pages + self.limit - 1) // self.limit):
-            pages = self.client.cql(cql, start=start, limit=self.limit).get("results", [])
-            if not pages:
+            results = self._with_retry(
+                self.client.cql, cql, start=start, limit=self.limit, expand=",".join(expand)
+            ).get("results", [])
+            if not results:
                 break
-            page_ids = [page['content']['id'] for page in pages]
-            for page in self.get_pages_by_id(page_ids, skip_images):
-                page_info = {
-                    'content': page.page_content,
-                    'page_id': page.metadata['id'],
-                    'page_title': page.metadata['title'],
-                    'page_url': page.metadata['source']
-                }
-                pages_info.append(page_info)
+            for result in results:
+                page = result['content']
+                if not self.include_restricted_content:
+                    # fall back to a lookup when the instance did not expand restrictions
+                    restrictions = page.get('restrictions') or self.client.get_all_restrictions_for_content(page['id'])
+                    if not self._is_public(page, restrictions):
+                        continue
+                yield self.process_page(page, skip_images)
             start += self.limit
+
+    def _process_search(self, cql, skip_images:bool = False):
+        pages_info = []
+        for page in self._search_expanded_pages(cql, skip_images):
+            page_info = {
+                'content': page.page_content,
+                'page_id': page.metadata['id'],
+                'page_title': page.metadata['title'],
+                'page_url': page.metadata['source']
+            }
+            pages_info.append(page_info)
         return str(pages_info)
 
     def search_pages(self, query: str, skip_images: bool = False):
@@ -691,10 +780,3 @@ class ConfluenceAPIWrapper(BaseModel):
                 "args_schema": siteSearch,
             }
         ]
-
-    def run(self, mode: str, *args: Any, **kwargs: Any):
-        for tool in self.get_available_tools():
-            if tool["name"] == mode:
-                return tool["ref"](*args, **kwargs)
-        else:
-            raise ValueError(f"Unknown mode: {mode}")
\ No newline at end of file
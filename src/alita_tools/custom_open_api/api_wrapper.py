@@ -1,10 +1,15 @@
 import json
-from typing import Any, Optional, List
+from typing import Optional, List
 
 from pydantic import BaseModel, model_validator, create_model
 from pydantic.fields import FieldInfo, PrivateAttr
 
 import urllib3
+from ..base.api_wrapper import BaseToolApiWrapper
+from ..base.client_cache import LoopBoundAsyncClient, HTTP_POOL_CONNECTIONS, HTTP_POOL_MAXSIZE
+
+# methods for which urllib3 sends `fields` in the query string instead of the body
+URL_ENCODED_METHODS = {"DELETE", "GET", "HEAD", "OPTIONS"}
 
 
 class OpenApiConfig(BaseModel):
@@ -12,16 +17,16 @@ class OpenApiConfig(BaseModel):
     api_key: str
 
 
-class OpenApiWrapper(BaseModel):
+class OpenApiWrapper(BaseToolApiWrapper):
     spec: str
     api_key: str
     _client: Optional[urllib3.PoolManager] = PrivateAttr()
+    _async_client: Optional[LoopBoundAsyncClient] = PrivateAttr(default=None)
 
-    @model_validator(mode='before')
-    @classmethod
-    def validate_toolkit(cls, values):
-        cls._client = urllib3.PoolManager()
-        return values
+    @model_validator(mode='after')
+    def validate_toolkit(self):
+        self._client = urllib3.PoolManager(num_pools=HTTP_POOL_CONNECTIONS, maxsize=HTTP_POOL_MAXSIZE)
+        return self
 
     def invoke_rest_api_by_spec(self, method: str, url: str, headers: str = "", fields: str = "", body: str = "") -> str:
         """
@@ -43,6 +48,26 @@ class OpenApiWrapper(BaseModel):
                                         body=encoded_data)
         return response.data.decode('utf-8')
 
+    async def ainvoke_rest_api_by_spec(self, method: str, url: str, headers: str = "", fields: str = "", body: str = "") -> str:
+        encoded_data = body.encode('utf-8') if body else None
+        headers_param = parse_to_dict(headers) if headers else {}
+        fields_param = parse_to_dict(fields) if fields else None
+
+        if self.api_key:
+            headers_param['Authorization'] = "Bearer " + self.api_key
+
+        if self._async_client is None:
+            self._async_client = LoopBoundAsyncClient()
+        client = self._async_client.get()
+        if fields_param and method.upper() in URL_ENCODED_METHODS:
+            response = await client.request(method, url, params=fields_param, headers=headers_param,
+                                            content=encoded_data)
+        elif fields_param:
+            response = await client.request(method, url, data=fields_param, headers=headers_param)
+        else:
+            response = await client.request(method, url, headers=headers_param, content=encoded_data)
+        return response.content.decode('utf-8')
+
     def get_open_api_spec(self) -> str:
         """
         Retrieves the OpenAPI (Swagger) specification for a given API endpoint. This tool helps in obtaining the necessary information to interact with an API using the "Invoke External API" tool.
@@ -75,12 +100,6 @@ class OpenApiWrapper(BaseModel):
             }
         ]
 
-    def run(self, mode: str, *args: Any, **kwargs: Any):
-        for tool in self.get_available_tools():
-            if tool["name"] == mode:
-                return tool["ref"](*args, **kwargs)
-        else:
-            raise ValueError(f"Unknown mode: {mode}")
 
 
 def parse_to_dict(input_string):
@@ -102,4 +121,3 @@ def parse_to_dict(input_string):
             print("JSON decode error:", e)
             return None
     return parsed_dict
-
@@ -1,7 +1,9 @@
 import json
-from typing import Any, Optional
+from typing import Optional
 
 from pydantic import BaseModel, create_model, FieldInfo, model_validator, PrivateAttr
+from ..base.api_wrapper import BaseToolApiWrapper
+from ..base.client_cache import get_cached_client, HTTP_POOL_MAXSIZE
 
 try:
     from elasticsearch import Elasticsearch
@@ -12,25 +14,24 @@ class ElasticConfig(BaseModel):
     url: str
     api_key: Optional[tuple[str, str]] = None
 
-class ELITEAElasticApiWrapper(BaseModel):
+class ELITEAElasticApiWrapper(BaseToolApiWrapper):
     url: str
     api_key: Optional[tuple[str, str]] = None
     _client: Optional[Elasticsearch] = PrivateAttr()
 
-    @model_validator(mode='before')
-    @classmethod
-    def validate_toolkit(cls, values):
+    @model_validator(mode='after')
+    def validate_toolkit(self):
         if Elasticsearch is None:
             raise ImportError(
                 "'elasticsearch' package is not installed. Please install it using `pip install elasticsearch`."
             )
-        url = values['url']
-        api_key = values.get('api_key')
-        if api_key:
-            cls._client = Elasticsearch(url, api_key=api_key, verify_certs=False, ssl_show_warn=False)
-        else:
-            cls._client = Elasticsearch(url, verify_certs=False, ssl_show_warn=False)
-        return values
+        auth = {'api_key': self.api_key} if self.api_key else {}
+        self._client = get_cached_client(
+            'elastic', self.url, (self.api_key,),
+            lambda: Elasticsearch(self.url, verify_certs=False, ssl_show_warn=False,
+                                  connections_per_node=HTTP_POOL_MAXSIZE, **auth)
+        )
+        return self
 
     def search_elastic_index(self, index: str, query: str):
         """Search a specific data in the specific index in Elastic."""
@@ -51,10 +52,3 @@ class ELITEAElasticApiWrapper(BaseModel):
                 ),
             }
         ]
-
-    def run(self, mode: str, *args: Any, **kwargs: Any):
-        for tool in self.get_available_tools():
-            if tool["name"] == mode:
-                return tool["ref"](*args, **kwargs)
-        else:
-            raise ValueError(f"Unknown mode: {mode}")
\ No newline at end of file
@@ -4,7 +4,7 @@ from langchain_core.tools import BaseTool, BaseToolkit
 from pydantic import BaseModel, create_model, ConfigDict
 from pydantic.fields import FieldInfo
 
-from .api_wrapper import AlitaGitHubAPIWrapper
+from .api_wrapper import AlitaGitHubAPIWrapper, STAGED_CHANGES_TOOLS
 from .tool import GitHubAction
 
 name = "github"
@@ -17,7 +17,8 @@ def _get_toolkit(tool) -> BaseToolkit:
         github_base_branch=tool['settings']['base_branch'],
         github_access_token=tool['settings'].get('access_token', ''),
         github_username=tool['settings'].get('username', ''),
-        github_password=tool['settings'].get('password', '')
+        github_password=tool['settings'].get('password', ''),
+        staged_changes=tool['settings'].get('staged_changes', False)
     )
 
 def get_toolkit():
@@ -46,6 +47,7 @@ class AlitaGitHubToolkit(BaseToolkit):
             repository=(str, FieldInfo(description="Github repository")),
             active_branch=(Optional[str], FieldInfo(description="Active branch", default="main")),
             base_branch=(Optional[str], FieldInfo(description="Github Base branch", default="main")),
+            staged_changes=(Optional[bool], FieldInfo(description="Stage file changes and commit them together with commit_changes", default=False)),
             selected_tools=(List[Literal[tuple(selected_tools)]], [])
         )
 
@@ -58,6 +60,8 @@ class AlitaGitHubToolkit(BaseToolkit):
         tools = []
         repo = github_api_wrapper.github_repository.split("/")[1]
         for tool in available_tools:
+            if tool["name"] in STAGED_CHANGES_TOOLS and not github_api_wrapper.staged_changes:
+                continue
             if selected_tools:
                 if tool["name"] not in selected_tools:
                     continue
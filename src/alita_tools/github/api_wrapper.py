@@ -1,8 +1,7 @@
 import os
 from json import dumps
-from typing import Dict, Any, Optional, List
-import tiktoken
-from pydantic import model_validator, create_model
+from typing import Dict, Any, Optional, List, Tuple
+from pydantic import model_validator, create_model, PrivateAttr
 from pydantic.fields import FieldInfo
 from langchain.utils import get_from_dict_or_env
 
@@ -24,9 +23,21 @@ from langchain_community.tools.github.prompt import (
 )
 
 from langchain_community.utilities.github import GitHubAPIWrapper
+from ..base.api_wrapper import BaseToolApiWrapper
+from ..base.blob_cache import blob_cache, blob_scope, git_blob_sha
+from ..llm.token_budget import summarize_pull_request
+from .git_tree import list_blobs, list_files
 
 CREATE_FILE_PROMPT = """Create new file in your github repository."""
 
+# tools of the staging workflow, they are exposed by the toolkit only when staged_changes is on
+STAGED_CHANGES_TOOLS = ("commit_changes", "discard_changes")
+
+COMMIT_CHANGES_PROMPT = """Commits all staged file changes of the active branch as a single commit. File changes are staged
+instead of committed one by one when the toolkit is configured with staged changes."""
+
+DISCARD_CHANGES_PROMPT = """Discards all staged file changes of the active branch which are not committed yet."""
+
 UPDATE_FILE_PROMPT = """Updates the contents of a file in a GitHub repository. Your input to this tool MUST strictly follow these rules:
 Specify which file to modify by passing a full file path (the path must not start with a slash); Specify at lest 2 lines of the old contents which you would like to replace wrapped in OLD <<<< and >>>> OLD; Specify the new contents which you would like to replace the old contents with wrapped in NEW <<<< and >>>> NEW; NEW content may contain lines from OLD content in case you want to add content without removing the old content
 
@@ -136,13 +147,18 @@ DeleteFile = create_model(
     ))
 )
 
+CommitChanges = create_model(
+    "CommitChanges",
+    commit_message=(str, FieldInfo(default="", description="Message of the commit with all staged changes."))
+)
+
 BranchName = create_model(
     "BranchName",
     branch_name=(str, FieldInfo(description="The name of the branch, e.g. `my_branch`."))
 )
 
 
-class AlitaGitHubAPIWrapper(GitHubAPIWrapper):
+class AlitaGitHubAPIWrapper(BaseToolApiWrapper, GitHubAPIWrapper):
     github: Any  #: :meta private:
     github_repo_instance: Any  #: :meta private:
     github_repository: Optional[str] = None
@@ -153,6 +169,11 @@ class AlitaGitHubAPIWrapper(GitHubAPIWrapper):
     github_password: Optional[str] = None
     github_app_id: Optional[str] = None
     github_app_private_key: Optional[str] = None
+    staged_changes: Optional[bool] = False
+    """Accumulate file changes of a branch and push them as one commit with commit_changes."""
+    # staged (content, blob sha the change is based on) by path by branch, None content deletes the file
+    # and None sha stands for a file which did not exist
+    _changesets: Dict[str, Dict[str, Tuple[Optional[str], Optional[str]]]] = PrivateAttr(default_factory=dict)
 
     @model_validator(mode='before')
     @classmethod
@@ -231,23 +252,162 @@ class AlitaGitHubAPIWrapper(GitHubAPIWrapper):
 
         return values
 
+    def _blob_scope(self) -> str:
+        return blob_scope("github", self.github_repo_instance.url, self.github_repository, (
+            self.github_access_token, self.github_username, self.github_password, self.github_app_id
+        ))
+
+    def _read_file(self, file_path: str, ref: str) -> Tuple[str, str]:
+        """Return the content and blob sha of the file, served from the blob cache if read recently."""
+        staged = self._changesets.get(ref, {})
+        if file_path in staged:
+            content = staged[file_path][0]
+            if content is None:
+                raise FileNotFoundError(f"`{file_path}` is deleted by the staged changes")
+            return content, git_blob_sha(content)
+        cached = blob_cache.get(self._blob_scope(), ref, file_path)
+        if cached is not None:
+            return cached
+        file = self.github_repo_instance.get_contents(file_path, ref=ref)
+        content = file.decoded_content.decode("utf-8")
+        blob_cache.put(self._blob_scope(), ref, file_path, content, file.sha)
+        return content, file.sha
+
+    def read_file(self, file_path: str, branch: Optional[str] = None) -> str:
+        """
+        Read a file from the active branch (or the given branch).
+        Parameters:
+            file_path(str): the file path
+            branch(str): the branch to read the file from
+        Returns:
+            str: The file decoded as a string, or an error message if not found
+        """
+        branch = branch or self.active_branch
+        try:
+            return self._read_file(file_path, branch)[0]
+        except Exception as e:
+            return f"File not found `{file_path}` on branch `{branch}`. Error: {str(e)}"
+
+    def delete_file(self, file_path: str) -> str:
+        """
+        Deletes a file from the repo
+        Parameters:
+            file_path(str): Where the file is
+        Returns:
+            str: Success or failure message
+        """
+        if self.staged_changes:
+            try:
+                _, sha = self._read_file(file_path, self.active_branch)
+            except Exception as e:
+                return f"File not found `{file_path}` on branch `{self.active_branch}`. Error: {str(e)}"
+            return self._stage(file_path, None, sha)
+        result = super().delete_file(file_path)
+        blob_cache.invalidate(self._blob_scope(), self.active_branch, file_path)
+        return result
+
+    def _stage(self, file_path: str, content: Optional[str], base_sha: Optional[str]) -> str:
+        changes = self._changesets.setdefault(self.active_branch, {})
+        if file_path in changes:
+            # a file staged again is still compared with the blob it was first staged from
+            base_sha = changes[file_path][1]
+        changes[file_path] = (content, base_sha)
+        return (
+            f"Staged {'deletion' if content is None else 'changes'} of {file_path}, "
+            f"{len(changes)} file(s) are staged on branch `{self.active_branch}`. Use `commit_changes` to commit them."
+        )
+
+    def commit_changes(self, commit_message: str = "") -> str:
+        """
+        Commits all staged changes of the active branch with one tree, one commit and one ref update.
+        Parameters:
+            commit_message(str): The commit message
+        Returns:
+            str: A success or failure message
+        """
+        from github import InputGitTreeElement
+
+        branch = self.active_branch
+        changes = self._changesets.get(branch)
+        if not changes:
+            return f"There are no staged changes on branch `{branch}`."
+        if branch == self.github_base_branch:
+            return (
+                "You're attempting to commit to the directly"
+                f"to the {self.github_base_branch} branch, which is protected. "
+                "Please create a new branch and try again."
+            )
+        try:
+            ref = self.github_repo_instance.get_git_ref(f"heads/{branch}")
+            parent = self.github_repo_instance.get_git_commit(ref.object.sha)
+            blobs = {blob.path: blob for blob in list_blobs(self.github_repo_instance, parent.tree.sha)}
+            # the commit is built on the branch head, files changed there since they were staged are not overwritten
+            conflicts = [path for path, (_, base_sha) in changes.items()
+                         if (blobs[path].sha if path in blobs else None) != base_sha]
+            if conflicts:
+                for path in conflicts:
+                    blob_cache.invalidate(self._blob_scope(), branch, path)
+                return (
+                    f"Unable to commit staged changes: {', '.join(conflicts)} changed on branch `{branch}` "
+                    "since the changes were staged. Discard the staged changes and apply them again."
+                )
+            elements = []
+            for path, (content, _) in changes.items():
+                # modes of the existing files are kept, e.g. of executable scripts
+                mode = blobs[path].mode if path in blobs else "100644"
+                if content is not None:
+                    elements.append(InputGitTreeElement(path, mode, "blob", content=content))
+                elif path in blobs:
+                    elements.append(InputGitTreeElement(path, mode, "blob", sha=None))
+            tree = self.github_repo_instance.create_git_tree(elements, parent.tree)
+            commit = self.github_repo_instance.create_git_commit(
+                commit_message or f"Update {', '.join(changes)}", tree, [parent]
+            )
+            ref.edit(commit.sha)
+        except Exception as e:
+            return "Unable to commit staged changes due to error:\n" + str(e)
+        del self._changesets[branch]
+        for path, (content, _) in changes.items():
+            if content is None:
+                blob_cache.invalidate(self._blob_scope(), branch, path)
+            else:
+                blob_cache.put(self._blob_scope(), branch, path, content, git_blob_sha(content))
+        return f"Committed {len(changes)} staged file(s) to branch `{branch}` in {commit.sha}"
+
+    def discard_changes(self) -> str:
+        """
+        Discards all staged changes of the active branch.
+        Returns:
+            str: A success message
+        """
+        changes = self._changesets.pop(self.active_branch, {})
+        return f"Discarded {len(changes)} staged file(s) on branch `{self.active_branch}`."
+
+    def create_pull_request(self, pr_query: str) -> str:
+        """
+        Makes a pull request from the bot's branch to the base branch, committing staged changes first.
+        Parameters:
+            pr_query(str): a string which contains the PR title
+            and the PR body. The title is the first line
+            in the string, and the body are the rest of the string.
+        Returns:
+            str: A success or failure message
+        """
+        if self._changesets.get(self.active_branch):
+            result = self.commit_changes()
+            if not result.startswith("Committed"):
+                return result
+        return super().create_pull_request(pr_query)
+
     def _get_files(self, directory_path: str, ref: str) -> List[str]:
         from github import GithubException
 
-        files: List[str] = []
         try:
-            contents = self.github_repo_instance.get_contents(
-                directory_path, ref=ref
-            )
+            files = list_files(self.github_repo_instance, ref, directory_path)
         except GithubException as e:
             return f"Error: status code {e.status}, {e.message}"
-        files = []
-        while contents:
-            file_content = contents.pop(0)
-            if file_content.type == "dir":
-                contents.extend(self.github_repo_instance.get_contents(file_content.path))
-            else:
-                files.append(file_content)
+        except FileNotFoundError as e:
+            return f"Error: {e}"
         return str(files)
 
     def get_files_from_directory(self, directory_path: str) -> str:
@@ -297,55 +457,23 @@ class AlitaGitHubAPIWrapper(GitHubAPIWrapper):
         Returns:
             str: A dictionary containing information about the pull request.
         """
-        max_tokens = 2000
         pull = self.github_repo_instance.get_pull(number=int(pr_number))
-        total_tokens = 0
-
-        def get_tokens(text: str) -> int:
-            return len(tiktoken.get_encoding("cl100k_base").encode(text))
-
-        def add_to_dict(data_dict: Dict[str, Any], key: str, value: str) -> None:
-            nonlocal total_tokens  # Declare total_tokens as nonlocal
-            tokens = get_tokens(value)
-            if total_tokens + tokens <= max_tokens:
-                data_dict[key] = value
-                total_tokens += tokens  # Now this will modify the outer variable
-
-        response_dict: Dict[str, str] = {}
-        add_to_dict(response_dict, "title", pull.title)
-        add_to_dict(response_dict, "number", str(pr_number))
-        add_to_dict(response_dict, "body", str(pull.body))
-        add_to_dict(response_dict, "pr_url", str(pull.html_url))
-
-        comments: List[str] = []
-        page = 0
-        while len(comments) <= 10:
-            comments_page = pull.get_issue_comments().get_page(page)
-            if len(comments_page) == 0:
-                break
-            for comment in comments_page:
-                comment_str = str({"body": comment.body, "user": comment.user.login})
-                if total_tokens + get_tokens(comment_str) > max_tokens:
-                    break
-                comments.append(comment_str)
-                total_tokens += get_tokens(comment_str)
-            page += 1
-        add_to_dict(response_dict, "comments", str(comments))
-
-        commits: List[str] = []
-        page = 0
-        while len(commits) <= 10:
-            commits_page = pull.get_commits().get_page(page)
-            if len(commits_page) == 0:
-                break
-            for commit in commits_page:
-                commit_str = str({"message": commit.commit.message})
-                if total_tokens + get_tokens(commit_str) > max_tokens:
-                    break
-                commits.append(commit_str)
-                total_tokens += get_tokens(commit_str)
-            page += 1
-        add_to_dict(response_dict, "commits", str(commits))
+        fields = {
+            "title": pull.title,
+            "number": str(pr_number),
+            "body": str(pull.body),
+            "pr_url": str(pull.html_url),
+        }
+        sections = {
+            "comments": lambda page: [
+                str({"body": comment.body, "user": comment.user.login})
+                for comment in pull.get_issue_comments().get_page(page)
+            ],
+            "commits": lambda page: [
+                str({"message": commit.commit.message}) for commit in pull.get_commits().get_page(page)
+            ],
+        }
+        response_dict = summarize_pull_request(fields, sections)
         return dumps(response_dict)
 
     def list_pull_request_diffs(self, pr_number: str) -> str:
@@ -432,9 +560,7 @@ class AlitaGitHubAPIWrapper(GitHubAPIWrapper):
             )
         try:
             try:
-                file = self.github_repo_instance.get_contents(
-                    file_path, ref=self.active_branch
-                )
+                file = self._read_file(file_path, self.active_branch)
                 if file:
                     return (
                         f"File already exists at `{file_path}` "
@@ -445,12 +571,15 @@ class AlitaGitHubAPIWrapper(GitHubAPIWrapper):
                 # expected behavior, file shouldn't exist yet
                 pass
 
-            self.github_repo_instance.create_file(
+            if self.staged_changes:
+                return self._stage(file_path, file_contents, None)
+            result = self.github_repo_instance.create_file(
                 path=file_path,
                 message="Create " + file_path,
                 content=file_contents,
                 branch=self.active_branch,
             )
+            blob_cache.put(self._blob_scope(), self.active_branch, file_path, file_contents, result["content"].sha)
             return "Created file " + file_path
         except Exception as e:
             return "Unable to make file due to error:\n" + str(e)
@@ -535,7 +664,8 @@ class AlitaGitHubAPIWrapper(GitHubAPIWrapper):
 
             file_path: str = file_query.split("\n")[0]
 
-            file_content = self.read_file(file_path)
+            # the blob sha of the read is the one the update is based on, no second lookup is needed
+            file_content, sha = self._read_file(file_path, self.active_branch)
             updated_file_content = file_content
             for old, new in self.extract_old_new_pairs(file_query):
                 if not old.strip():
@@ -549,17 +679,21 @@ class AlitaGitHubAPIWrapper(GitHubAPIWrapper):
                     "the current file contents."
                 )
 
-            self.github_repo_instance.update_file(
+            if self.staged_changes:
+                return self._stage(file_path, updated_file_content, sha)
+            result = self.github_repo_instance.update_file(
                 path=file_path,
                 message="Update " + str(file_path),
                 content=updated_file_content,
                 branch=self.active_branch,
-                sha=self.github_repo_instance.get_contents(
-                    file_path, ref=self.active_branch
-                ).sha,
+                sha=sha,
             )
+            blob_cache.put(self._blob_scope(), self.active_branch, file_path, updated_file_content,
+                           result["content"].sha)
             return "Updated file " + str(file_path)
         except Exception as e:
+            # e.g. a sha conflict with a change pushed by someone else, the file is read again on the next attempt
+            blob_cache.invalidate(self._blob_scope(), self.active_branch, file_path)
             return "Unable to update file due to error:\n" + str(e)
 
     def get_available_tools(self):
@@ -641,6 +775,20 @@ class AlitaGitHubAPIWrapper(GitHubAPIWrapper):
                 "description": DELETE_FILE_PROMPT,
                 "args_schema": DeleteFile,
             },
+            {
+                "ref": self.commit_changes,
+                "name": "commit_changes",
+                "mode": "commit_changes",
+                "description": COMMIT_CHANGES_PROMPT,
+                "args_schema": CommitChanges,
+            },
+            {
+                "ref": self.discard_changes,
+                "name": "discard_changes",
+                "mode": "discard_changes",
+                "description": DISCARD_CHANGES_PROMPT,
+                "args_schema": NoInput,
+            },
             {
                 "ref": self.list_files_in_main_branch,
                 "name": "list_files_in_main_branch",
@@ -677,10 +825,3 @@ class AlitaGitHubAPIWrapper(GitHubAPIWrapper):
                 "args_schema": DirectoryPath,
             }
         ]
-
-    def run(self, name: str, *args: Any, **kwargs: Any):
-        for tool in self.get_available_tools():
-            if tool["name"] == name:
-                return tool["ref"](*args, **kwargs)
-        else:
-            raise ValueError(f"Unknown mode: {name}")
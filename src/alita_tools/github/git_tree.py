@@ -0,0 +1,93 @@
+import logging
+import os
+import threading
+from collections import OrderedDict, deque
+from typing import Any, List, NamedTuple, Tuple
+
+logger = logging.getLogger(__name__)
+
+# number of listed trees kept in memory, a tree sha identifies its content so entries never go stale
+GIT_TREE_CACHE_SIZE = int(os.getenv("ALITA_GIT_TREE_CACHE_SIZE", "32"))
+
+
+class TreeBlob(NamedTuple):
+    path: str
+    mode: str
+    sha: str
+
+
+class GitTreeCache:
+    """Thread-safe LRU cache of recursive file listings keyed by tree sha."""
+
+    def __init__(self, maxsize: int = GIT_TREE_CACHE_SIZE):
+        self.maxsize = maxsize
+        self._trees: OrderedDict[str, Tuple[TreeBlob, ...]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, sha: str):
+        with self._lock:
+            if sha in self._trees:
+                self._trees.move_to_end(sha)
+                return self._trees[sha]
+        return None
+
+    def put(self, sha: str, blobs: Tuple[TreeBlob, ...]):
+        with self._lock:
+            self._trees[sha] = blobs
+            self._trees.move_to_end(sha)
+            while len(self._trees) > self.maxsize:
+                self._trees.popitem(last=False)
+
+
+git_tree_cache = GitTreeCache()
+
+
+def _walk_tree(repo: Any, sha: str) -> Tuple[TreeBlob, ...]:
+    """List the files of a tree relative to it, with one recursive call unless the response is truncated.
+
+    GitHub truncates recursive listings of very large trees, those are split into per-subtree calls.
+    """
+    blobs: List[TreeBlob] = []
+    subtrees = deque([("", sha)])
+    while subtrees:
+        prefix, tree_sha = subtrees.popleft()
+        tree = repo.get_git_tree(tree_sha, recursive=True)
+        if tree.raw_data.get("truncated"):
+            logger.debug(f"Recursive listing of tree {tree_sha} is truncated, listing its subtrees one by one")
+            tree = repo.get_git_tree(tree_sha)
+            for element in tree.tree:
+                if element.type == "tree":
+                    subtrees.append((f"{prefix}{element.path}/", element.sha))
+                elif element.type == "blob":
+                    blobs.append(TreeBlob(f"{prefix}{element.path}", element.mode, element.sha))
+            continue
+        # submodules are "commit" elements, they have no files in this repository
+        blobs.extend(TreeBlob(f"{prefix}{element.path}", element.mode, element.sha)
+                     for element in tree.tree if element.type == "blob")
+    return tuple(sorted(blobs))
+
+
+def list_blobs(repo: Any, tree_sha: str) -> Tuple[TreeBlob, ...]:
+    """List path, mode and blob sha of all files of the tree, cached by tree sha."""
+    blobs = git_tree_cache.get(tree_sha)
+    if blobs is None:
+        blobs = _walk_tree(repo, tree_sha)
+        git_tree_cache.put(tree_sha, blobs)
+    return blobs
+
+
+def list_files(repo: Any, ref: str, directory_path: str = "") -> List[str]:
+    """List all file paths under the directory of the ref (branch, tag or commit sha).
+
+    The ref is resolved with one non-recursive tree call, the recursive listing is cached by tree sha,
+    so listing an unchanged ref again costs a single request.
+    """
+    tree = repo.get_git_tree(ref)
+    directory = directory_path.strip("/")
+    for name in filter(None, directory.split("/")):
+        element = next((element for element in tree.tree if element.path == name and element.type == "tree"), None)
+        if element is None:
+            raise FileNotFoundError(f"Directory '{directory}' is not found in '{ref}'")
+        tree = repo.get_git_tree(element.sha)
+    prefix = f"{directory}/" if directory else ""
+    return [f"{prefix}{blob.path}" for blob in list_blobs(repo, tree.sha)]
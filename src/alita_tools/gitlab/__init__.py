@@ -1,4 +1,4 @@
-from typing import Dict, List, Literal
+from typing import Dict, List, Literal, Optional
 
 from .api_wrapper import GitLabAPIWrapper
 from .tools import __all__
@@ -17,7 +17,8 @@ def get_tools(tool):
         url=tool['settings']['url'],
         repository=tool['settings']['repository'],
         branch=tool['settings']['branch'],
-        private_token=tool['settings']['private_token']
+        private_token=tool['settings']['private_token'],
+        staged_changes=tool['settings'].get('staged_changes', False)
     ).get_tools()
 
 
@@ -33,6 +34,7 @@ class AlitaGitlabToolkit(BaseToolkit):
             repository=(str, FieldInfo(description="GitLab repository")),
             private_token=(str, FieldInfo(description="GitLab private token", json_schema_extra={'secret': True})),
             branch=(str, FieldInfo(description="Main branch", default="main")),
+            staged_changes=(Optional[bool], FieldInfo(description="Stage file changes and commit them together with commit_changes", default=False)),
             selected_tools=(List[Literal[tuple(selected_tools)]], []),
             __config__=ConfigDict(json_schema_extra={'metadata': {"label": "GitLab", "icon_url": None}})
         )
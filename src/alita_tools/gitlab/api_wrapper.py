@@ -4,7 +4,11 @@ from __future__ import annotations
 import json
 from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
-from pydantic import BaseModel, model_validator
+from pydantic import BaseModel, PrivateAttr, model_validator
+
+from ..base.blob_cache import blob_scope
+from ..base.client_cache import get_cached_client, pooled_session
+from .changeset import GitLabChangeset
 
 if TYPE_CHECKING:
     from gitlab.v4.objects import Issue
@@ -25,6 +29,9 @@ class GitLabAPIWrapper(BaseModel):
     """The specific branch in the GitLab repository where the bot will make 
         its commits. Defaults to 'main'.
     """
+    staged_changes: Optional[bool] = False
+    """Collect file actions of a branch and push them as one commit with commit_changes."""
+    _changesets: Dict[str, GitLabChangeset] = PrivateAttr(default_factory=dict)
 
 
     @model_validator(mode='before')
@@ -40,13 +47,17 @@ class GitLabAPIWrapper(BaseModel):
                 "Please install it with `pip install python-gitlab`"
             )
 
-        g = gitlab.Gitlab(
-            url=values['url'],
-            private_token=values['private_token'],
-            keep_base_url=True,
-        )
+        def create_client():
+            g = gitlab.Gitlab(
+                url=values['url'],
+                private_token=values['private_token'],
+                keep_base_url=True,
+                session=pooled_session(),
+            )
+            g.auth()
+            return g
 
-        g.auth()
+        g = get_cached_client('gitlab', values['url'], (values['private_token'],), create_client)
         values["repo_instance"] = g.projects.get(values.get('repository'))
         values['git'] = g
         values['active_branch'] = values.get('branch')
@@ -153,7 +164,7 @@ class GitLabAPIWrapper(BaseModel):
 
     def create_pull_request(self, pr_title: str, pr_body: str) -> str:
         """
-        Makes a pull request from the bot's branch to the base branch
+        Makes a pull request from the bot's branch to the base branch, committing staged changes first
         Parameters:
             pr_query(str): a string which contains the PR title
             and the PR body. The title is the first line
@@ -166,6 +177,11 @@ class GitLabAPIWrapper(BaseModel):
             return f"""Cannot make a pull request because 
             commits are already in the {self.branch} branch"""
         else:
+            changeset = self._changesets.get(self.active_branch)
+            if changeset is not None and len(changeset):
+                result = self.commit_changes()
+                if not result.startswith("Committed"):
+                    return result
             try:
                 pr = self.repo_instance.mergerequests.create(
                     {
@@ -201,6 +217,31 @@ class GitLabAPIWrapper(BaseModel):
             return "Unable to make comment due to error:\n" + str(e)
 
 
+    def _blob_scope(self) -> str:
+        return blob_scope("gitlab", self.url, self.repo_instance.id, (self.private_token,))
+
+    def _changeset(self) -> GitLabChangeset:
+        """Changeset of the active branch, it collects the file actions until they are committed."""
+        if self.active_branch not in self._changesets:
+            self._changesets[self.active_branch] = GitLabChangeset(
+                self.repo_instance, self.active_branch, self._blob_scope()
+            )
+        return self._changesets[self.active_branch]
+
+    def _push(self, changeset: GitLabChangeset, commit_message: str, result: str) -> str:
+        """Commit the staged action right away, unless the wrapper stages changes until commit_changes."""
+        if self.staged_changes:
+            return (
+                f"{result} (staged, {len(changeset)} file action(s) are staged on branch `{changeset.branch}`. "
+                "Use commit_changes to commit them)"
+            )
+        try:
+            changeset.commit(commit_message)
+        except Exception:
+            changeset.discard()
+            raise
+        return result
+
     def create_file(self, file_path: str, file_contents: str) -> str:
         """
         Creates a new file on the gitlab repo
@@ -212,20 +253,11 @@ class GitLabAPIWrapper(BaseModel):
         Returns:
             str: A success or failure message
         """
-        try:
-            self.repo_instance.files.get(file_path, self.active_branch)
+        changeset = self._changeset()
+        if changeset.exists(file_path):
             return f"File already exists at {file_path}. Use update_file instead"
-        except Exception:
-            data = {
-                "branch": self.active_branch,
-                "commit_message": "Create " + file_path,
-                "file_path": file_path,
-                "content": file_contents,
-            }
-
-            self.repo_instance.files.create(data)
-
-            return "Created file " + file_path
+        changeset.create(file_path, file_contents)
+        return self._push(changeset, "Create " + file_path, "Created file " + file_path)
 
     def read_file(self, file_path: str) -> str:
         """
@@ -235,8 +267,7 @@ class GitLabAPIWrapper(BaseModel):
         Returns:
             str: The file decoded as a string
         """
-        file = self.repo_instance.files.get(file_path, self.active_branch)
-        return file.decode().decode("utf-8")
+        return self._changeset().read(file_path)
 
     def update_file(self, file_query: str) -> str:
         """
@@ -265,7 +296,8 @@ class GitLabAPIWrapper(BaseModel):
         try:
             file_path: str = file_query.split("\n")[0]
 
-            file_content = self.read_file(file_path)
+            # a cached read may be outdated, the update is applied to the current content of the branch
+            file_content = self._changeset().read(file_path, use_cache=False)
             updated_file_content = file_content
             for old, new in self.extract_old_new_pairs(file_query):
                 if not old.strip():
@@ -279,20 +311,9 @@ class GitLabAPIWrapper(BaseModel):
                     "the current file contents."
                 )
 
-            commit = {
-                "branch": self.active_branch,
-                "commit_message": "Create " + file_path,
-                "actions": [
-                    {
-                        "action": "update",
-                        "file_path": file_path,
-                        "content": updated_file_content,
-                    }
-                ],
-            }
-
-            self.repo_instance.commits.create(commit)
-            return "Updated file " + file_path
+            changeset = self._changeset()
+            changeset.update(file_path, updated_file_content)
+            return self._push(changeset, "Update " + file_path, "Updated file " + file_path)
         except Exception as e:
             return "Unable to update file due to error:\n" + str(e)
 
@@ -316,25 +337,31 @@ class GitLabAPIWrapper(BaseModel):
         try:
             if not content:
                 return "Content to be added is empty. Append file won't be completed"
-            file_content = self.read_file(file_path)
+            file_content = self._changeset().read(file_path, use_cache=False)
             updated_file_content = f"{file_content}\n{content}"
-            commit = {
-                "branch": self.active_branch,
-                "commit_message": "Append " + file_path,
-                "actions": [
-                    {
-                        "action": "update",
-                        "file_path": file_path,
-                        "content": updated_file_content,
-                    }
-                ],
-            }
-
-            self.repo_instance.commits.create(commit)
-            return "Updated file " + file_path
+            changeset = self._changeset()
+            changeset.update(file_path, updated_file_content)
+            return self._push(changeset, "Append " + file_path, "Updated file " + file_path)
         except Exception as e:
             return "Unable to update file due to error:\n" + str(e)
 
+    def move_file(self, previous_path: str, file_path: str) -> str:
+        """
+        Moves (renames) a file in the repo
+        Parameters:
+            previous_path(str): Current path of the file
+            file_path(str): New path of the file
+        Returns:
+            str: Success or failure message
+        """
+        try:
+            changeset = self._changeset()
+            changeset.move(previous_path, file_path)
+            return self._push(
+                changeset, f"Move {previous_path} to {file_path}", f"Moved file {previous_path} to {file_path}"
+            )
+        except Exception as e:
+            return "Unable to move file due to error:\n" + str(e)
 
     def delete_file(self, file_path: str) -> str:
         """
@@ -345,13 +372,41 @@ class GitLabAPIWrapper(BaseModel):
             str: Success or failure message
         """
         try:
-            self.repo_instance.files.delete(
-                file_path, self.active_branch, "Delete " + file_path
-            )
-            return "Deleted file " + file_path
+            changeset = self._changeset()
+            changeset.delete(file_path)
+            return self._push(changeset, "Delete " + file_path, "Deleted file " + file_path)
         except Exception as e:
             return "Unable to delete file due to error:\n" + str(e)
 
+    def commit_changes(self, commit_message: str = "") -> str:
+        """
+        Commits all staged file actions of the active branch in a single commit
+        Parameters:
+            commit_message(str): The commit message
+        Returns:
+            str: Success or failure message
+        """
+        changeset = self._changeset()
+        if not len(changeset):
+            return f"There are no staged changes on branch `{self.active_branch}`."
+        pending = changeset.pending()
+        try:
+            commit = changeset.commit(commit_message or "\n".join(pending))
+        except Exception as e:
+            return (
+                f"Unable to commit staged changes due to error:\n{e}\n"
+                "If the files were changed meanwhile, discard the staged changes and apply them again."
+            )
+        return f"Committed {len(pending)} file action(s) to branch `{self.active_branch}` in {commit.id}"
+
+    def discard_changes(self) -> str:
+        """
+        Discards all staged file actions of the active branch
+        Returns:
+            str: Success message
+        """
+        return f"Discarded {self._changeset().discard()} staged file action(s) on branch `{self.active_branch}`."
+
     def extract_old_new_pairs(self, file_query):
         # Split the file content by lines
         code_lines = file_query.split("\n")
@@ -0,0 +1,144 @@
+from typing import Any, Dict, List, Optional
+
+from ..base.blob_cache import blob_cache, git_blob_sha
+
+
+class GitLabChangeset:
+    """File actions of one project branch, pushed as a single commit with the commits API.
+
+    Update, move and delete actions carry the last commit id of the file, known from reading or writing it or
+    else fetched when the action is staged, so GitLab rejects the whole commit if the file was changed by someone
+    else meanwhile. Reads see the staged actions. A changeset lives as long as its wrapper and can be committed
+    many times.
+    """
+
+    def __init__(self, project: Any, branch: str, scope: str):
+        self.project = project
+        self.branch = branch
+        self.scope = scope
+        self._actions: Dict[str, Dict[str, Any]] = {}
+        # last commit id of the files read or written through this changeset, by path
+        self._last_commit_ids: Dict[str, str] = {}
+
+    def __len__(self):
+        return len(self._actions)
+
+    def _has_action(self, file_path: str) -> bool:
+        return file_path in self._actions or any(
+            action.get("previous_path") == file_path for action in self._actions.values()
+        )
+
+    def read(self, file_path: str, use_cache: bool = True) -> str:
+        """Read the file as the staged actions leave it, write paths read the branch with use_cache=False."""
+        action = self._actions.get(file_path)
+        if action is not None and "content" in action:
+            return action["content"]
+        if (action is None and self._has_action(file_path)) or (action is not None and action["action"] == "delete"):
+            raise FileNotFoundError(f"`{file_path}` is deleted or moved by the staged changes")
+        # a file moved without changes is still at its previous path on the branch
+        path = action["previous_path"] if action is not None else file_path
+        cached = blob_cache.get(self.scope, self.branch, path) if use_cache else None
+        if cached is not None:
+            return cached[0]
+        return self._fetch(path)
+
+    def _fetch(self, path: str) -> str:
+        file = self.project.files.get(path, self.branch)
+        content = file.decode().decode("utf-8")
+        self._last_commit_ids[path] = file.last_commit_id
+        blob_cache.put(self.scope, self.branch, path, content, file.blob_id)
+        return content
+
+    def exists(self, file_path: str) -> bool:
+        try:
+            self.read(file_path)
+            return True
+        except Exception:
+            return False
+
+    def _stage(self, action: str, file_path: str, content: Optional[str] = None,
+               previous_path: Optional[str] = None):
+        data = {"action": action, "file_path": file_path}
+        if content is not None:
+            data["content"] = content
+        if previous_path is not None:
+            data["previous_path"] = previous_path
+        if action != "create":
+            path = previous_path or file_path
+            if path not in self._last_commit_ids:
+                # e.g. the file was served from the blob cache or not read at all
+                self._fetch(path)
+            data["last_commit_id"] = self._last_commit_ids[path]
+        self._actions[file_path] = data
+
+    def create(self, file_path: str, content: str):
+        previous = self._actions.get(file_path)
+        # re-creating a file deleted in the same changeset is an update of it
+        self._stage("update" if previous and previous["action"] == "delete" else "create", file_path, content)
+
+    def update(self, file_path: str, content: str):
+        previous = self._actions.get(file_path)
+        if previous is not None and previous["action"] in ("create", "move"):
+            previous["content"] = content
+        else:
+            self._stage("update", file_path, content)
+
+    def delete(self, file_path: str):
+        previous = self._actions.get(file_path)
+        if previous is None or previous["action"] in ("update", "delete"):
+            self._stage("delete", file_path)
+            return
+        if previous["action"] == "move":
+            self._stage("delete", previous["previous_path"])
+        # a file created in this changeset is dropped from it, a moved one is deleted at its previous path
+        del self._actions[file_path]
+
+    def move(self, previous_path: str, file_path: str):
+        if self._has_action(previous_path) or self._has_action(file_path):
+            raise ValueError(f"Commit the staged changes of `{previous_path}` and `{file_path}` before moving it")
+        self._stage("move", file_path, previous_path=previous_path)
+
+    def pending(self) -> List[str]:
+        return [
+            f"{action['action']} {action['previous_path'] + ' -> ' if 'previous_path' in action else ''}{path}"
+            for path, action in self._actions.items()
+        ]
+
+    def discard(self) -> int:
+        count = len(self._actions)
+        self._actions.clear()
+        return count
+
+    def commit(self, commit_message: str) -> Any:
+        """Push all staged actions in one commit, the changeset is cleared only if the commit succeeds."""
+        actions = list(self._actions.values())
+        try:
+            commit = self.project.commits.create({
+                "branch": self.branch,
+                "commit_message": commit_message,
+                "actions": actions,
+            })
+        except Exception:
+            # e.g. a file was changed by another commit, the files are read from GitLab again next time
+            for action in actions:
+                for path in filter(None, (action["file_path"], action.get("previous_path"))):
+                    blob_cache.invalidate(self.scope, self.branch, path)
+                    self._last_commit_ids.pop(path, None)
+            raise
+        self._actions.clear()
+        for action in actions:
+            if "previous_path" in action:
+                blob_cache.invalidate(self.scope, self.branch, action["previous_path"])
+                self._last_commit_ids.pop(action["previous_path"], None)
+            if action["action"] == "delete":
+                blob_cache.invalidate(self.scope, self.branch, action["file_path"])
+                self._last_commit_ids.pop(action["file_path"], None)
+                continue
+            if "content" in action:
+                # the blob id GitLab assigns, as stored by reads
+                blob_cache.put(self.scope, self.branch, action["file_path"], action["content"],
+                               git_blob_sha(action["content"]))
+            else:
+                blob_cache.invalidate(self.scope, self.branch, action["file_path"])
+            self._last_commit_ids[action["file_path"]] = commit.id
+        return commit
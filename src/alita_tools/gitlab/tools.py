@@ -299,6 +299,57 @@ class ReadFileTool(BaseTool):
             return f"Unable to read file: {stacktrace}"
 
 
+class MoveFileTool(BaseTool):
+    api_wrapper: GitLabAPIWrapper = Field(default_factory=GitLabAPIWrapper)
+    name: str = "move_file"
+    description: str = """This tool is a wrapper for the GitLab API, useful when you need to move or rename a file in a GitLab repository.
+    **IMPORTANT**: the paths must not start with a slash"""
+    args_schema: Type[BaseModel] = create_model(
+        "MoveFileInput",
+        previous_path=(str, FieldInfo(description="Current file path of the file to be moved. **IMPORTANT**: the path must not start with a slash")),
+        file_path=(str, FieldInfo(description="New file path of the file. **IMPORTANT**: the path must not start with a slash"))
+    )
+
+    def _run(self, previous_path: str, file_path: str):
+        try:
+            return self.api_wrapper.move_file(previous_path, file_path)
+        except Exception:
+            stacktrace = traceback.format_exc()
+            logger.error(f"Unable to move file: {stacktrace}")
+            return f"Unable to move file: {stacktrace}"
+
+
+class CommitChangesTool(BaseTool):
+    api_wrapper: GitLabAPIWrapper = Field(default_factory=GitLabAPIWrapper)
+    name: str = "commit_changes"
+    description: str = """This tool is a wrapper for the GitLab API, useful when you need to commit all staged file changes
+    of the active branch as a single commit. File changes are staged instead of committed one by one when the toolkit is
+    configured with staged changes."""
+    args_schema: Type[BaseModel] = create_model(
+        "CommitChangesInput",
+        commit_message=(str, FieldInfo(default="", description="Message of the commit with all staged changes."))
+    )
+
+    def _run(self, commit_message: str = ""):
+        try:
+            return self.api_wrapper.commit_changes(commit_message)
+        except Exception:
+            stacktrace = traceback.format_exc()
+            logger.error(f"Unable to commit changes: {stacktrace}")
+            return f"Unable to commit changes: {stacktrace}"
+
+
+class DiscardChangesTool(BaseTool):
+    api_wrapper: GitLabAPIWrapper = Field(default_factory=GitLabAPIWrapper)
+    name: str = "discard_changes"
+    description: str = """This tool discards all staged file changes of the active branch which are not committed yet.
+    No input parameters are required."""
+    args_schema: Type[BaseModel] = None
+
+    def _run(self):
+        return self.api_wrapper.discard_changes()
+
+
 __all__ = [
     {"name": "create_branch", "tool": CreateGitLabBranchTool},
     {"name": "create_pull_request", "tool": CreatePRTool},
@@ -311,5 +362,8 @@ __all__ = [
     {"name": "list_branches_in_repo", "tool": ListBranchesTool},
     {"name": "get_pr_changes", "tool": GetPullRequesChanges},
     {"name": "create_pr_change_comment", "tool": CreatePullRequestChangeComment},
-    {"name": "read_file", "tool": ReadFileTool}
+    {"name": "read_file", "tool": ReadFileTool},
+    {"name": "move_file", "tool": MoveFileTool},
+    {"name": "commit_changes", "tool": CommitChangesTool},
+    {"name": "discard_changes", "tool": DiscardChangesTool}
 ]
\ No newline at end of file
@@ -1,4 +1,4 @@
-from typing import List, Literal
+from typing import List, Literal, Optional
 from .api_wrapper import GitLabWorkspaceAPIWrapper
 from langchain_core.tools import BaseToolkit
 from langchain_core.tools import BaseTool
@@ -14,7 +14,8 @@ def get_tools(tool):
         url=tool['settings']['url'],
         repositories=tool['settings'].get('repositories', ''),
         branch=tool['settings']['branch'],
-        private_token=tool['settings']['private_token']
+        private_token=tool['settings']['private_token'],
+        staged_changes=tool['settings'].get('staged_changes', False)
     ).get_tools()
 
 class AlitaGitlabSpaceToolkit(BaseToolkit):
@@ -32,6 +33,7 @@ class AlitaGitlabSpaceToolkit(BaseToolkit):
             )),
             private_token=(str, FieldInfo(description="GitLab private token", json_schema_extra={'secret': True})),
             branch=(str, FieldInfo(description="Main branch", default="main")),
+            staged_changes=(Optional[bool], FieldInfo(description="Stage file changes and commit them together with commit_changes", default=False)),
             selected_tools=(List[Literal[tuple(selected_tools)]], []),
             __config__=ConfigDict(json_schema_extra={'metadata': {"label": "GitLab Org", "icon_url": None}})
         )
@@ -4,10 +4,14 @@ from typing import Optional, Any, List, Dict
 from gitlab import GitlabGetError
 from gitlab.v4.objects import Project
 from langchain_core.tools import ToolException
-from pydantic import BaseModel,  model_validator, PrivateAttr, create_model
+from pydantic import model_validator, PrivateAttr, create_model
 from pydantic.fields import FieldInfo as Field
 
+from ..gitlab.changeset import GitLabChangeset
 from ..gitlab.utils import get_diff_w_position, get_position
+from ..base.api_wrapper import BaseToolApiWrapper
+from ..base.blob_cache import blob_scope
+from ..base.client_cache import get_cached_client, pooled_session
 
 logger = logging.getLogger(__name__)
 
@@ -101,6 +105,25 @@ AppendFileInput = create_model(
     "AppendFileInput",
     file_path=(str, Field(description="File path where new code should be added")),
     content=(str, Field(description="Code to be appended to existing file")),
+    repository=(str, Field(description="Name of the repository", default=None))
+)
+
+GitLabMoveFile = create_model(
+    "GitLabMoveFileModel",
+    previous_path=(str, Field(description="Current path of the file to move")),
+    file_path=(str, Field(description="New path of the file")),
+    repository=(str, Field(description="Name of the repository", default=None))
+)
+
+GitLabCommitChanges = create_model(
+    "GitLabCommitChangesModel",
+    commit_message=(str, Field(description="Message of the commit with all staged changes", default="")),
+    repository=(str, Field(description="Name of the repository", default=None))
+)
+
+GitLabDiscardChanges = create_model(
+    "GitLabDiscardChangesModel",
+    repository=(str, Field(description="Name of the repository", default=None))
 )
 
 _misconfigured_alert = "Misconfigured repositories"
@@ -108,38 +131,45 @@ _undefined_repo_alert = "Unable to get repository"
 
 
 # Toolkit API wrapper
-class GitLabWorkspaceAPIWrapper(BaseModel):
+class GitLabWorkspaceAPIWrapper(BaseToolApiWrapper):
     url: str
     private_token: str
     branch: Optional[str] = 'main'
+    repositories: Optional[str] = ''
     _client: Optional[Any] = PrivateAttr()
-    _repo_instances: Dict[str, Any] = {}
+    _repo_instances: Dict[str, Any] = PrivateAttr(default_factory=dict)
     _active_branch: Optional[str] = PrivateAttr(default='main')
+    staged_changes: Optional[bool] = False
+    _changesets: Dict[tuple, GitLabChangeset] = PrivateAttr(default_factory=dict)
 
     class Config:
         arbitrary_types_allowed = True
 
-    @model_validator(mode='before')
-    @classmethod
-    def validate_toolkit(cls, values):
+    @model_validator(mode='after')
+    def validate_toolkit(self):
         """Validate and set up the GitLab client."""
         try:
             import gitlab
-            g = gitlab.Gitlab(
-                url=values['url'],
-                private_token=values['private_token'],
-                keep_base_url=True,
-            )
-            g.auth()
-            cls._client = g
-            if values.get('repositories'):
+
+            def create_client():
+                g = gitlab.Gitlab(
+                    url=self.url,
+                    private_token=self.private_token,
+                    keep_base_url=True,
+                    session=pooled_session(),
+                )
+                g.auth()
+                return g
+
+            self._client = get_cached_client('gitlab_org', self.url, (self.private_token,), create_client)
+            if self.repositories:
                 import re
-                for repo in re.split(',|;', values.get('repositories')):
-                    cls._repo_instances[repo] = g.projects.get(repo)
-            values['_active_branch'] = values.get('branch', 'main')
+                for repo in re.split(',|;', self.repositories):
+                    self._repo_instances[repo] = self._client.projects.get(repo)
+            self._active_branch = self.branch or 'main'
         except Exception as e:
             raise ImportError(f"Failed to connect to GitLab: {e}")
-        return values
+        return self
 
     def _get_repo_instance(self, repository: str):
         """Get the repository instance, defaulting to the initialized repository if not provided."""
@@ -163,6 +193,9 @@ class GitLabWorkspaceAPIWrapper(BaseModel):
             else:
                 raise e
 
+    def _blob_scope(self, repo_instance: Any) -> str:
+        return blob_scope("gitlab", self.url, repo_instance.id, (self.private_token,))
+
     def set_active_branch(self, branch: str) -> str:
         """Set the active branch for the bot."""
         self._active_branch = branch
@@ -226,7 +259,7 @@ class GitLabWorkspaceAPIWrapper(BaseModel):
             return ToolException(e)
 
     def create_pull_request(self, pr_title: str, pr_body: str, repository: Optional[str] = None) -> str:
-        """Makes a pull request from the bot's branch to the base branch."""
+        """Makes a pull request from the bot's branch to the base branch, committing staged changes first."""
 
         try:
             repo_instance = self._get_repo(repository)
@@ -235,6 +268,12 @@ class GitLabWorkspaceAPIWrapper(BaseModel):
 
         if self.branch == self._active_branch:
             return f"Cannot make a pull request because commits are already in the {self.branch} branch"
+        changeset = self._changesets.get((repo_instance.id, self._active_branch))
+        if changeset is not None and len(changeset):
+            result = self.commit_changes(repository=repository)
+            # a failed commit is returned as a ToolException
+            if not isinstance(result, str) or not result.startswith("Committed"):
+                return result
         try:
             pr = repo_instance.mergerequests.create(
                 {
@@ -284,22 +323,35 @@ class GitLabWorkspaceAPIWrapper(BaseModel):
         except Exception as e:
             return ToolException(e)
 
+    def _changeset(self, repo_instance: Any) -> GitLabChangeset:
+        """Changeset of the active branch of the repository, it collects the file actions until they are committed."""
+        key = (repo_instance.id, self._active_branch)
+        if key not in self._changesets:
+            self._changesets[key] = GitLabChangeset(repo_instance, self._active_branch, self._blob_scope(repo_instance))
+        return self._changesets[key]
+
+    def _push(self, changeset: GitLabChangeset, commit_message: str, result: str) -> str:
+        """Commit the staged action right away, unless the wrapper stages changes until commit_changes."""
+        if self.staged_changes:
+            return (
+                f"{result} (staged, {len(changeset)} file action(s) are staged on branch `{changeset.branch}`. "
+                "Use commit_changes to commit them)"
+            )
+        try:
+            changeset.commit(commit_message)
+        except Exception:
+            changeset.discard()
+            raise
+        return result
+
     def create_file(self, file_path: str, file_contents: str, repository: Optional[str] = None) -> str:
         """Creates a new file on the gitlab repo."""
         try:
-            repo_instance = self._get_repo(repository)
-            try:
-                repo_instance.files.get(file_path, self._active_branch)
+            changeset = self._changeset(self._get_repo(repository))
+            if changeset.exists(file_path):
                 return f"File already exists at {file_path}. Use update_file instead"
-            except Exception:
-                data = {
-                    "branch": self._active_branch,
-                    "commit_message": "Create " + file_path,
-                    "file_path": file_path,
-                    "content": file_contents,
-                }
-                repo_instance.files.create(data)
-                return "Created file " + file_path
+            changeset.create(file_path, file_contents)
+            return self._push(changeset, "Create " + file_path, "Created file " + file_path)
         except Exception as e:
             return ToolException(e)
 
@@ -307,9 +359,7 @@ class GitLabWorkspaceAPIWrapper(BaseModel):
         """Reads a file from the gitlab repo."""
 
         try:
-            repo_instance = self._get_repo(repository)
-            file = repo_instance.files.get(file_path, self._active_branch)
-            return file.decode().decode("utf-8")
+            return self._changeset(self._get_repo(repository)).read(file_path)
         except Exception as e:
             return ToolException(e)
 
@@ -317,7 +367,7 @@ class GitLabWorkspaceAPIWrapper(BaseModel):
         """Updates a file with new content."""
 
         try:
-            repo_instance = self._get_repo(repository)
+            changeset = self._changeset(self._get_repo(repository))
             if self._active_branch == self.branch:
                 return (
                     "You're attempting to commit to the directly"
@@ -325,7 +375,8 @@ class GitLabWorkspaceAPIWrapper(BaseModel):
                     "Please create a new branch and try again."
                 )
             file_path: str = file_query.split("\n")[0]
-            file_content = self.read_file(file_path, repository)
+            # a cached read may be outdated, the update is applied to the current content of the branch
+            file_content = changeset.read(file_path, use_cache=False)
             updated_file_content = file_content
             for old, new in self.extract_old_new_pairs(file_query):
                 if not old.strip():
@@ -337,33 +388,55 @@ class GitLabWorkspaceAPIWrapper(BaseModel):
                     "It may be helpful to use the read_file action to get "
                     "the current file contents."
                 )
-            commit = {
-                "branch": self._active_branch,
-                "commit_message": "Update " + file_path,
-                "actions": [
-                    {
-                        "action": "update",
-                        "file_path": file_path,
-                        "content": updated_file_content,
-                    }
-                ],
-            }
-            repo_instance.commits.create(commit)
-            return "Updated file " + file_path
+            changeset.update(file_path, updated_file_content)
+            return self._push(changeset, "Update " + file_path, "Updated file " + file_path)
         except Exception as e:
             return ToolException(f"Unable to update file due to error: {str(e)}")
 
+    def move_file(self, previous_path: str, file_path: str, repository: Optional[str] = None) -> str:
+        """Moves (renames) a file in the repo."""
+        try:
+            changeset = self._changeset(self._get_repo(repository))
+            changeset.move(previous_path, file_path)
+            return self._push(
+                changeset, f"Move {previous_path} to {file_path}", f"Moved file {previous_path} to {file_path}"
+            )
+        except Exception as e:
+            return ToolException(f"Unable to move file due to error: {str(e)}")
+
     def delete_file(self, file_path: str, repository: Optional[str] = None) -> str:
         """Deletes a file from the repo."""
         try:
-            repo_instance = self._get_repo(repository)
-            repo_instance.files.delete(
-                file_path, self._active_branch, "Delete " + file_path
-            )
-            return "Deleted file " + file_path
+            changeset = self._changeset(self._get_repo(repository))
+            changeset.delete(file_path)
+            return self._push(changeset, "Delete " + file_path, "Deleted file " + file_path)
         except Exception as e:
             return ToolException(f"Unable to delete file due to error: {str(e)}")
 
+    def commit_changes(self, commit_message: str = "", repository: Optional[str] = None) -> str:
+        """Commits all staged file changes of the active branch as a single commit. File changes are staged instead of
+        committed one by one when the toolkit is configured with staged changes."""
+        try:
+            changeset = self._changeset(self._get_repo(repository))
+            if not len(changeset):
+                return f"There are no staged changes on branch `{self._active_branch}`."
+            pending = changeset.pending()
+            commit = changeset.commit(commit_message or "\n".join(pending))
+            return f"Committed {len(pending)} file action(s) to branch `{self._active_branch}` in {commit.id}"
+        except Exception as e:
+            return ToolException(
+                f"Unable to commit staged changes due to error: {str(e)}. "
+                "If the files were changed meanwhile, discard the staged changes and apply them again."
+            )
+
+    def discard_changes(self, repository: Optional[str] = None) -> str:
+        """Discards all staged file changes of the active branch which are not committed yet."""
+        try:
+            discarded = self._changeset(self._get_repo(repository)).discard()
+            return f"Discarded {discarded} staged file action(s) on branch `{self._active_branch}`."
+        except Exception as e:
+            return ToolException(e)
+
     def extract_old_new_pairs(self, file_query):
         """Extract old and new content pairs from the file query."""
         code_lines = file_query.split("\n")
@@ -395,7 +468,7 @@ class GitLabWorkspaceAPIWrapper(BaseModel):
                 current_section_content.append(line)
         return list(zip(old_contents, new_contents))
 
-    def append_file(self, file_path: str, content: str) -> str:
+    def append_file(self, file_path: str, content: str, repository: Optional[str] = None) -> str:
         """
         Appends new content to the end of file.
         Parameters:
@@ -403,10 +476,11 @@ class GitLabWorkspaceAPIWrapper(BaseModel):
                 For example:
                 /test/hello.txt
             content(str): new content.
+            repository(str): name of the repository
         Returns:
             A success or failure message
         """
-        if self.active_branch == self.branch:
+        if self._active_branch == self.branch:
             return (
                 "You're attempting to commit to the directly"
                 f"to the {self.branch} branch, which is protected. "
@@ -415,22 +489,11 @@ class GitLabWorkspaceAPIWrapper(BaseModel):
         try:
             if not content:
                 return "Content to be added is empty. Append file won't be completed"
-            file_content = self.read_file(file_path)
+            changeset = self._changeset(self._get_repo(repository))
+            file_content = changeset.read(file_path, use_cache=False)
             updated_file_content = f"{file_content}\n{content}"
-            commit = {
-                "branch": self.active_branch,
-                "commit_message": "Append " + file_path,
-                "actions": [
-                    {
-                        "action": "update",
-                        "file_path": file_path,
-                        "content": updated_file_content,
-                    }
-                ],
-            }
-
-            self.repo_instance.commits.create(commit)
-            return "Updated file " + file_path
+            changeset.update(file_path, updated_file_content)
+            return self._push(changeset, "Append " + file_path, "Updated file " + file_path)
         except Exception as e:
             return "Unable to update file due to error:\n" + str(e)
 
@@ -551,12 +614,23 @@ class GitLabWorkspaceAPIWrapper(BaseModel):
                 "description": self.append_file.__doc__,
                 "args_schema": AppendFileInput,
                 "ref": self.append_file,
+            },
+            {
+                "name": "move_file",
+                "description": self.move_file.__doc__,
+                "args_schema": GitLabMoveFile,
+                "ref": self.move_file,
+            },
+            {
+                "name": "commit_changes",
+                "description": self.commit_changes.__doc__,
+                "args_schema": GitLabCommitChanges,
+                "ref": self.commit_changes,
+            },
+            {
+                "name": "discard_changes",
+                "description": self.discard_changes.__doc__,
+                "args_schema": GitLabDiscardChanges,
+                "ref": self.discard_changes,
             }
         ]
-
-    def run(self, mode: str, *args: Any, **kwargs: Any):
-        """Run the tool based on the selected mode."""
-        for tool in self.get_available_tools():
-            if tool["name"] == mode:
-                return tool["ref"](*args, **kwargs)
-        raise ValueError(f"Unknown mode: {mode}")
\ No newline at end of file
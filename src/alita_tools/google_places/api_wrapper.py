@@ -1,15 +1,16 @@
 import logging
 from typing import Any, Dict, List, Optional
 
-from pydantic import BaseModel, create_model, model_validator, PrivateAttr
+from pydantic import create_model, model_validator, PrivateAttr
 from pydantic.fields import FieldInfo
 import googlemaps
+from ..base.api_wrapper import BaseToolApiWrapper
 
 logger = logging.getLogger(__name__)
 
 
 # TODO: review langchain-google-community: places_api.py
-class GooglePlacesAPIWrapper(BaseModel):
+class GooglePlacesAPIWrapper(BaseToolApiWrapper):
     api_key: Optional[str] = None
     results_count: Optional[int] = None
     _client: Optional[googlemaps.Client] = PrivateAttr()
@@ -109,10 +110,3 @@ class GooglePlacesAPIWrapper(BaseModel):
                 ),
             }
         ]
-
-    def run(self, mode: str, *args: Any, **kwargs: Any):
-        for tool in self.get_available_tools():
-            if tool["name"] == mode:
-                return tool["ref"](*args, **kwargs)
-        else:
-            raise ValueError(f"Unknown mode: {mode}")
@@ -34,6 +34,7 @@ class JiraToolkit(BaseToolkit):
             token=(Optional[str], FieldInfo(description="Jira token", default=None, json_schema_extra={'secret': True})),
             limit=(int, FieldInfo(description="Limit issues", default=5)),
             verify_ssl=(bool, FieldInfo(description="Verify SSL", default=True)),
+            prefetch_pages=(bool, FieldInfo(description="Fetch search result pages in parallel", default=False)),
             additional_fields=(Optional[str], FieldInfo(description="Additional fields", default="")),
             selected_tools=(List[Literal[tuple(selected_tools)]], []),
             __config__=ConfigDict(json_schema_extra={'metadata': {"label": "Jira", "icon_url": None}})
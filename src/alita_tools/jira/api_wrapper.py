@@ -1,15 +1,24 @@
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from traceback import format_exc
 import json
 from typing import List, Optional, Any, Dict
 from langchain_core.tools import ToolException
-from pydantic import model_validator, BaseModel
+from pydantic import model_validator
 from pydantic import create_model
 from pydantic.fields import FieldInfo, PrivateAttr
 from atlassian import Jira
+from ..base.api_wrapper import BaseToolApiWrapper
+from ..base.client_cache import get_cached_client, pooled_session
 
 logger = logging.getLogger(__name__)
 
+# fields read by JiraApiWrapper._parse_issue, search requests project to these plus additional_fields
+PARSED_ISSUE_FIELDS = ["summary", "description", "created", "updated", "duedate", "priority", "status",
+                       "project", "assignee", "issuelinks"]
+# page size asked from the server, it may return less (maxResults in the response tells how many)
+JQL_PAGE_SIZE = 100
+JQL_PREFETCH_WORKERS = 4
 
 NoInput = create_model(
     "NoInput"
@@ -116,98 +125,104 @@ SUPPORTED_ATTACHMENT_MIME_TYPES = (
     # Add new supported types
 )
 
-class JiraApiWrapper(BaseModel):
+class JiraApiWrapper(BaseToolApiWrapper):
     base_url: str
-    api_version: Optional[str] = "2",
-    api_key: Optional[str] = None,
+    api_version: Optional[str] = "2"
+    api_key: Optional[str] = None
     username: Optional[str] = None
     token: Optional[str] = None
     cloud: Optional[bool] = True
     limit: Optional[int] = 5
     additional_fields: list[str] | str | None = []
     verify_ssl: Optional[bool] = True
+    prefetch_pages: Optional[bool] = False
     _client: Jira = PrivateAttr()
 
     @model_validator(mode='before')
     @classmethod
     def validate_toolkit(cls, values):
-        try:
-            from atlassian import Jira  # noqa: F401
-        except ImportError:
-            raise ImportError(
-                "`atlassian` package not found, please run "
-                "`pip install atlassian-python-api`"
-            )
-
-        url = values['base_url']
-        api_key = values.get('api_key')
-        username = values.get('username')
-        token = values.get('token')
-        cloud = values.get('cloud')
-        api_version = values.get('api_version', '2')
         additional_fields = values.get('additional_fields')
         if isinstance(additional_fields, str):
             values['additional_fields'] = [i.strip() for i in additional_fields.split(',')]
-        if token:
-            cls._client = Jira(url=url, token=token, cloud=cloud, verify_ssl=values['verify_ssl'], api_version=api_version)
-        else:
-            cls._client = Jira(url=url, username=username, password=api_key, cloud=cloud, verify_ssl=values['verify_ssl'], api_version=api_version)
         return values
 
+    @model_validator(mode='after')
+    def init_client(self):
+        url = self.base_url
+        cloud = self.cloud
+        verify_ssl = self.verify_ssl
+        api_version = self.api_version
+        if self.token:
+            self._client = get_cached_client(
+                'jira', url, (self.token, cloud, verify_ssl, api_version),
+                lambda: Jira(url=url, token=self.token, cloud=cloud, verify_ssl=verify_ssl,
+                             api_version=api_version, session=pooled_session())
+            )
+        else:
+            self._client = get_cached_client(
+                'jira', url, (self.username, self.api_key, cloud, verify_ssl, api_version),
+                lambda: Jira(url=url, username=self.username, password=self.api_key, cloud=cloud,
+                             verify_ssl=verify_ssl, api_version=api_version, session=pooled_session())
+            )
+        return self
+
     def _parse_issues(self, issues: Dict) -> List[dict]:
         parsed = []
         for issue in issues["issues"]:
             if len(parsed) >= self.limit:
                 break
-            issue_fields = issue["fields"]
-            key = issue["key"]
-            id = issue["id"]
-            summary = issue_fields["summary"]
-            description = issue_fields["description"]
-            created = issue_fields["created"][0:10]
-            updated = issue_fields["updated"]
-            duedate = issue_fields["duedate"]
-            priority = issue_fields["priority"]["name"]
-            status = issue_fields["status"]["name"]
-            projectId = issue_fields["project"]["id"]
-            issue_url = f"{self._client.url}browse/{key}"
-            try:
-                assignee = issue_fields["assignee"]["displayName"]
-            except Exception:
-                assignee = "None"
-            rel_issues = {}
-            for related_issue in issue_fields["issuelinks"]:
-                if "inwardIssue" in related_issue.keys():
-                    rel_type = related_issue["type"]["inward"]
-                    rel_key = related_issue["inwardIssue"]["key"]
-                    # rel_summary = related_issue["inwardIssue"]["fields"]["summary"]
-                if "outwardIssue" in related_issue.keys():
-                    rel_type = related_issue["type"]["outward"]
-                    rel_key = related_issue["outwardIssue"]["key"]
-                    # rel_summary = related_issue["outwardIssue"]["fields"]["summary"]
-                rel_issues = {"type": rel_type, "key": rel_key, "url": f"{self._client.url}browse/{rel_key}"}
-
-            parsed_issue = {
-                "key": key,
-                "id": id,
-                "projectId": projectId,
-                "summary": summary,
-                "description": description,
-                "created": created,
-                "assignee": assignee,
-                "priority": priority,
-                "status": status,
-                "updated": updated,
-                "duedate": duedate,
-                "url": issue_url,
-                "related_issues": rel_issues,
-            }
-            for field in self.additional_fields:
-                field_value = issue_fields.get(field, None)
-                parsed_issue[field] = field_value
-            parsed.append(parsed_issue)
+            parsed.append(self._parse_issue(issue))
         return parsed
 
+    def _parse_issue(self, issue: dict) -> dict:
+        issue_fields = issue["fields"]
+        key = issue["key"]
+        id = issue["id"]
+        summary = issue_fields["summary"]
+        description = issue_fields["description"]
+        created = issue_fields["created"][0:10]
+        updated = issue_fields["updated"]
+        duedate = issue_fields["duedate"]
+        priority = issue_fields["priority"]["name"]
+        status = issue_fields["status"]["name"]
+        projectId = issue_fields["project"]["id"]
+        issue_url = f"{self._client.url}browse/{key}"
+        try:
+            assignee = issue_fields["assignee"]["displayName"]
+        except Exception:
+            assignee = "None"
+        rel_issues = {}
+        for related_issue in issue_fields["issuelinks"]:
+            if "inwardIssue" in related_issue.keys():
+                rel_type = related_issue["type"]["inward"]
+                rel_key = related_issue["inwardIssue"]["key"]
+                # rel_summary = related_issue["inwardIssue"]["fields"]["summary"]
+            if "outwardIssue" in related_issue.keys():
+                rel_type = related_issue["type"]["outward"]
+                rel_key = related_issue["outwardIssue"]["key"]
+                # rel_summary = related_issue["outwardIssue"]["fields"]["summary"]
+            rel_issues = {"type": rel_type, "key": rel_key, "url": f"{self._client.url}browse/{rel_key}"}
+
+        parsed_issue = {
+            "key": key,
+            "id": id,
+            "projectId": projectId,
+            "summary": summary,
+            "description": description,
+            "created": created,
+            "assignee": assignee,
+            "priority": priority,
+            "status": status,
+            "updated": updated,
+            "duedate": duedate,
+            "url": issue_url,
+            "related_issues": rel_issues,
+        }
+        for field in self.additional_fields:
+            field_value = issue_fields.get(field, None)
+            parsed_issue[field] = field_value
+        return parsed_issue
+
     def _parse_projects(self, projects: List[dict]) -> List[dict]:
         parsed = []
         for project in projects:
@@ -249,9 +264,41 @@ class JiraApiWrapper(BaseModel):
         """)
 
 
+    def _iter_jql(self, jql: str, limit: Optional[int] = None):
+        """Yield issues matching JQL page by page, requesting only the fields used by _parse_issue."""
+        limit = self.limit if limit is None else limit
+        fields = PARSED_ISSUE_FIELDS + [field for field in self.additional_fields or [] if field not in PARSED_ISSUE_FIELDS]
+        first_page = self._client.jql(jql, fields=fields, start=0, limit=min(limit, JQL_PAGE_SIZE))
+        issues = first_page.get("issues", [])[:limit]
+        yield from issues
+        total = min(first_page.get("total", 0), limit)
+        fetched = len(issues)
+        if not issues or fetched >= total:
+            return
+        if self.prefetch_pages:
+            # total is known after the first page, the remaining pages are requested concurrently
+            page_size = first_page.get("maxResults") or len(issues)
+            starts = range(fetched, total, page_size)
+            with ThreadPoolExecutor(max_workers=min(JQL_PREFETCH_WORKERS, len(starts))) as executor:
+                pages = executor.map(
+                    lambda start: self._client.jql(jql, fields=fields, start=start, limit=min(page_size, total - start)),
+                    starts
+                )
+                for page in pages:
+                    yield from page.get("issues", [])
+            return
+        while fetched < total:
+            issues = self._client.jql(
+                jql, fields=fields, start=fetched, limit=min(JQL_PAGE_SIZE, total - fetched)
+            ).get("issues", [])
+            if not issues:
+                break
+            yield from issues
+            fetched += len(issues)
+
     def search_using_jql(self, jql: str):
         """ Search for Jira issues using JQL."""
-        parsed = self._parse_issues(self._client.jql(jql))
+        parsed = [self._parse_issue(issue) for issue in self._iter_jql(jql)]
         if len(parsed) == 0:
             return "No Jira issues found"
         return "Found " + str(len(parsed)) + " Jira issues:\n" + str(parsed)
@@ -510,10 +557,3 @@ class JiraApiWrapper(BaseModel):
 
             }
         ]
-
-    def run(self, mode: str, *args: Any, **kwargs: Any):
-        for tool in self.get_available_tools():
-            if tool["name"] == mode:
-                return tool["ref"](*args, **kwargs)
-        else:
-            raise ValueError(f"Unknown mode: {mode}")
\ No newline at end of file
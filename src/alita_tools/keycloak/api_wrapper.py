@@ -1,38 +1,61 @@
 from typing import Optional, Dict, Any
-from pydantic import BaseModel, model_validator, create_model, FieldInfo, PrivateAttr
+from pydantic import model_validator, create_model, FieldInfo, PrivateAttr
+import httpx
 import requests
 import json
+from ..base.api_wrapper import BaseToolApiWrapper
+from ..base.client_cache import LoopBoundAsyncClient, get_cached_client, pooled_session
 
-class KeycloakApiWrapper(BaseModel):
+class KeycloakApiWrapper(BaseToolApiWrapper):
     base_url: str
     realm: str
     client_id: str
     client_secret: str
     _client: Optional[requests.Session] = PrivateAttr()
+    _async_client: Optional[LoopBoundAsyncClient] = PrivateAttr(default=None)
 
-    @model_validator(mode='before')
-    @classmethod
-    def validate_toolkit(cls, values):
-        base_url = values.get('base_url')
-        realm = values.get('realm')
-        client_id = values.get('client_id')
-        client_secret = values.get('client_secret')
-        cls._client = requests.Session()
-        cls._client.headers.update({'Content-Type': 'application/json'})
-        cls._client.auth = (client_id, client_secret)
-        return values
+    @model_validator(mode='after')
+    def validate_toolkit(self):
+        def create_session():
+            session = pooled_session()
+            session.headers.update({'Content-Type': 'application/json'})
+            session.auth = (self.client_id, self.client_secret)
+            return session
 
-    def get_keycloak_admin_token(self):
+        self._client = get_cached_client(
+            'keycloak', f"{self.base_url}/realms/{self.realm}", (self.client_id, self.client_secret), create_session
+        )
+        return self
+
+    def _get_async_client(self) -> httpx.AsyncClient:
+        if self._async_client is None:
+            self._async_client = LoopBoundAsyncClient(
+                headers={'Content-Type': 'application/json'},
+                auth=(self.client_id, self.client_secret)
+            )
+        return self._async_client.get()
+
+    def _token_request(self):
         url = f"{self.base_url}/realms/{self.realm}/protocol/openid-connect/token"
         payload = {
             'client_id': self.client_id,
             'client_secret': self.client_secret,
             'grant_type': 'client_credentials'
         }
+        return url, payload
+
+    def get_keycloak_admin_token(self):
+        url, payload = self._token_request()
         response = self._client.post(url, data=payload)
         response.raise_for_status()
         return response.json()['access_token']
 
+    async def aget_keycloak_admin_token(self):
+        url, payload = self._token_request()
+        response = await self._get_async_client().post(url, data=payload)
+        response.raise_for_status()
+        return response.json()['access_token']
+
     def execute(self, method: str, relative_url: str, params: Optional[str] = ""):
         """Execute a request to the Keycloak Admin API."""
         if not relative_url.startswith('/'):
@@ -40,12 +63,26 @@ class KeycloakApiWrapper(BaseModel):
 
         full_url = f"{self.base_url}/admin/realms/{self.realm}{relative_url}"
         access_token = self.get_keycloak_admin_token()
+        # the session may be shared with other wrappers, so the token goes to this request only
+        headers = {
+            'Authorization': f'Bearer {access_token}'
+        }
+        payload_params = self.parse_payload_params(params)
+        response = self._client.request(method, full_url, json=payload_params, headers=headers)
+        response.raise_for_status()
+        return response.text
+
+    async def aexecute(self, method: str, relative_url: str, params: Optional[str] = ""):
+        if not relative_url.startswith('/'):
+            raise ValueError("The 'relative_url' must start with '/'.")
+
+        full_url = f"{self.base_url}/admin/realms/{self.realm}{relative_url}"
+        access_token = await self.aget_keycloak_admin_token()
         headers = {
             'Authorization': f'Bearer {access_token}'
         }
-        self._client.headers.update(headers)
         payload_params = self.parse_payload_params(params)
-        response = self._client.request(method, full_url, json=payload_params)
+        response = await self._get_async_client().request(method, full_url, json=payload_params, headers=headers)
         response.raise_for_status()
         return response.text
 
@@ -69,10 +106,3 @@ class KeycloakApiWrapper(BaseModel):
                 ),
             }
         ]
-
-    def run(self, mode: str, *args: Any, **kwargs: Any):
-        for tool in self.get_available_tools():
-            if tool["name"] == mode:
-                return tool["ref"](*args, **kwargs)
-        else:
-            raise ValueError(f"Unknown mode: {mode}")
\ No newline at end of file
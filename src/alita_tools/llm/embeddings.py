@@ -0,0 +1,61 @@
+import logging
+import os
+import threading
+from collections import OrderedDict
+from typing import Optional
+
+from langchain_community.embeddings import HuggingFaceEmbeddings
+
+logger = logging.getLogger(__name__)
+
+EMBEDDINGS_CACHE_SIZE = int(os.getenv("ALITA_EMBEDDINGS_CACHE_SIZE", "2"))
+EMBEDDINGS_BATCH_SIZE = int(os.getenv("ALITA_EMBEDDINGS_BATCH_SIZE", "32"))
+# default model of HuggingFaceEmbeddings
+DEFAULT_EMBEDDINGS_MODEL = "sentence-transformers/all-mpnet-base-v2"
+
+# model name -> embeddings holding the loaded sentence-transformers model
+_models: OrderedDict[str, HuggingFaceEmbeddings] = OrderedDict()
+_models_lock = threading.Lock()
+# one lock per model name, so a slow model load does not block lookups of other models
+_loading_locks: dict[str, threading.Lock] = {}
+
+
+def _load_model(model_name: str) -> HuggingFaceEmbeddings:
+    with _models_lock:
+        if model_name in _models:
+            _models.move_to_end(model_name)
+            return _models[model_name]
+        loading_lock = _loading_locks.setdefault(model_name, threading.Lock())
+    with loading_lock:
+        with _models_lock:
+            if model_name in _models:
+                # loaded by another thread meanwhile
+                _models.move_to_end(model_name)
+                return _models[model_name]
+        logger.info(f"Loading embeddings model {model_name}")
+        embeddings = HuggingFaceEmbeddings(model_name=model_name)
+        with _models_lock:
+            _models[model_name] = embeddings
+            while len(_models) > EMBEDDINGS_CACHE_SIZE:
+                evicted_name, _ = _models.popitem(last=False)
+                logger.debug(f"Evicted embeddings model {evicted_name} from the embeddings cache")
+        return embeddings
+
+
+def get_embeddings(model_name: str = DEFAULT_EMBEDDINGS_MODEL, normalize_embeddings: bool = False,
+                   batch_size: Optional[int] = None) -> HuggingFaceEmbeddings:
+    """Return embeddings backed by a process-wide, lazily loaded model.
+
+    Model weights are loaded once per model name and kept in an LRU of ALITA_EMBEDDINGS_CACHE_SIZE models,
+    every call gets a lightweight copy sharing the loaded model with its own encode settings.
+    """
+    embeddings = _load_model(model_name)
+    return embeddings.model_copy(update={"encode_kwargs": {
+        "normalize_embeddings": normalize_embeddings,
+        "batch_size": batch_size or EMBEDDINGS_BATCH_SIZE,
+    }})
+
+
+def clear_embeddings_cache():
+    with _models_lock:
+        _models.clear()
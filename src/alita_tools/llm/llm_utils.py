@@ -2,6 +2,9 @@ from langchain_community.chat_models import __all__ as chat_models  # pylint: di
 from langchain_community.llms import __getattr__ as get_llm, __all__ as llms  # pylint: disable=E0401
 from langchain_core.output_parsers import StrOutputParser
 from langchain_core.prompts import PromptTemplate
+from typing import List, Optional
+
+from .summary_cache import SUMMARY_CACHE_ENABLED, summary_cache, model_id, text_hash
 
 
 def get_model(model_type: str, model_params: dict):
@@ -24,8 +27,30 @@ def get_model(model_type: str, model_params: dict):
 
 def summarize(llm, summarization_prompt: str, data_to_summarize: str, summarization_key: str):
     """ Summarize the passed data using the LLM or ChatLLM """
+    return summarize_batch(llm, summarization_prompt, [data_to_summarize], summarization_key)[0]
+
+
+def summarize_batch(llm, summarization_prompt: str, data_to_summarize: List[str], summarization_key: str,
+                    max_concurrency: Optional[int] = None, use_cache: Optional[bool] = None,
+                    return_exceptions: bool = False):
+    """ Summarize a batch of data using the LLM or ChatLLM, reusing cached summaries of already seen data if the
+    summary cache is enabled (ALITA_SUMMARY_CACHE, overridden by use_cache) and the model name is known """
     if llm is None:
-        return data_to_summarize
-    prompt = PromptTemplate.from_template(summarization_prompt)
-    chain = {summarization_key: lambda x: x} | prompt | llm | StrOutputParser()
-    return chain.invoke(data_to_summarize)
+        return list(data_to_summarize)
+    model = model_id(llm)
+    use_cache = (SUMMARY_CACHE_ENABLED if use_cache is None else use_cache) and model is not None
+    cached = summary_cache.get_many(summarization_prompt, model, data_to_summarize) if use_cache else {}
+    # identical texts are summarized once
+    to_summarize = list(dict.fromkeys(data for data in data_to_summarize if text_hash(data) not in cached))
+    summaries = {}
+    if to_summarize:
+        prompt = PromptTemplate.from_template(summarization_prompt)
+        chain = {summarization_key: lambda x: x} | prompt | llm | StrOutputParser()
+        results = chain.batch(to_summarize, config={"max_concurrency": max_concurrency},
+                              return_exceptions=return_exceptions)
+        summaries = dict(zip(to_summarize, results))
+        if use_cache:
+            summary_cache.put_many(summarization_prompt, model, {
+                data: summary for data, summary in summaries.items() if not isinstance(summary, Exception)
+            })
+    return [summaries[data] if data in summaries else cached[text_hash(data)] for data in data_to_summarize]
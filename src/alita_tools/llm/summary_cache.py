@@ -0,0 +1,116 @@
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+# summaries are persisted only if enabled, by ALITA_SUMMARY_CACHE or the `use_cache` argument of summarize_batch
+SUMMARY_CACHE_ENABLED = os.getenv("ALITA_SUMMARY_CACHE", "false").lower() == "true"
+SUMMARY_CACHE_PATH = os.getenv(
+    "ALITA_SUMMARY_CACHE_PATH", os.path.join(os.path.expanduser("~"), ".cache", "alita_tools", "summaries.sqlite3")
+)
+
+
+def text_hash(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+# settings of the common chat models changing what a summary looks like, besides their identifying params
+_MODEL_CONFIG_ATTRS = ("deployment_name", "azure_endpoint", "openai_api_base", "base_url", "endpoint_url",
+                       "temperature", "top_p", "max_tokens")
+
+
+def model_id(llm) -> Optional[str]:
+    """Identify the model configuration used for summarization, summaries of differently configured models are
+    cached separately. None if the model name is not known, such summaries are not cached."""
+    name = next((value for value in (getattr(llm, attr, None) for attr in ("model_name", "model", "deployment_name"))
+                 if isinstance(value, str) and value), None)
+    if name is None:
+        return None
+    try:
+        config = dict(getattr(llm, "_identifying_params", None) or {})
+    except Exception:
+        config = {}
+    config.update({attr: getattr(llm, attr) for attr in _MODEL_CONFIG_ATTRS if getattr(llm, attr, None) is not None})
+    # the configuration is hashed, so that no endpoint or secret ends up in the cache in clear text
+    return f"{type(llm).__name__}:{name}:{text_hash(json.dumps(config, sort_keys=True, default=str))}"
+
+
+class SummaryCache:
+    """Persistent cache of LLM summaries keyed by (prompt hash, model, text hash).
+
+    Summaries are stored in a SQLite database shared by all wrappers of the process (and by later runs),
+    so summarizing the same text with the same prompt and model again costs no LLM call. The cache is used
+    only if enabled with ALITA_SUMMARY_CACHE=true or by the caller.
+    """
+
+    def __init__(self, path: str = SUMMARY_CACHE_PATH):
+        self.path = path
+        self._connection: Optional[sqlite3.Connection] = None
+        self._disabled = False
+        self._lock = threading.Lock()
+
+    def _connect(self) -> Optional[sqlite3.Connection]:
+        # opened on first use, importing the module does not touch the file system
+        if self._connection is None and not self._disabled:
+            try:
+                if os.path.dirname(self.path):
+                    os.makedirs(os.path.dirname(self.path), exist_ok=True)
+                connection = sqlite3.connect(self.path, check_same_thread=False)
+                connection.execute(
+                    "CREATE TABLE IF NOT EXISTS summaries ("
+                    "prompt_hash TEXT, model TEXT, text_hash TEXT, summary TEXT, "
+                    "PRIMARY KEY (prompt_hash, model, text_hash))"
+                )
+                connection.commit()
+                self._connection = connection
+            except (sqlite3.Error, OSError) as e:
+                # e.g. a read-only home directory, summaries are then computed without caching
+                logger.warning(f"Summary cache is disabled, {self.path} can not be opened: {e}")
+                self._disabled = True
+        return self._connection
+
+    def get_many(self, prompt: str, model: str, texts: list[str]) -> dict[str, str]:
+        """Return cached summaries by text hash for the given texts."""
+        text_hashes = list({text_hash(text) for text in texts})
+        found = {}
+        with self._lock:
+            try:
+                connection = self._connect()
+                if connection is None:
+                    return found
+                # stay below the SQLite limit of host parameters
+                for i in range(0, len(text_hashes), 500):
+                    chunk = text_hashes[i:i + 500]
+                    rows = connection.execute(
+                        f"SELECT text_hash, summary FROM summaries WHERE prompt_hash = ? AND model = ? "
+                        f"AND text_hash IN ({','.join('?' * len(chunk))})",
+                        (text_hash(prompt), model, *chunk)
+                    ).fetchall()
+                    found.update(rows)
+            except sqlite3.Error as e:
+                logger.warning(f"Summary cache is not available: {e}")
+        return found
+
+    def put_many(self, prompt: str, model: str, summaries: dict[str, str]):
+        """Store summaries given by text."""
+        prompt_hash = text_hash(prompt)
+        with self._lock:
+            try:
+                connection = self._connect()
+                if connection is None:
+                    return
+                connection.executemany(
+                    "INSERT OR REPLACE INTO summaries VALUES (?, ?, ?, ?)",
+                    [(prompt_hash, model, text_hash(text), summary) for text, summary in summaries.items()]
+                )
+                connection.commit()
+            except sqlite3.Error as e:
+                logger.warning(f"Summary cache is not available: {e}")
+
+
+summary_cache = SummaryCache()
@@ -0,0 +1,79 @@
+import os
+from concurrent.futures import Future
+from functools import lru_cache
+from typing import Any, Callable, Dict, List
+
+from ..base.api_wrapper import _tools_executor
+
+PR_SUMMARY_MAX_TOKENS = int(os.getenv("ALITA_PR_SUMMARY_MAX_TOKENS", "2000"))
+# max number of comments or commits packed into a summary
+PR_SUMMARY_MAX_ITEMS = 10
+
+
+@lru_cache(maxsize=None)
+def get_encoder(encoding_name: str = "cl100k_base"):
+    """Load a tiktoken encoding once per process, loading it reads the BPE ranks from disk or network."""
+    try:
+        import tiktoken
+    except ImportError:
+        raise ImportError("tiktoken is not installed. Please install it with `pip install tiktoken`")
+    return tiktoken.get_encoding(encoding_name)
+
+
+def count_tokens(text: str, encoding_name: str = "cl100k_base") -> int:
+    return len(get_encoder(encoding_name).encode(text, disallowed_special=()))
+
+
+class TokenBudget:
+    def __init__(self, max_tokens: int):
+        self.max_tokens = max_tokens
+        self.used = 0
+
+    def add(self, text: str) -> bool:
+        """Take the tokens of the text from the budget, if they fit."""
+        tokens = count_tokens(text)
+        if self.used + tokens > self.max_tokens:
+            return False
+        self.used += tokens
+        return True
+
+
+def summarize_pull_request(fields: Dict[str, str], sections: Dict[str, Callable[[int], List[str]]],
+                           max_tokens: int = PR_SUMMARY_MAX_TOKENS,
+                           max_items: int = PR_SUMMARY_MAX_ITEMS) -> Dict[str, Any]:
+    """Pack a pull (merge) request into a dict fitting in max_tokens.
+
+    `fields` are packed first, in order, each one only if it fits. `sections` map a key, e.g. "comments" or
+    "commits", to a function returning the formatted items of a page (0-based), an empty page ends the section.
+    The first pages of all sections are fetched concurrently in the shared tools thread pool, further pages of
+    a section are fetched only while its items fit in the budget and max_items is not reached.
+    """
+    budget = TokenBudget(max_tokens)
+    summary: Dict[str, Any] = {key: value for key, value in fields.items() if budget.add(value)}
+    if not sections:
+        return summary
+    first_pages: Dict[str, Future] = {key: _tools_executor.submit(fetch_page, 0) for key, fetch_page in sections.items()}
+    try:
+        for key, fetch_page in sections.items():
+            items: List[str] = []
+            # the caller may itself run in the pool, a page still waiting for a free thread is fetched here instead
+            page_items = fetch_page(0) if first_pages[key].cancel() else first_pages[key].result()
+            page = 0
+            while page_items and _pack(page_items, items, budget, max_items):
+                page += 1
+                page_items = fetch_page(page)
+            summary[key] = str(items)
+    finally:
+        # first pages no longer needed, e.g. after a failed fetch, do not keep threads of the shared pool busy
+        for future in first_pages.values():
+            future.cancel()
+    return summary
+
+
+def _pack(page_items: List[str], items: List[str], budget: TokenBudget, max_items: int) -> bool:
+    """Append the page items while they fit, returns whether the next page may still fit as well."""
+    for item in page_items:
+        if len(items) >= max_items or not budget.add(item):
+            return False
+        items.append(item)
+    return len(items) < max_items
@@ -2,12 +2,12 @@ import glob
 import logging
 import os
 from traceback import format_exc
-from typing import Any
 
 from git import Repo
-from pydantic import model_validator, BaseModel, create_model
+from pydantic import model_validator, create_model
 from langchain_core.tools import ToolException
 from pydantic.fields import FieldInfo
+from ..base.api_wrapper import BaseToolApiWrapper
 
 logger = logging.getLogger(__name__)
 CREATE_FILE_PROMPT = """Create new file in your local repository."""
@@ -103,7 +103,7 @@ UpdateFile = create_model(
 )
 
 
-class LocalGit(BaseModel):
+class LocalGit(BaseToolApiWrapper):
     repo_path: str
     base_path: str
     repo_url: str = None
@@ -412,10 +412,3 @@ class LocalGit(BaseModel):
                 "args_schema": CommitChanges,
             },
         ]
-
-    def run(self, name: str, *args: Any, **kwargs: Any):
-        for tool in self.get_available_tools():
-            if tool["name"] == name:
-                return tool["ref"](*args, **kwargs)
-        else:
-            raise ValueError(f"Unknown mode: {name}")
@@ -4,10 +4,12 @@ from typing import Any, Optional
 
 import chardet
 import pandas as pd
-from pydantic import BaseModel, create_model, FieldInfo, model_validator, PrivateAttr
+from pydantic import create_model, FieldInfo, model_validator, PrivateAttr
 
+from ..base.api_wrapper import BaseToolApiWrapper
 
-class CSVToolApiWrapper(BaseModel):
+
+class CSVToolApiWrapper(BaseToolApiWrapper):
     csv_content: Any
     _length_to_sniff: int = 1024
 
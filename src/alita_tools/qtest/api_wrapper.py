@@ -1,17 +1,25 @@
+import html
 import logging
+import math
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
 import swagger_client
-from pydantic import model_validator, BaseModel
 from langchain_core.tools import ToolException
-from pydantic import create_model, model_validator, BaseModel
+from pydantic import create_model, model_validator
 from pydantic.fields import FieldInfo, PrivateAttr
 from sklearn.feature_extraction.text import strip_tags
 from swagger_client import TestCaseApi, SearchApi, PropertyResource
 from swagger_client.rest import ApiException
+from ..base.api_wrapper import BaseToolApiWrapper
 
 logger = logging.getLogger(__name__)
 
+# max number of DQL search pages requested at the same time
+DQL_SEARCH_WORKERS = 4
+# test case properties exposed as columns of the parsed search results
+PARSED_PROPERTIES = ('Status', 'Automation', 'Type', 'Priority')
+
 QtestDataQuerySearch = create_model(
     "QtestDataQuerySearch",
     dql=(str, FieldInfo(description="Qtest Data Query Language (DQL) query string")))
@@ -64,7 +72,7 @@ Create a table with these columns. For multi-step cases, fill Id, Name, Descript
 """
 
 
-class QtestApiWrapper(BaseModel):
+class QtestApiWrapper(BaseToolApiWrapper):
     base_url: str
     project_id: int
     qtest_api_token: str
@@ -183,32 +191,25 @@ class QtestApiWrapper(BaseModel):
                 f"Unable to create test case in project - {self.project_id} with the following content:\n{test_case_content}.")
 
     def __parse_data(self, response_to_parse: dict, parsed_data: list):
-        import html
         for item in response_to_parse['items']:
+            # values of a property listed more than once are concatenated
+            properties = {name: [] for name in PARSED_PROPERTIES}
+            for prop in item['properties']:
+                if prop['field_name'] in properties:
+                    properties[prop['field_name']].append(prop['field_value_name'] or '')
             parsed_data_row = {
                 'Id': item['pid'],
                 'Description': html.unescape(strip_tags(item['description'])),
                 'Precondition': html.unescape(strip_tags(item['precondition'])),
                 'Name': item['name'],
                 'Qtest Id': item['id'],
-                'Test Step Description': '\n'.join(map(str,
-                                                       [html.unescape(
-                                                           strip_tags(str(item['order']) + '. ' + item['description']))
-                                                           for item in item['test_steps']
-                                                           for key in item if key == 'description'])),
-                'Test Expected Result': '\n'.join(map(str,
-                                                      [html.unescape(
-                                                          strip_tags(str(item['order']) + '. ' + item['expected']))
-                                                          for item in item['test_steps']
-                                                          for key in item if key == 'expected'])),
-                'Status': ''.join([properties['field_value_name'] for properties in item['properties']
-                                   if properties['field_name'] == 'Status']),
-                'Automation': ''.join([properties['field_value_name'] for properties in item['properties']
-                                       if properties['field_name'] == 'Automation']),
-                'Type': ''.join([properties['field_value_name'] for properties in item['properties']
-                                 if properties['field_name'] == 'Type']),
-                'Priority': ''.join([properties['field_value_name'] for properties in item['properties']
-                                     if properties['field_name'] == 'Priority']),
+                'Test Step Description': '\n'.join(
+                    html.unescape(strip_tags(str(step['order']) + '. ' + step['description']))
+                    for step in item['test_steps'] if 'description' in step),
+                'Test Expected Result': '\n'.join(
+                    html.unescape(strip_tags(str(step['order']) + '. ' + step['expected']))
+                    for step in item['test_steps'] if 'expected' in step),
+                **{name: ''.join(values) for name, values in properties.items()},
             }
             parsed_data.append(parsed_data_row)
 
@@ -219,20 +220,32 @@ class QtestApiWrapper(BaseModel):
         append_test_steps = 'true'
         include_external_properties = 'true'
         parsed_data = []
+
+        def search_page(page: int):
+            return search_instance.search_artifact(self.project_id, body, append_test_steps=append_test_steps,
+                                                   include_external_properties=include_external_properties,
+                                                   page_size=self.no_of_items_per_page, page=page)
+
         try:
-            api_response = search_instance.search_artifact(self.project_id, body, append_test_steps=append_test_steps,
-                                                           include_external_properties=include_external_properties,
-                                                           page_size=self.no_of_items_per_page, page=self.page)
+            api_response = search_page(self.page)
             self.__parse_data(api_response, parsed_data)
 
-            if api_response['links']:
-                while api_response['links'][0]['rel'] == 'next':
-                    next_page = self.page + 1
-                    api_response = search_instance.search_artifact(self.project_id, body,
-                                                                   append_test_steps=append_test_steps,
-                                                                   include_external_properties=include_external_properties,
-                                                                   page_size=self.no_of_items_per_page, page=next_page)
+            if api_response.get('total') is None:
+                # without the total, pages are requested one by one until an empty one
+                page = self.page
+                while api_response.get('items'):
+                    page += 1
+                    api_response = search_page(page)
                     self.__parse_data(api_response, parsed_data)
+                return parsed_data
+
+            # the first response tells the total, the remaining pages are independent and fetched concurrently
+            last_page = math.ceil(api_response['total'] / self.no_of_items_per_page)
+            next_pages = range(self.page + 1, last_page + 1)
+            if next_pages:
+                with ThreadPoolExecutor(max_workers=min(DQL_SEARCH_WORKERS, len(next_pages))) as executor:
+                    for api_response in executor.map(search_page, next_pages):
+                        self.__parse_data(api_response, parsed_data)
         except ApiException as e:
             logger.error("Exception when calling SearchApi->search_artifact: %s\n" % e)
             raise ToolException(
@@ -348,10 +361,3 @@ class QtestApiWrapper(BaseModel):
                 "ref": self.delete_test_case,
             },
         ]
-
-    def run(self, mode: str, *args: Any, **kwargs: Any):
-        for tool in self.get_available_tools():
-            if tool["name"] == mode:
-                return tool["ref"](*args, **kwargs)
-        else:
-            raise ValueError(f"Unknown mode: {mode}")
@@ -1,12 +1,13 @@
 import logging
 import json
-from typing import Optional, Any
+from typing import Optional
 
 from pyral import Rally
-from pydantic import model_validator, BaseModel
+from pydantic import model_validator
 from langchain_core.tools import ToolException
 from pydantic import create_model, PrivateAttr
 from pydantic.fields import FieldInfo
+from ..base.api_wrapper import BaseToolApiWrapper
 
 logger = logging.getLogger(__name__)
 
@@ -81,7 +82,7 @@ RallyUpdateArtifact = create_model(
 
 
 # Toolkit API wrapper
-class RallyApiWrapper(BaseModel):
+class RallyApiWrapper(BaseToolApiWrapper):
     server: str
     api_key: Optional[str] = None
     username: Optional[str] = None
@@ -282,10 +283,3 @@ class RallyApiWrapper(BaseModel):
                 "ref": self.update_entity,
             }
         ]
-
-    def run(self, mode: str, *args: Any, **kwargs: Any):
-        """Run the tool based on the selected mode."""
-        for tool in self.get_available_tools():
-            if tool["name"] == mode:
-                return tool["ref"](*args, **kwargs)
-        raise ValueError(f"Unknown mode: {mode}")
\ No newline at end of file
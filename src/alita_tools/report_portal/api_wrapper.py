@@ -1,11 +1,13 @@
 import logging
-from typing import Any, Optional
+from typing import Optional
 
 import pymupdf
-from pydantic import BaseModel, model_validator, create_model
+from pydantic import model_validator, create_model
 from pydantic.fields import FieldInfo, PrivateAttr
 
 from .report_portal_client import RPClient
+from ..base.api_wrapper import BaseToolApiWrapper, run_in_tools_executor
+from ..base.client_cache import get_cached_client
 
 logger = logging.getLogger(__name__)
 
@@ -49,31 +51,22 @@ GetDashboardData = create_model(
 )
 
 
-class ReportPortalApiWrapper(BaseModel):
+class ReportPortalApiWrapper(BaseToolApiWrapper):
     endpoint: str
     api_key: str
     project: str
     _client: Optional[RPClient] = PrivateAttr()
 
-    @model_validator(mode='before')
-    @classmethod
-    def validate_toolkit(cls, values):
-
-        endpoint = values.get('endpoint')
-        api_key = values.get('api_key')
-        project = values.get('project')
-        cls._client = RPClient(endpoint=endpoint, api_key=api_key, project=project)
-        return values
-
-    def export_specified_launch(self, launch_id: str, format: str = 'html') -> str | None:
-        """
-        Use the exported data from a specific launch to generate a comprehensive test report for management.
-        The AI can analyze the results, highlight key metrics, and provide insights into test coverage,
-        defect density, and test execution trends.
-        Returns content of the report.
-        """
-        response = self._client.export_specified_launch(launch_id, format)
+    @model_validator(mode='after')
+    def validate_toolkit(self):
+        self._client = get_cached_client(
+            'report_portal', f"{self.endpoint}/{self.project}", (self.api_key,),
+            lambda: RPClient(endpoint=self.endpoint, api_key=self.api_key, project=self.project)
+        )
+        return self
 
+    @staticmethod
+    def _parse_exported_launch(launch_id: str, format: str, response) -> str | None:
         if not response.headers['Content-Disposition']:
             logger.warning(f"Exported data for launch {launch_id} is empty.")
             return None
@@ -90,6 +83,21 @@ class ReportPortalApiWrapper(BaseModel):
             logger.warning(f"Exported data for launch {launch_id} is in an unsupported format.")
             return None
 
+    def export_specified_launch(self, launch_id: str, format: str = 'html') -> str | None:
+        """
+        Use the exported data from a specific launch to generate a comprehensive test report for management.
+        The AI can analyze the results, highlight key metrics, and provide insights into test coverage,
+        defect density, and test execution trends.
+        Returns content of the report.
+        """
+        response = self._client.export_specified_launch(launch_id, format)
+        return self._parse_exported_launch(launch_id, format, response)
+
+    async def aexport_specified_launch(self, launch_id: str, format: str = 'html') -> str | None:
+        response = await self._client.aexport_specified_launch(launch_id, format)
+        # report parsing is CPU bound, keep it off the event loop
+        return await run_in_tools_executor(self._parse_exported_launch, launch_id, format, response)
+
     def get_launch_details(self, launch_id: str) -> dict:
         """
         Retrieve detailed information about a launch to perform a root cause analysis of failures.
@@ -98,6 +106,9 @@ class ReportPortalApiWrapper(BaseModel):
         """
         return self._client.get_launch_details(launch_id)
 
+    async def aget_launch_details(self, launch_id: str) -> dict:
+        return await self._client.aget_launch_details(launch_id)
+
     def get_all_launches(self, page_number: int = 1) -> dict:
         """
         Analyze the data from all launches to track the progress of testing activities over time.
@@ -107,6 +118,9 @@ class ReportPortalApiWrapper(BaseModel):
         """
         return self._client.get_all_launches(page_number)
 
+    async def aget_all_launches(self, page_number: int = 1) -> dict:
+        return await self._client.aget_all_launches(page_number)
+
     def find_test_item_by_id(self, item_id: str) -> dict:
         """
         Fetch specific test items to perform detailed analysis on individual test cases. It can evaluate
@@ -115,6 +129,9 @@ class ReportPortalApiWrapper(BaseModel):
         """
         return self._client.find_test_item_by_id(item_id)
 
+    async def afind_test_item_by_id(self, item_id: str) -> dict:
+        return await self._client.afind_test_item_by_id(item_id)
+
     def get_test_items_for_launch(self, launch_id: str, page_number: int = 1) -> dict:
         """
         Compile all test items from a launch to create a test execution summary.
@@ -124,6 +141,9 @@ class ReportPortalApiWrapper(BaseModel):
         """
         return self._client.get_test_items_for_launch(launch_id, page_number)
 
+    async def aget_test_items_for_launch(self, launch_id: str, page_number: int = 1) -> dict:
+        return await self._client.aget_test_items_for_launch(launch_id, page_number)
+
     def get_logs_for_test_items(self, item_id: str, page_number: int = 1) -> dict:
         """
         Process the logs for test items to assist in automated debugging.
@@ -133,6 +153,9 @@ class ReportPortalApiWrapper(BaseModel):
         """
         return self._client.get_logs_for_test_items(item_id, page_number)
 
+    async def aget_logs_for_test_items(self, item_id: str, page_number: int = 1) -> dict:
+        return await self._client.aget_logs_for_test_items(item_id, page_number)
+
     def get_user_information(self, username: str) -> dict:
         """
         Use user information to personalize dashboards and reports. It can also analyze user activity to optimize
@@ -140,6 +163,9 @@ class ReportPortalApiWrapper(BaseModel):
         """
         return self._client.get_user_information(username)
 
+    async def aget_user_information(self, username: str) -> dict:
+        return await self._client.aget_user_information(username)
+
     def get_dashboard_data(self, dashboard_id: str) -> dict:
         """
         Analyze dashboard data to create executive summaries that highlight key performance indicators (KPIs),
@@ -148,6 +174,9 @@ class ReportPortalApiWrapper(BaseModel):
         """
         return self._client.get_dashboard_data(dashboard_id)
 
+    async def aget_dashboard_data(self, dashboard_id: str) -> dict:
+        return await self._client.aget_dashboard_data(dashboard_id)
+
     def get_available_tools(self):
         return [
             {
@@ -199,10 +228,3 @@ class ReportPortalApiWrapper(BaseModel):
                 "ref": self.get_dashboard_data,
             }
         ]
-
-    def run(self, mode: str, *args: Any, **kwargs: Any):
-        for tool in self.get_available_tools():
-            if tool["name"] == mode:
-                return tool["ref"](*args, **kwargs)
-        else:
-            raise ValueError(f"Unknown mode: {mode}")
@@ -1,5 +1,8 @@
+import httpx
 import requests
 
+from ..base.client_cache import LoopBoundAsyncClient, pooled_session
+
 
 class RPClient():
     def __init__(self, endpoint: str, project: str, api_key: str):
@@ -8,6 +11,8 @@ class RPClient():
         self.api_key = api_key
         self.project = project
         self._create_session_headers()
+        self._session = pooled_session()
+        self._async_client = LoopBoundAsyncClient(headers=self.headers)
 
     def _create_session_headers(self):
         self.headers = {
@@ -15,61 +20,70 @@ class RPClient():
             "Authorization": f"Bearer {self.api_key}"
         }
 
-    def export_specified_launch(self, launch_id: str, export_format: str):
+    def _get(self, url: str) -> requests.Response:
+        response = self._session.request("GET", url, headers=self.headers)
+        response.raise_for_status()
+        return response
+
+    async def _aget(self, url: str) -> httpx.Response:
+        response = await self._async_client.get().get(url)
+        response.raise_for_status()
+        return response
+
+    def _export_launch_url(self, launch_id: str, export_format: str) -> str:
         url = f"{self.endpoint}/api/v1/{self.project}/launch/{launch_id}/report"
         if export_format:
             url += f"?view={export_format}"
+        return url
 
-        response = requests.request("GET", url, headers=self.headers)
-        response.raise_for_status()
+    def export_specified_launch(self, launch_id: str, export_format: str):
+        return self._get(self._export_launch_url(launch_id, export_format))
 
-        return response
+    async def aexport_specified_launch(self, launch_id: str, export_format: str):
+        return await self._aget(self._export_launch_url(launch_id, export_format))
 
     def get_launch_details(self, launch_id):
-        url = f"{self.endpoint}/api/v1/{self.project}/launch/{launch_id}"
-        response = requests.request("GET", url, headers=self.headers)
-        response.raise_for_status()
+        return self._get(f"{self.endpoint}/api/v1/{self.project}/launch/{launch_id}").json()
 
-        return response.json()
+    async def aget_launch_details(self, launch_id):
+        return (await self._aget(f"{self.endpoint}/api/v1/{self.project}/launch/{launch_id}")).json()
 
     def get_all_launches(self, page_number: int):
-        url = f"{self.endpoint}/api/v1/{self.project}/launch?page.page={page_number}"
-        response = requests.request("GET", url, headers=self.headers)
-        response.raise_for_status()
+        return self._get(f"{self.endpoint}/api/v1/{self.project}/launch?page.page={page_number}").json()
 
-        return response.json()
+    async def aget_all_launches(self, page_number: int):
+        return (await self._aget(f"{self.endpoint}/api/v1/{self.project}/launch?page.page={page_number}")).json()
 
     def find_test_item_by_id(self, item_id: str):
-        url = f"{self.endpoint}/api/v1/{self.project}/item/{item_id}"
-        response = requests.request("GET", url, headers=self.headers)
-        response.raise_for_status()
+        return self._get(f"{self.endpoint}/api/v1/{self.project}/item/{item_id}").json()
 
-        return response.json()
+    async def afind_test_item_by_id(self, item_id: str):
+        return (await self._aget(f"{self.endpoint}/api/v1/{self.project}/item/{item_id}")).json()
 
     def get_test_items_for_launch(self, launch_id: str, page_number: int):
         url = f"{self.endpoint}/api/v1/{self.project}/item?filter.eq.launchId={launch_id}&page.page={page_number}"
-        response = requests.request("GET", url, headers=self.headers)
-        response.raise_for_status()
+        return self._get(url).json()
 
-        return response.json()
+    async def aget_test_items_for_launch(self, launch_id: str, page_number: int):
+        url = f"{self.endpoint}/api/v1/{self.project}/item?filter.eq.launchId={launch_id}&page.page={page_number}"
+        return (await self._aget(url)).json()
 
     def get_logs_for_test_items(self, item_id: str, page_number: int):
         url = f"{self.endpoint}/api/v1/{self.project}/log?filter.eq.item={item_id}&page.page={page_number}"
-        response = requests.request("GET", url, headers=self.headers)
-        response.raise_for_status()
+        return self._get(url).json()
 
-        return response.json()
+    async def aget_logs_for_test_items(self, item_id: str, page_number: int):
+        url = f"{self.endpoint}/api/v1/{self.project}/log?filter.eq.item={item_id}&page.page={page_number}"
+        return (await self._aget(url)).json()
 
     def get_user_information(self, username: str):
-        url = f"{self.endpoint}/api/users/{username}"
-        response = requests.request("GET", url, headers=self.headers)
-        response.raise_for_status()
+        return self._get(f"{self.endpoint}/api/users/{username}").json()
 
-        return response.json()
+    async def aget_user_information(self, username: str):
+        return (await self._aget(f"{self.endpoint}/api/users/{username}")).json()
 
     def get_dashboard_data(self, dashboard_id: str):
-        url = f"{self.endpoint}/api/v1/{self.project}/dashboard/{dashboard_id}"
-        response = requests.request("GET", url, headers=self.headers)
-        response.raise_for_status()
+        return self._get(f"{self.endpoint}/api/v1/{self.project}/dashboard/{dashboard_id}").json()
 
-        return response.json()
+    async def aget_dashboard_data(self, dashboard_id: str):
+        return (await self._aget(f"{self.endpoint}/api/v1/{self.project}/dashboard/{dashboard_id}")).json()
@@ -1,13 +1,14 @@
 import logging
-from typing import Any, Optional
+from typing import Optional
 
 from langchain_core.tools import ToolException
 from office365.runtime.auth.client_credential import ClientCredential
 from office365.sharepoint.client_context import ClientContext
-from pydantic import create_model, model_validator, BaseModel
+from pydantic import create_model, model_validator
 from pydantic.fields import FieldInfo, PrivateAttr
 
 from .utils import read_docx_from_bytes
+from ..base.api_wrapper import BaseToolApiWrapper
 
 NoInput = create_model(
     "NoInput"
@@ -31,7 +32,7 @@ ReadDocument = create_model(
 )
 
 
-class SharepointApiWrapper(BaseModel):
+class SharepointApiWrapper(BaseToolApiWrapper):
     site_url: str
     client_id: str = None
     client_secret: str = None
@@ -165,10 +166,3 @@ class SharepointApiWrapper(BaseModel):
                 "ref": self.read_file
             }
         ]
-
-    def run(self, mode: str, *args: Any, **kwargs: Any):
-        for tool in self.get_available_tools():
-            if tool["name"] == mode:
-                return tool["ref"](*args, **kwargs)
-        else:
-            raise ValueError(f"Unknown mode: {mode}")
\ No newline at end of file
@@ -1,15 +1,20 @@
 import logging
-from typing import Optional, Any
+import os
+from typing import Optional
 
-from pydantic import BaseModel, create_model, model_validator
+from pydantic import create_model, model_validator
 from pydantic.fields import FieldInfo, PrivateAttr
 from sqlalchemy import create_engine, text, inspect, Engine
 from sqlalchemy.orm import sessionmaker
 
 from .models import SQLConfig, SQLDialect
+from ..base.api_wrapper import BaseToolApiWrapper
+from ..base.client_cache import get_cached_client
 
 logger = logging.getLogger(__name__)
 
+SQL_POOL_SIZE = int(os.getenv("ALITA_SQL_POOL_SIZE", "5"))
+
 ExecuteSQLModel = create_model(
     "ExecuteSQLModel",
     sql_query=(str, FieldInfo(description="The SQL query to execute."))
@@ -19,7 +24,7 @@ SQLNoInput = create_model(
     "ListTablesAndColumnsModel"
 )
 
-class SQLApiWrapper(BaseModel):
+class SQLApiWrapper(BaseToolApiWrapper):
     dialect: str
     host: str
     port: str
@@ -28,19 +33,18 @@ class SQLApiWrapper(BaseModel):
     database_name: str
     _client: Optional[Engine] = PrivateAttr()
 
-    @model_validator(mode='before')
-    @classmethod
-    def validate_toolkit(cls, values):
+    @model_validator(mode='after')
+    def validate_toolkit(self):
         for field in SQLConfig.model_fields:
-            if field not in values or not values[field]:
+            if not getattr(self, field, None):
                 raise ValueError(f"{field} is a required field and must be provided.")
 
-        dialect = values['dialect']
-        host = values['host']
-        username = values['username']
-        password = values['password']
-        database_name = values['database_name']
-        port = values['port']
+        dialect = self.dialect
+        host = self.host
+        username = self.username
+        password = self.password
+        database_name = self.database_name
+        port = self.port
 
         if dialect == SQLDialect.POSTGRES:
             connection_string = f'postgresql+psycopg2://{username}:{password}@{host}:{port}/{database_name}'
@@ -49,8 +53,12 @@ class SQLApiWrapper(BaseModel):
         else:
             raise ValueError(f"Unsupported database type. Supported types are: {[e.value for e in SQLDialect]}")
 
-        cls._client = create_engine(connection_string)
-        return values
+        # engines keep their own connection pool, so they are shared between wrappers with the same DSN
+        self._client = get_cached_client(
+            'sql', f'{dialect}://{host}:{port}/{database_name}', (username, password),
+            lambda: create_engine(connection_string, pool_size=SQL_POOL_SIZE, pool_pre_ping=True)
+        )
+        return self
 
     def execute_sql(self, sql_query: str):
         """Executes the provided SQL query on the configured database."""
@@ -109,10 +117,3 @@ class SQLApiWrapper(BaseModel):
                 "args_schema": SQLNoInput,
             }
         ]
-
-    def run(self, mode: str, *args: Any, **kwargs: Any):
-        for tool in self.get_available_tools():
-            if tool["name"] == mode:
-                return tool["ref"](*args, **kwargs)
-        else:
-            raise ValueError(f"Unknown mode: {mode}")
\ No newline at end of file
@@ -1,23 +1,25 @@
-from typing import Any, Optional, List
+from typing import Optional, List
 
-from pydantic import BaseModel, model_validator, create_model
+from pydantic import model_validator, create_model
 from pydantic.fields import FieldInfo, PrivateAttr
 
 from .testio_client import TestIOClient
+from ..base.api_wrapper import BaseToolApiWrapper
+from ..base.client_cache import get_cached_client
 
 
-class TestIOApiWrapper(BaseModel):
+class TestIOApiWrapper(BaseToolApiWrapper):
     endpoint: str
     api_key: str
     _client: Optional[TestIOClient] = PrivateAttr()
 
-    @model_validator(mode='before')
-    @classmethod
-    def validate_toolkit(cls, values):
-        endpoint = values.get('endpoint')
-        api_key = values.get('api_key')
-        cls._client = TestIOClient(endpoint=endpoint, api_key=api_key)
-        return values
+    @model_validator(mode='after')
+    def validate_toolkit(self):
+        self._client = get_cached_client(
+            'testio', self.endpoint, (self.api_key,),
+            lambda: TestIOClient(endpoint=self.endpoint, api_key=self.api_key)
+        )
+        return self
 
     def get_test_cases_for_test(self, product_id: int, test_case_test_id: int) -> str:
         """
@@ -26,6 +28,9 @@ class TestIOApiWrapper(BaseModel):
         """
         return self._client.get_test_cases_for_test(product_id, test_case_test_id)
 
+    async def aget_test_cases_for_test(self, product_id: int, test_case_test_id: int) -> str:
+        return await self._client.aget_test_cases_for_test(product_id, test_case_test_id)
+
     def get_test_cases_statuses_for_test(self, product_id: int, test_case_test_id: int) -> dict:
         """
         Fetch information regarding statuses of executed test cases within a particular launch (test),
@@ -33,6 +38,9 @@ class TestIOApiWrapper(BaseModel):
         """
         return self._client.get_test_cases_statuses_for_test(product_id, test_case_test_id)
 
+    async def aget_test_cases_statuses_for_test(self, product_id: int, test_case_test_id: int) -> dict:
+        return await self._client.aget_test_cases_statuses_for_test(product_id, test_case_test_id)
+
     def list_bugs_for_test_with_filter(self, filter_product_ids: Optional[str] = None,
                                        filter_test_cycle_ids: Optional[str] = None) -> List[dict]:
         """
@@ -41,6 +49,10 @@ class TestIOApiWrapper(BaseModel):
         """
         return self._client.list_bugs_for_test_with_filter(filter_product_ids, filter_test_cycle_ids)
 
+    async def alist_bugs_for_test_with_filter(self, filter_product_ids: Optional[str] = None,
+                                              filter_test_cycle_ids: Optional[str] = None) -> List[dict]:
+        return await self._client.alist_bugs_for_test_with_filter(filter_product_ids, filter_test_cycle_ids)
+
     def get_available_tools(self):
         return [
             {
@@ -74,10 +86,3 @@ class TestIOApiWrapper(BaseModel):
                 "ref": self.list_bugs_for_test_with_filter,
             }
         ]
-
-    def run(self, mode: str, *args: Any, **kwargs: Any):
-        for tool in self.get_available_tools():
-            if tool["name"] == mode:
-                return tool["ref"](*args, **kwargs)
-        else:
-            raise ValueError(f"Unknown mode: {mode}")
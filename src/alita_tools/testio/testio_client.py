@@ -1,7 +1,10 @@
 from typing import Optional, List
 
+import httpx
 import requests
 
+from ..base.client_cache import LoopBoundAsyncClient, pooled_session
+
 
 class TestIOClient:
     def __init__(self, endpoint: str, api_key: str):
@@ -11,34 +14,57 @@ class TestIOClient:
             "Accept": "application/json",
             "Authorization": f"Bearer {self.api_key}"
         }
+        self._session = pooled_session()
+        self._async_client = LoopBoundAsyncClient(headers=self.headers)
 
-    def _handle_response(self, response: requests.Response):
+    def _handle_response(self, response: requests.Response | httpx.Response):
         if response.status_code == 401:
             raise ValueError("Unauthorized: Invalid API key")
         elif response.status_code == 404:
             raise ValueError("Not Found: The requested resource does not exist")
         response.raise_for_status()
 
-    def get_test_cases_for_test(self, product_id: int, test_case_test_id: int) -> str:
-        url = f"{self.endpoint}/customer/v2/products/{product_id}/test_case_tests/{test_case_test_id}"
-        response = requests.get(url, headers=self.headers)
+    def _get(self, url: str, params: Optional[dict] = None) -> requests.Response:
+        response = self._session.get(url, headers=self.headers, params=params)
         self._handle_response(response)
-        return response.text
+        return response
 
-    def get_test_cases_statuses_for_test(self, product_id: int, test_case_test_id: int) -> dict:
-        url = f"{self.endpoint}/customer/v2/products/{product_id}/test_case_tests/{test_case_test_id}/results"
-        response = requests.get(url, headers=self.headers)
+    async def _aget(self, url: str, params: Optional[dict] = None) -> httpx.Response:
+        response = await self._async_client.get().get(url, params=params)
         self._handle_response(response)
-        return response.json()
+        return response
 
-    def list_bugs_for_test_with_filter(self, filter_product_ids: Optional[str] = None,
-                                       filter_test_cycle_ids: Optional[str] = None) -> List[dict]:
-        url = f"{self.endpoint}/customer/v2/bugs"
+    @staticmethod
+    def _bugs_filter(filter_product_ids: Optional[str] = None, filter_test_cycle_ids: Optional[str] = None) -> dict:
         params = {}
         if filter_product_ids:
             params["filter_product_ids"] = filter_product_ids
         if filter_test_cycle_ids:
             params["filter_test_cycle_ids"] = filter_test_cycle_ids
-        response = requests.get(url, headers=self.headers, params=params)
-        self._handle_response(response)
-        return response.json()
+        return params
+
+    def get_test_cases_for_test(self, product_id: int, test_case_test_id: int) -> str:
+        url = f"{self.endpoint}/customer/v2/products/{product_id}/test_case_tests/{test_case_test_id}"
+        return self._get(url).text
+
+    async def aget_test_cases_for_test(self, product_id: int, test_case_test_id: int) -> str:
+        url = f"{self.endpoint}/customer/v2/products/{product_id}/test_case_tests/{test_case_test_id}"
+        return (await self._aget(url)).text
+
+    def get_test_cases_statuses_for_test(self, product_id: int, test_case_test_id: int) -> dict:
+        url = f"{self.endpoint}/customer/v2/products/{product_id}/test_case_tests/{test_case_test_id}/results"
+        return self._get(url).json()
+
+    async def aget_test_cases_statuses_for_test(self, product_id: int, test_case_test_id: int) -> dict:
+        url = f"{self.endpoint}/customer/v2/products/{product_id}/test_case_tests/{test_case_test_id}/results"
+        return (await self._aget(url)).json()
+
+    def list_bugs_for_test_with_filter(self, filter_product_ids: Optional[str] = None,
+                                       filter_test_cycle_ids: Optional[str] = None) -> List[dict]:
+        url = f"{self.endpoint}/customer/v2/bugs"
+        return self._get(url, params=self._bugs_filter(filter_product_ids, filter_test_cycle_ids)).json()
+
+    async def alist_bugs_for_test_with_filter(self, filter_product_ids: Optional[str] = None,
+                                              filter_test_cycle_ids: Optional[str] = None) -> List[dict]:
+        url = f"{self.endpoint}/customer/v2/bugs"
+        return (await self._aget(url, params=self._bugs_filter(filter_product_ids, filter_test_cycle_ids))).json()
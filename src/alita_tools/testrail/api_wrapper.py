@@ -1,13 +1,14 @@
 import json
 import logging
-from typing import Optional, Any
+from typing import Optional
 
 from testrail_api import TestRailAPI
-from pydantic import model_validator, BaseModel
+from pydantic import model_validator
 from langchain_core.tools import ToolException
 from pydantic import create_model
 from pydantic.fields import FieldInfo, PrivateAttr
 from testrail_api import StatusCodeError
+from ..base.api_wrapper import BaseToolApiWrapper
 
 logger = logging.getLogger(__name__)
 
@@ -36,7 +37,7 @@ addCase = create_model(
 )
 
 
-class TestrailAPIWrapper(BaseModel):
+class TestrailAPIWrapper(BaseToolApiWrapper):
     url: str
     password: Optional[str] = None,
     email: Optional[str] = None,
@@ -125,10 +126,3 @@ class TestrailAPIWrapper(BaseModel):
                 "args_schema": addCase,
             }
         ]
-
-    def run(self, mode: str, *args: Any, **kwargs: Any):
-        for tool in self.get_available_tools():
-            if tool["name"] == mode:
-                return tool["ref"](*args, **kwargs)
-        else:
-            raise ValueError(f"Unknown mode: {mode}")
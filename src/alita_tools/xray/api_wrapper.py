@@ -2,11 +2,12 @@ import logging
 from typing import Optional, Any, List
 
 import requests
-from pydantic import model_validator, BaseModel
+from pydantic import model_validator
 from langchain_core.tools import ToolException
 from pydantic import create_model, PrivateAttr
 from pydantic.fields import FieldInfo
 from python_graphql_client import GraphqlClient
+from ..base.api_wrapper import BaseToolApiWrapper
 
 logger = logging.getLogger(__name__)
 
@@ -93,7 +94,7 @@ def _parse_tests(test_results) -> List[Any]:
     return test_results
 
 
-class XrayApiWrapper(BaseModel):
+class XrayApiWrapper(BaseToolApiWrapper):
     _default_base_url: str = 'https://xray.cloud.getxray.app'
     base_url: str = ""
     client_id: str = None,
@@ -200,10 +201,3 @@ class XrayApiWrapper(BaseModel):
                 "ref": self.execute_graphql,
             }
         ]
-
-    def run(self, mode: str, *args: Any, **kwargs: Any):
-        for tool in self.get_available_tools():
-            if tool["name"] == mode:
-                return tool["ref"](*args, **kwargs)
-        else:
-            raise ValueError(f"Unknown mode: {mode}")
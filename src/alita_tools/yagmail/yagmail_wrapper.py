@@ -1,9 +1,10 @@
 import logging
-from typing import List, Any, Optional
-from pydantic import model_validator, BaseModel
+from typing import List, Optional
+from pydantic import model_validator
 from pydantic import create_model
 from pydantic.fields import FieldInfo
 import yagmail
+from ..base.api_wrapper import BaseToolApiWrapper
 
 logger = logging.getLogger(__name__)
 
@@ -22,7 +23,7 @@ SendEmail = create_model(
     cc=(List[str], FieldInfo(description="Persons who you are going to share a copy of email to."))
 )
 
-class YagmailWrapper(BaseModel):
+class YagmailWrapper(BaseToolApiWrapper):
     username: str
     password: str
     host: Optional[str] = SMTP_SERVER
@@ -56,10 +57,3 @@ class YagmailWrapper(BaseModel):
                 "ref": self.send_gmail_message,
             }
         ]
-
-    def run(self, mode: str, *args: Any, **kwargs: Any):
-        for tool in self.get_available_tools():
-            if tool["name"] == mode:
-                return tool["ref"](*args, **kwargs)
-        else:
-            raise ValueError(f"Unknown mode: {mode}")
\ No newline at end of file
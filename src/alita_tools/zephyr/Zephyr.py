@@ -32,6 +32,10 @@ class Zephyr(object):
         relative_path = f"/teststep/{issue_id}?projectId={project_id}"
         return self.request_client.request(method='GET', path=relative_path)
 
+    async def aget_test_case_steps(self, issue_id, project_id):
+        relative_path = f"/teststep/{issue_id}?projectId={project_id}"
+        return await self.request_client.arequest(method='GET', path=relative_path)
+
     def add_new_test_case_step(self, issue_id, project_id, step: str, data: str, result: str):
         """
         Adds new step for a test case
@@ -46,3 +50,12 @@ class Zephyr(object):
             "result": result
         }
         return self.request_client.request(method='POST', path=relative_path, json=body)
+
+    async def aadd_new_test_case_step(self, issue_id, project_id, step: str, data: str, result: str):
+        relative_path = f"/teststep/{issue_id}?projectId={project_id}"
+        body = {
+            "step": step,
+            "data": data,
+            "result": result
+        }
+        return await self.request_client.arequest(method='POST', path=relative_path, json=body)
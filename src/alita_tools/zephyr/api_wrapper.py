@@ -1,11 +1,13 @@
-from typing import List, Any, Optional
-from pydantic import model_validator, BaseModel
+from typing import List, Optional
+from pydantic import model_validator
 import json
 import logging
 from pydantic import create_model
 from pydantic.fields import FieldInfo, PrivateAttr
 
 from .Zephyr import Zephyr
+from ..base.api_wrapper import BaseToolApiWrapper
+from ..base.client_cache import get_cached_client
 
 logger = logging.getLogger(__name__)
 
@@ -32,22 +34,19 @@ ZephyrAddTestCase = create_model(
     steps_data=(str, FieldInfo(description="""JSON list of steps need to be added to Jira ticket in format { "steps":[ { "step":"click something", "data":"expected data", "result":"expected result" }, { "step":"click something2", "data":"expected data2", "result":"expected result" } ] }"""))
 )
 
-class ZephyrV1ApiWrapper(BaseModel):
+class ZephyrV1ApiWrapper(BaseToolApiWrapper):
     base_url: str
     username: str
     password: str
     _client: Optional[Zephyr] = PrivateAttr()
 
-    @model_validator(mode='before')
-    @classmethod
-    def validate_toolkit(cls, values):
-        base_url = values['base_url']
-        username = values['username']
-        password = values['password']
-        cls._client = Zephyr(base_url=base_url,
-                                  username=username,
-                                  password=password)
-        return values
+    @model_validator(mode='after')
+    def validate_toolkit(self):
+        self._client = get_cached_client(
+            'zephyr', self.base_url, (self.username, self.password),
+            lambda: Zephyr(base_url=self.base_url, username=self.username, password=self.password)
+        )
+        return self
 
     def _parse_test_steps(self, test_steps) -> List[dict]:
         parsed = []
@@ -74,11 +73,21 @@ class ZephyrV1ApiWrapper(BaseModel):
             return "No Zephyr test steps found"
         return "Found " + str(len(parsed)) + " test steps:\n" + str(parsed)
 
+    async def aget_test_case_steps(self, issue_id: int, project_id: int):
+        parsed = self._parse_test_steps((await self._client.aget_test_case_steps(issue_id, project_id)).json())
+        if len(parsed) == 0:
+            return "No Zephyr test steps found"
+        return "Found " + str(len(parsed)) + " test steps:\n" + str(parsed)
+
     def add_new_test_case_step(self, issue_id: int, project_id: int, step: str, data: str, result: str):
         """ Adds new test case step by issue_id."""
         return "New test step created: " + self._client.add_new_test_case_step(issue_id, project_id, step, data,
                                                                               result).text
 
+    async def aadd_new_test_case_step(self, issue_id: int, project_id: int, step: str, data: str, result: str):
+        response = await self._client.aadd_new_test_case_step(issue_id, project_id, step, data, result)
+        return "New test step created: " + response.text
+
     def add_test_case(self, issue_id: int, project_id: int, steps_data: str):
         """ Adds test case's steps to corresponding jira ticket"""
         logger.info(f"Issue id: {issue_id}, project_id: {project_id}, Steps: {steps_data}")
@@ -89,12 +98,16 @@ class ZephyrV1ApiWrapper(BaseModel):
                                         data=step["data"], result=step["result"])
         return f"Done. Test issue was update with steps: {steps}"
 
-    def run(self, mode: str, *args: Any, **kwargs: Any):
-        for tool in self.get_available_tools():
-            if tool["name"] == mode:
-                return tool["ref"](*args, **kwargs)
-        else:
-            raise ValueError(f"Unknown mode: {mode}")
+    async def aadd_test_case(self, issue_id: int, project_id: int, steps_data: str):
+        logger.info(f"Issue id: {issue_id}, project_id: {project_id}, Steps: {steps_data}")
+        steps = json.loads(steps_data)
+        # steps are added one by one to keep their order in the test case
+        for step in steps["steps"]:
+            logger.info(f"Addition step: {step}")
+            await self.aadd_new_test_case_step(issue_id=issue_id, project_id=project_id, step=step["step"],
+                                               data=step["data"], result=step["result"])
+        return f"Done. Test issue was update with steps: {steps}"
+
 
     def get_available_tools(self):
         return [
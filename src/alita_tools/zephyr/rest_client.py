@@ -5,7 +5,6 @@ import time
 from json import dumps
 from urllib.parse import urlencode
 
-import requests
 
 try:
     from oauthlib.oauth1.rfc5849 import SIGNATURE_RSA_SHA512 as SIGNATURE_RSA
@@ -15,6 +14,8 @@ from requests import HTTPError
 
 from atlassian.request_utils import get_default_logger
 
+from ..base.client_cache import LoopBoundAsyncClient, pooled_session
+
 log = get_default_logger(__name__)
 
 
@@ -39,6 +40,8 @@ class ZephyrRestAPI(object):
         self.user_name = user_name
         self.password = password
         self.timeout = int(timeout)
+        self._session = pooled_session()
+        self._async_client = LoopBoundAsyncClient(timeout=self.timeout)
         self._create_token_session()
 
     def __enter__(self):
@@ -106,6 +109,20 @@ class ZephyrRestAPI(object):
                             trailing=None,
                             absolute=False)
 
+    def _build_url(self, path, params=None, flags=None, trailing=None, absolute=False):
+        url = self.url_joiner(None if absolute else self.base_url, path, trailing)
+        params_already_in_url = True if "?" in url else False
+        if params or flags:
+            if params_already_in_url:
+                url += "&"
+            else:
+                url += "?"
+        if params:
+            url += urlencode(params or {})
+        if flags:
+            url += ("&" if params or params_already_in_url else "") + "&".join(flags or [])
+        return url
+
     def request(
         self,
         method="GET",
@@ -133,21 +150,11 @@ class ZephyrRestAPI(object):
         :param advanced_mode: bool, OPTIONAL: Return the raw response
         :return:
         """
-        url = self.url_joiner(None if absolute else self.base_url, path, trailing)
-        params_already_in_url = True if "?" in url else False
-        if params or flags:
-            if params_already_in_url:
-                url += "&"
-            else:
-                url += "?"
-        if params:
-            url += urlencode(params or {})
-        if flags:
-            url += ("&" if params or params_already_in_url else "") + "&".join(flags or [])
+        url = self._build_url(path, params=params, flags=flags, trailing=trailing, absolute=absolute)
         if files is None:
             data = None if not data else dumps(data)
         headers = headers or self.headers
-        response = requests.Session().request(
+        response = self._session.request(
             method=method,
             url=url,
             headers=headers,
@@ -164,6 +171,41 @@ class ZephyrRestAPI(object):
         self.raise_for_status(response)
         return response
 
+    async def arequest(
+        self,
+        method="GET",
+        path="/",
+        data=None,
+        json=None,
+        flags=None,
+        params=None,
+        headers=None,
+        files=None,
+        trailing=None,
+        absolute=False,
+    ):
+        """
+        Async counterpart of `request` sharing its arguments, sent through a pooled httpx client.
+        """
+        url = self._build_url(path, params=params, flags=flags, trailing=trailing, absolute=absolute)
+        if files is None:
+            data = None if not data else dumps(data)
+        response = await self._async_client.get().request(
+            method=method,
+            url=url,
+            headers=headers or self.headers,
+            content=data,
+            json=json,
+            files=files,
+        )
+        response.encoding = "utf-8"
+
+        log.debug("HTTP: %s %s -> %s %s", method, path, response.status_code, response.reason_phrase)
+        log.debug("HTTP: Response text -> %s", response.text)
+
+        self.raise_for_status(response)
+        return response
+
     def raise_for_status(self, response):
         """
         Checks the response for errors and throws an exception if return code >= 400